@@ -22,142 +22,23 @@ auth.check_auth()
 
 # Imports (sadece giriş yapılmışsa buraya gelir)
 from services.firebase_service import get_app_stats, get_words
-from utils.helpers import init_session_state, create_word_card_css
+from utils.helpers import init_session_state
+from utils.theme import inject_styles
 from utils.constants import UI, EXAM_TYPES
 
 # Session state başlat
 init_session_state()
 
-# İlk çalıştırmada başlangıç kelimelerini yükle
-if "initial_words_loaded" not in st.session_state:
-    st.session_state.initial_words_loaded = True
-    from services.firebase_service import initialize_words_from_json, get_words
-    
-    # Kelime var mı kontrol et
-    existing_words = get_words(status="approved", limit=1)
-    if not existing_words:
-        # Kelime yoksa JSON'dan yükle
-        import os
-        json_path = os.path.join(os.path.dirname(__file__), "data", "initial_words.json")
-        if os.path.exists(json_path):
-            loaded_count = initialize_words_from_json(json_path)
-            if loaded_count > 0:
-                st.toast(f"✅ {loaded_count} başlangıç kelimesi yüklendi!", icon="📚")
+# Başlangıç kelimelerini yükle (süreç başına tek seferlik kontrol)
+from services.firebase_service import ensure_initial_words
+
+seed_status = ensure_initial_words()
+if seed_status["loaded"] > 0 and not seed_status["announced"]:
+    seed_status["announced"] = True
+    st.toast(f"✅ {seed_status['loaded']} başlangıç kelimesi yüklendi!", icon="📚")
 
 # Custom CSS
-st.markdown("""
-<style>
-/* Ana tema */
-.main-header {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    padding: 40px;
-    border-radius: 20px;
-    color: white;
-    text-align: center;
-    margin-bottom: 30px;
-}
-
-.main-title {
-    font-size: 48px;
-    font-weight: 700;
-    margin-bottom: 10px;
-}
-
-.main-subtitle {
-    font-size: 18px;
-    opacity: 0.9;
-}
-
-/* Feature kartları */
-.feature-card {
-    background: linear-gradient(135deg, #1a1f2e 0%, #2d3748 100%);
-    border: 1px solid rgba(102, 126, 234, 0.3);
-    border-radius: 16px;
-    padding: 25px;
-    height: 100%;
-    transition: all 0.3s ease;
-}
-
-.feature-card:hover {
-    border-color: #667eea;
-    transform: translateY(-5px);
-}
-
-.feature-icon {
-    font-size: 40px;
-    margin-bottom: 15px;
-}
-
-.feature-title {
-    font-size: 20px;
-    font-weight: 600;
-    color: #fff;
-    margin-bottom: 10px;
-}
-
-.feature-desc {
-    font-size: 14px;
-    color: #a0aec0;
-    line-height: 1.5;
-}
-
-/* Stats */
-.stat-card {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    border-radius: 16px;
-    padding: 25px;
-    text-align: center;
-    color: white;
-}
-
-.stat-value {
-    font-size: 36px;
-    font-weight: 700;
-}
-
-.stat-label {
-    font-size: 14px;
-    opacity: 0.9;
-    margin-top: 5px;
-}
-
-/* CTA Button */
-.cta-button {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    padding: 15px 40px;
-    border-radius: 30px;
-    font-size: 18px;
-    font-weight: 600;
-    text-decoration: none;
-    display: inline-block;
-    transition: all 0.3s ease;
-    border: none;
-    cursor: pointer;
-}
-
-.cta-button:hover {
-    transform: scale(1.05);
-    box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
-}
-
-/* Exam badges */
-.exam-badges {
-    display: flex;
-    justify-content: center;
-    gap: 15px;
-    flex-wrap: wrap;
-    margin: 20px 0;
-}
-
-.exam-badge {
-    background: rgba(102, 126, 234, 0.2);
-    padding: 10px 20px;
-    border-radius: 25px;
-    font-size: 14px;
-}
-</style>
-""", unsafe_allow_html=True)
+inject_styles("home")
 
 # Ana başlık
 st.markdown("""
@@ -5,9 +5,11 @@ Simple Firebase Email/Password Login Gate Pattern
 
 import streamlit as st
 from typing import Optional, Dict, Any
-import hashlib
 import time
 
+from utils.startup_timing import mark_first_paint
+from utils.theme import inject_styles, start_style_run
+
 
 def _init_auth_state():
     """Auth session state'lerini başlat"""
@@ -21,40 +23,17 @@ def _init_auth_state():
 
 def _render_login_form():
     """Şık login/register formu render et"""
-    st.markdown("""
-    <style>
-    .login-container {
-        max-width: 450px;
-        margin: 50px auto;
-        padding: 40px;
-        background: linear-gradient(135deg, #1a1f2e 0%, #2d3748 100%);
-        border-radius: 20px;
-        border: 1px solid rgba(102, 126, 234, 0.3);
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-    }
-    .login-header {
-        text-align: center;
-        margin-bottom: 30px;
-    }
-    .login-title {
-        font-size: 32px;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 8px;
-    }
-    .login-subtitle {
-        color: #a0aec0;
-        font-size: 14px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_styles("login")
     
     # Ortalanmış container
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
+        # Önceki sayfadan gelen bilgilendirme (örn: şifre değişikliği)
+        notice = st.session_state.pop("auth_notice", None)
+        if notice:
+            st.success(notice)
+        
         st.markdown("""
         <div class="login-header">
             <div class="login-title">🎓 Lingua-AI</div>
@@ -144,7 +123,8 @@ def _render_login_form():
 def _process_login(email: str, password: str) -> bool:
     """Login işlemini gerçekleştir"""
     from services.firebase_service import authenticate_user, is_user_admin
-    from services.gamification_service import update_user_streak
+    from services.gamification_service import run_post_login_updates
+    from services.task_service import submit_task
     
     # Validasyon
     if not email or not password:
@@ -171,17 +151,36 @@ def _process_login(email: str, password: str) -> bool:
     st.session_state.user = user_data
     st.session_state.is_admin = is_user_admin(email)
     
-    # Streak güncelle
-    try:
-        update_user_streak(user_data["id"])
-    except:
-        pass
+    # Streak, puan ve rozet güncellemeleri arka planda çalışır;
+    # sonuç bir sonraki rerun'da _collect_post_login_result ile gösterilir
+    st.session_state.post_login_future = submit_task(run_post_login_updates, user_data["id"])
     
-    st.success("✅ Giriş başarılı!")
-    time.sleep(0.3)
     return True
 
 
+def _collect_post_login_result():
+    """Arka plandaki giriş sonrası güncellemeler bittiyse sonucu göster"""
+    from services.task_service import pop_finished_task
+    
+    result = pop_finished_task("post_login_future")
+    if not result or not result.get("success"):
+        return
+    
+    # Session'daki kullanıcı verisini güncelle
+    fresh_user = result.get("user")
+    if fresh_user:
+        st.session_state.user = fresh_user
+    
+    if result.get("points_earned", 0) > 0:
+        st.toast(f"🔥 {result.get('streak', 1)} günlük streak! +{result['points_earned']} puan", icon="⭐")
+    
+    from utils.constants import BADGES
+    for badge_id in result.get("new_badges", []):
+        badge = BADGES.get(badge_id)
+        if badge:
+            st.toast(f"Yeni rozet: {badge['emoji']} {badge['name']}", icon="🎉")
+
+
 def _process_register(name: str, email: str, password: str, password2: str) -> bool:
     """Kayıt işlemini gerçekleştir"""
     from services.firebase_service import signup_user
@@ -283,9 +282,16 @@ def render_user_sidebar(key: str = None):
 
 def logout():
     """Kullanıcı çıkışı - session temizle"""
+    user = st.session_state.get("user")
+    if user and user.get("id"):
+        # Oturum sonu: tampondaki puan/istatistikleri yaz
+        from services.gamification_service import flush_user_stats
+        flush_user_stats(user["id"])
+    
     st.session_state.authenticated = False
     st.session_state.user = None
     st.session_state.is_admin = False
+    st.session_state.pop("post_login_future", None)
 
 
 def check_auth(require_login: bool = True) -> bool:
@@ -306,16 +312,21 @@ def check_auth(require_login: bool = True) -> bool:
     Not: require_login=True ise ve kullanıcı giriş yapmamışsa,
          login formu gösterilir ve st.stop() çağrılır.
     """
+    run_started_at = time.perf_counter()
     _init_auth_state()
+    start_style_run()
     
     # DURUM A: Kullanıcı giriş yapmış
     if st.session_state.authenticated:
+        _collect_post_login_result()
         _render_user_sidebar()
+        mark_first_paint("user_sidebar", run_started_at)
         return True
     
     # DURUM B: Kullanıcı giriş yapmamış
     if require_login:
         _render_login_form()
+        mark_first_paint("login_form", run_started_at)
         st.stop()  # Sayfa içeriği gösterilmez
     
     return False
@@ -6,113 +6,7 @@ Badge display and progress tracking
 import streamlit as st
 from typing import Dict, Any, List
 
-
-def get_badge_styles() -> str:
-    """Badge için CSS stilleri"""
-    return """
-    <style>
-    .badges-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-        gap: 16px;
-        margin: 20px 0;
-    }
-    
-    .badge-card {
-        background: linear-gradient(135deg, #1a1f2e 0%, #2d3748 100%);
-        border: 2px solid rgba(102, 126, 234, 0.3);
-        border-radius: 16px;
-        padding: 20px;
-        text-align: center;
-        transition: all 0.3s ease;
-    }
-    
-    .badge-card:hover {
-        border-color: #667eea;
-        transform: translateY(-3px);
-    }
-    
-    .badge-card.earned {
-        border-color: #667eea;
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.2) 0%, rgba(118, 75, 162, 0.2) 100%);
-    }
-    
-    .badge-card.locked {
-        opacity: 0.5;
-        filter: grayscale(50%);
-    }
-    
-    .badge-emoji {
-        font-size: 48px;
-        margin-bottom: 12px;
-    }
-    
-    .badge-name {
-        font-size: 16px;
-        font-weight: 600;
-        color: #fff;
-        margin-bottom: 8px;
-    }
-    
-    .badge-description {
-        font-size: 12px;
-        color: #a0aec0;
-        line-height: 1.4;
-    }
-    
-    .badge-progress {
-        margin-top: 12px;
-        background: rgba(255,255,255,0.1);
-        border-radius: 10px;
-        height: 6px;
-        overflow: hidden;
-    }
-    
-    .badge-progress-bar {
-        height: 100%;
-        background: linear-gradient(90deg, #667eea, #764ba2);
-        border-radius: 10px;
-        transition: width 0.5s ease;
-    }
-    
-    .badge-progress-text {
-        font-size: 11px;
-        color: #667eea;
-        margin-top: 6px;
-    }
-    
-    /* Rozet vitrin */
-    .badge-showcase {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 8px;
-        justify-content: center;
-    }
-    
-    .badge-showcase-item {
-        font-size: 32px;
-        padding: 8px;
-        background: rgba(102, 126, 234, 0.1);
-        border-radius: 12px;
-        transition: transform 0.2s ease;
-    }
-    
-    .badge-showcase-item:hover {
-        transform: scale(1.2);
-    }
-    
-    /* Mini rozet */
-    .badge-mini {
-        display: inline-flex;
-        align-items: center;
-        gap: 4px;
-        background: rgba(102, 126, 234, 0.2);
-        padding: 4px 10px;
-        border-radius: 20px;
-        font-size: 13px;
-    }
-    </style>
-    """
+from utils.theme import inject_styles
 
 
 def render_badge_card(badge: Dict[str, Any], is_earned: bool = False, progress: float = 0, current_value: int = 0):
@@ -157,7 +51,7 @@ def render_badges_grid(user_data: Dict[str, Any]):
     """
     from services.gamification_service import get_user_badge_progress
     
-    st.markdown(get_badge_styles(), unsafe_allow_html=True)
+    inject_styles("badges")
     
     badge_progress = get_user_badge_progress(user_data)
     
@@ -184,7 +78,7 @@ def render_badge_showcase(badges: List[str], max_display: int = 8):
     """
     from utils.constants import BADGES
     
-    st.markdown(get_badge_styles(), unsafe_allow_html=True)
+    inject_styles("badges")
     
     if not badges:
         st.info("Henüz rozet kazanılmadı. Kelime ekleyerek ve quiz çözerek rozet kazanabilirsiniz!")
@@ -4,131 +4,10 @@ Word card display with flip animation
 """
 
 import streamlit as st
+from html import escape
 from typing import Dict, Any, Optional, List
 
-
-def get_flashcard_styles() -> str:
-    """Flashcard için CSS stilleri"""
-    return """
-    <style>
-    .flashcard-container {
-        perspective: 1000px;
-        margin: 20px 0;
-    }
-    
-    .flashcard {
-        position: relative;
-        width: 100%;
-        min-height: 280px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 20px;
-        padding: 30px;
-        color: white;
-        box-shadow: 0 15px 35px rgba(102, 126, 234, 0.3);
-        transition: transform 0.4s ease, box-shadow 0.4s ease;
-    }
-    
-    .flashcard:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 45px rgba(102, 126, 234, 0.4);
-    }
-    
-    .flashcard-english {
-        font-size: 32px;
-        font-weight: 700;
-        margin-bottom: 8px;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    .flashcard-pronunciation {
-        font-size: 16px;
-        opacity: 0.85;
-        font-style: italic;
-        margin-bottom: 16px;
-    }
-    
-    .flashcard-turkish {
-        font-size: 24px;
-        font-weight: 500;
-        margin-bottom: 20px;
-        padding: 12px 20px;
-        background: rgba(255,255,255,0.15);
-        border-radius: 12px;
-        display: inline-block;
-    }
-    
-    .flashcard-meta {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 10px;
-        margin-top: 20px;
-    }
-    
-    .flashcard-badge {
-        background: rgba(255,255,255,0.2);
-        padding: 6px 14px;
-        border-radius: 20px;
-        font-size: 13px;
-        backdrop-filter: blur(5px);
-    }
-    
-    .flashcard-type {
-        background: rgba(255,255,255,0.25);
-        padding: 6px 14px;
-        border-radius: 20px;
-        font-size: 13px;
-        font-weight: 600;
-    }
-    
-    .flashcard-synonyms {
-        margin-top: 16px;
-        padding-top: 16px;
-        border-top: 1px solid rgba(255,255,255,0.2);
-    }
-    
-    .flashcard-example {
-        margin-top: 16px;
-        padding: 16px;
-        background: rgba(0,0,0,0.15);
-        border-radius: 12px;
-        font-style: italic;
-        line-height: 1.5;
-    }
-    
-    .difficulty-stars {
-        color: #ffd700;
-        font-size: 16px;
-        letter-spacing: 2px;
-    }
-    
-    /* Mini card stili */
-    .mini-card {
-        background: linear-gradient(135deg, #1a1f2e 0%, #2d3748 100%);
-        border: 1px solid #667eea;
-        border-radius: 12px;
-        padding: 16px;
-        margin: 8px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .mini-card:hover {
-        border-color: #764ba2;
-        transform: scale(1.02);
-    }
-    
-    .mini-card-english {
-        font-size: 18px;
-        font-weight: 600;
-        color: #667eea;
-    }
-    
-    .mini-card-turkish {
-        font-size: 14px;
-        color: #a0aec0;
-        margin-top: 4px;
-    }
-    </style>
-    """
+from utils.theme import inject_styles
 
 
 def render_flashcard(word: Dict[str, Any], show_example: bool = True, show_ai_button: bool = True):
@@ -180,13 +59,27 @@ def render_flashcard(word: Dict[str, Any], show_example: bool = True, show_ai_bu
     if synonyms:
         st.markdown(f"📎 **Eş anlamlılar:** {', '.join(synonyms)}")
     
+    # İlgili trick'ler
+    from services.trick_catalog_service import get_trick_catalog
+    
+    related_tricks = get_trick_catalog().tricks_for_word(word.get("english", ""))
+    if related_tricks:
+        # Kart expander içinde de kullanıldığı için iç içe expander yok
+        titles = ", ".join(f"**{t['title']}** (🏷️ {t['tag']})" for t in related_tricks)
+        st.markdown(f"🧠 **İlgili Trick'ler:** {titles}")
+    
     # Örnek cümle
     example = word.get("exampleSentence", "")
     if show_example and example:
         st.info(f"💡 **Örnek:** {example}")
     
+    # Onayda üretilmiş AI içeriği (varsa butonlara gerek yok)
+    enrichment = word.get("enrichment")
+    if enrichment:
+        render_enrichment(enrichment)
+    
     # AI Cümle butonu
-    if show_ai_button:
+    if show_ai_button and not enrichment:
         col1, col2 = st.columns([1, 1])
         
         with col1:
@@ -198,20 +91,111 @@ def render_flashcard(word: Dict[str, Any], show_example: bool = True, show_ai_bu
                 generate_memory_hint(word)
 
 
+def render_enrichment(enrichment: Dict[str, Any]):
+    """Kelime onaylanırken üretilen AI içeriğini göster (LLM çağrısı yok)"""
+    sentence = enrichment.get("sentence", "")
+    if sentence:
+        st.markdown(f"""
+        <div style="background: rgba(102, 126, 234, 0.1); border-left: 4px solid #667eea; padding: 15px; border-radius: 8px; margin: 10px 0;">
+            <div style="font-size: 15px; color: #e0e0e0; font-style: italic;">🇬🇧 {escape(sentence)}</div>
+            <div style="font-size: 14px; color: #a0aec0; margin-top: 8px;">🇹🇷 {escape(enrichment.get('translation', ''))}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    explanation = enrichment.get("explanation", "")
+    if explanation:
+        st.markdown(f"📖 **Açıklama:** {explanation}")
+    
+    hint = enrichment.get("hint", "")
+    if hint:
+        st.markdown(f"💡 **Hatırlama İpucu:** {hint}")
+
+
+def _set_card_index(index: int):
+    """Kart navigasyon butonlarının on_click callback'i"""
+    st.session_state.current_word_index = index
+
+
+@st.fragment
+def render_flashcard_viewer(words: List[Dict[str, Any]]):
+    """
+    Tek kart görünümü (navigasyon + kart)
+    
+    Fragment olarak çalışır: ilk/önceki/sonraki/son/rastgele butonları
+    sadece kartı yeniden çizer; sayfanın filtreleri, kelime sorgusu ve
+    istatistikleri tekrar çalışmaz. Kart okunurken sıradaki kartların AI
+    cümlesi ve ipucu arka planda hazırlanır.
+    """
+    import random
+    from utils.constants import FLASHCARD_AI
+    from services.ai_content_service import prefetch_ai_content
+    
+    if not words:
+        return
+    
+    # Filtre değişip liste kısaldıysa index'i sınırla
+    last_idx = len(words) - 1
+    current_idx = min(st.session_state.get("current_word_index", 0), last_idx)
+    st.session_state.current_word_index = current_idx
+    
+    # Navigasyon
+    col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
+    
+    with col1:
+        st.button("⏮️ İlk", use_container_width=True, on_click=_set_card_index, args=(0,))
+    
+    with col2:
+        st.button(
+            "◀️ Önceki",
+            use_container_width=True,
+            on_click=_set_card_index,
+            args=(max(current_idx - 1, 0),)
+        )
+    
+    with col3:
+        st.markdown(f"<h3 style='text-align: center;'>{current_idx + 1} / {len(words)}</h3>", unsafe_allow_html=True)
+    
+    with col4:
+        st.button(
+            "Sonraki ▶️",
+            use_container_width=True,
+            on_click=_set_card_index,
+            args=(min(current_idx + 1, last_idx),)
+        )
+    
+    with col5:
+        st.button("Son ⏭️", use_container_width=True, on_click=_set_card_index, args=(last_idx,))
+    
+    # Kelime kartı
+    current_word = words[current_idx]
+    render_flashcard(current_word, show_example=True, show_ai_button=True)
+    
+    # Rastgele kelime butonu
+    st.markdown("---")
+    st.button(
+        "🎲 Rastgele Kelime",
+        use_container_width=True,
+        on_click=_set_card_index,
+        args=(random.randint(0, last_idx),)
+    )
+    
+    # Sıradaki kartların AI içeriğini arka planda hazırla
+    next_words = words[current_idx + 1:current_idx + 1 + FLASHCARD_AI["prefetch_count"]]
+    prefetch_ai_content(next_words)
+
+
 def generate_ai_sentence(word: Dict[str, Any]):
     """AI ile örnek cümle oluştur"""
-    from services.groq_service import generate_example_sentence, check_groq_availability
+    from services.groq_service import check_groq_availability
+    from services.ai_content_service import get_example_sentence
     
     if not check_groq_availability():
         st.warning("⚠️ AI servisi şu anda kullanılamıyor.")
         return
     
+    # Kart görüntüleyicide ön yüklendiyse beklemeden gelir
     with st.spinner("🤖 AI cümle oluşturuyor..."):
-        result = generate_example_sentence(
-            word.get("english", ""),
-            word.get("type", "noun"),
-            word.get("turkish", "")
-        )
+        result = get_example_sentence(word)
         
         if result:
             st.success("✨ **AI Örnek Cümle:**")
@@ -241,17 +225,15 @@ def generate_ai_sentence(word: Dict[str, Any]):
 
 def generate_memory_hint(word: Dict[str, Any]):
     """Hafıza ipucu oluştur"""
-    from services.groq_service import get_ai_hint, check_groq_availability
+    from services.groq_service import check_groq_availability
+    from services.ai_content_service import get_memory_hint
     
     if not check_groq_availability():
         st.warning("⚠️ AI servisi şu anda kullanılamıyor.")
         return
     
     with st.spinner("💡 İpucu oluşturuluyor..."):
-        hint = get_ai_hint(
-            word.get("english", ""),
-            f"Türkçe anlamı: {word.get('turkish', '')}"
-        )
+        hint = get_memory_hint(word)
         
         if hint:
             st.success("💡 **Hatırlama İpucu:**")
@@ -287,17 +269,46 @@ def render_mini_card(word: Dict[str, Any], on_click_key: str = None):
                 st.button("👁️", key=on_click_key)
 
 
-def render_word_grid(words: List[Dict[str, Any]], columns: int = 3):
+def _mini_card_html(word: Dict[str, Any]) -> str:
+    """Tek mini kartın HTML'i"""
+    from utils.constants import WORD_TYPES
+    
+    word_type = word.get("type", "noun")
+    type_info = WORD_TYPES.get(word_type, WORD_TYPES["noun"])
+    difficulty = word.get("difficulty", 3)
+    stars = "⭐" * difficulty
+    
+    return f"""
+    <div class="mini-card">
+        <div class="mini-card-english">{escape(word.get('english', ''))}</div>
+        <div class="mini-card-turkish">{escape(word.get('turkish', ''))}</div>
+        <div style="margin-top: 8px;">
+            <span style="color: {type_info['color']}; font-size: 12px;">{type_info['abbr']}</span>
+            <span style="font-size: 12px;">{stars}</span>
+        </div>
+    </div>
+    """
+
+
+def render_word_grid(words: List[Dict[str, Any]], columns: int = 3, single_block: bool = False):
     """
     Kelime grid'i render et
     
     Args:
         words: Kelime listesi
         columns: Sütun sayısı
+        single_block: True ise tüm grid tek bir HTML bloğu (CSS grid) olarak
+            gönderilir; kart başına ayrı element ve sütun oluşturulmaz
     """
-    from utils.constants import WORD_TYPES
+    inject_styles("flashcard")
     
-    st.markdown(get_flashcard_styles(), unsafe_allow_html=True)
+    if single_block:
+        cards = "".join(_mini_card_html(word) for word in words)
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: repeat({columns}, minmax(0, 1fr)); gap: 0 16px;">{cards}</div>',
+            unsafe_allow_html=True
+        )
+        return
     
     # Grid oluştur
     for i in range(0, len(words), columns):
@@ -306,55 +317,99 @@ def render_word_grid(words: List[Dict[str, Any]], columns: int = 3):
         for j, col in enumerate(cols):
             idx = i + j
             if idx < len(words):
-                word = words[idx]
-                word_type = word.get("type", "noun")
-                type_info = WORD_TYPES.get(word_type, WORD_TYPES["noun"])
-                difficulty = word.get("difficulty", 3)
-                stars = "⭐" * difficulty
-                
                 with col:
-                    st.markdown(f"""
-                    <div class="mini-card">
-                        <div class="mini-card-english">{word.get('english', '')}</div>
-                        <div class="mini-card-turkish">{word.get('turkish', '')}</div>
-                        <div style="margin-top: 8px;">
-                            <span style="color: {type_info['color']}; font-size: 12px;">{type_info['abbr']}</span>
-                            <span style="font-size: 12px;">{stars}</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(_mini_card_html(words[idx]), unsafe_allow_html=True)
+
+
+def _go_to_word_page(cursor: Optional[Any]):
+    """Sayfa butonlarının on_click callback'i (None = önceki sayfa)"""
+    cursors = st.session_state.word_pager["cursors"]
+    if cursor is None:
+        if len(cursors) > 1:
+            cursors.pop()
+    else:
+        cursors.append(cursor)
+
+
+def render_paginated_words(
+    view_mode: str,
+    exam_type: Optional[str] = None,
+    difficulty: Optional[int] = None,
+    search_query: Optional[str] = None,
+    search_results: Optional[List[Dict[str, Any]]] = None
+):
+    """
+    Grid/liste görünümünü sayfalı render et
+    
+    Her seferinde sadece UI["max_cards_per_page"] kelime çizilir. Sayfalar
+    Firestore'dan cursor ile okunur (get_words_page); gidilen sayfaların
+    cursor'ları session state'te yığın olarak tutulur. Arama sonuçları
+    Firestore'da sorgulanamadığından verilen liste üzerinde sayfalanır.
+    
+    Args:
+        view_mode: "grid" veya "list"
+        search_query: Arama metni (varsa)
+        search_results: Arama yapıldıysa filtrelenmiş kelimeler
+    """
+    from utils.constants import UI
+    from services.firebase_service import get_words_page
+    
+    page_size = UI["max_cards_per_page"]
+    
+    # Filtre değişince ilk sayfaya dön
+    pager_key = (exam_type, difficulty, search_query)
+    pager = st.session_state.get("word_pager")
+    if not pager or pager["key"] != pager_key:
+        pager = {"key": pager_key, "cursors": [None]}
+        st.session_state.word_pager = pager
+    
+    cursor = pager["cursors"][-1]
+    if search_query:
+        offset = cursor or 0
+        words = search_results[offset:offset + page_size]
+        next_cursor = offset + page_size if offset + page_size < len(search_results) else None
+    else:
+        page = get_words_page("approved", exam_type, difficulty, page_size, cursor)
+        words, next_cursor = page["words"], page["next_cursor"]
+    
+    if view_mode == "grid":
+        render_word_grid(words, columns=3, single_block=True)
+    else:
+        for word in words:
+            with st.expander(f"**{word.get('english', '')}** - {word.get('turkish', '')}", expanded=False):
+                render_flashcard(word, show_example=True, show_ai_button=True)
+    
+    # Sayfa navigasyonu
+    page_number = len(pager["cursors"])
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        st.button(
+            "◀️ Önceki Sayfa",
+            key="word_page_prev",
+            use_container_width=True,
+            disabled=page_number == 1,
+            on_click=_go_to_word_page,
+            args=(None,)
+        )
+    
+    with col2:
+        st.markdown(f"<p style='text-align: center;'>Sayfa {page_number}</p>", unsafe_allow_html=True)
+    
+    with col3:
+        st.button(
+            "Sonraki Sayfa ▶️",
+            key="word_page_next",
+            use_container_width=True,
+            disabled=next_cursor is None,
+            on_click=_go_to_word_page,
+            args=(next_cursor,)
+        )
 
 
 def render_word_of_the_day(word: Dict[str, Any]):
     """Günün kelimesi kartı"""
-    st.markdown("""
-    <style>
-    .wotd-container {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        border-radius: 20px;
-        padding: 30px;
-        color: white;
-        text-align: center;
-        margin: 20px 0;
-    }
-    .wotd-title {
-        font-size: 14px;
-        text-transform: uppercase;
-        letter-spacing: 2px;
-        opacity: 0.9;
-        margin-bottom: 10px;
-    }
-    .wotd-word {
-        font-size: 36px;
-        font-weight: 700;
-        margin-bottom: 8px;
-    }
-    .wotd-meaning {
-        font-size: 20px;
-        opacity: 0.95;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_styles("word_of_the_day")
     
     st.markdown(f"""
     <div class="wotd-container">
@@ -4,148 +4,29 @@ Quiz question display and interaction
 """
 
 import streamlit as st
+from array import array
 from typing import Dict, Any, List, Optional
 import random
 
+from utils.theme import inject_styles, start_style_run
 
-def get_quiz_styles() -> str:
-    """Quiz için CSS stilleri"""
-    return """
-    <style>
-    .quiz-container {
-        background: linear-gradient(135deg, #1a1f2e 0%, #2d3748 100%);
-        border-radius: 20px;
-        padding: 30px;
-        margin: 20px 0;
-    }
-    
-    .quiz-progress {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 20px;
-        padding-bottom: 15px;
-        border-bottom: 1px solid rgba(255,255,255,0.1);
-    }
-    
-    .quiz-question-number {
-        font-size: 14px;
-        color: #a0aec0;
-    }
-    
-    .quiz-timer {
-        font-size: 14px;
-        color: #667eea;
-        font-weight: 600;
-    }
-    
-    .quiz-question {
-        font-size: 24px;
-        font-weight: 600;
-        color: #fff;
-        margin-bottom: 30px;
-        line-height: 1.4;
-    }
-    
-    .quiz-hint {
-        font-size: 14px;
-        color: #a0aec0;
-        margin-bottom: 20px;
-        font-style: italic;
-    }
-    
-    .quiz-option {
-        background: rgba(102, 126, 234, 0.1);
-        border: 2px solid rgba(102, 126, 234, 0.3);
-        border-radius: 12px;
-        padding: 16px 20px;
-        margin: 10px 0;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        color: #fff;
-    }
-    
-    .quiz-option:hover {
-        background: rgba(102, 126, 234, 0.2);
-        border-color: #667eea;
-        transform: translateX(5px);
-    }
-    
-    .quiz-option.selected {
-        background: rgba(102, 126, 234, 0.3);
-        border-color: #667eea;
-    }
-    
-    .quiz-option.correct {
-        background: rgba(39, 174, 96, 0.3);
-        border-color: #27ae60;
-    }
-    
-    .quiz-option.wrong {
-        background: rgba(231, 76, 60, 0.3);
-        border-color: #e74c3c;
-    }
-    
-    .quiz-result {
-        text-align: center;
-        padding: 40px;
-    }
-    
-    .quiz-score {
-        font-size: 72px;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .quiz-grade {
-        font-size: 24px;
-        margin-top: 10px;
-    }
-    
-    .quiz-stats {
-        display: flex;
-        justify-content: center;
-        gap: 40px;
-        margin-top: 30px;
-    }
-    
-    .quiz-stat {
-        text-align: center;
-    }
-    
-    .quiz-stat-value {
-        font-size: 28px;
-        font-weight: 600;
-        color: #667eea;
-    }
-    
-    .quiz-stat-label {
-        font-size: 12px;
-        color: #a0aec0;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    </style>
-    """
+
+# Soru türü kodları (kompakt quiz state'inde 1 bayt)
+QUESTION_KINDS = ["en_to_tr", "tr_to_en", "synonym", "sentence_completion"]
+KIND_CODES = {kind: code for code, kind in enumerate(QUESTION_KINDS)}
+OPTIONS_PER_QUESTION = 4
 
 
 def init_quiz_state():
     """Quiz session state'lerini başlat"""
     if "quiz_active" not in st.session_state:
         st.session_state.quiz_active = False
-    if "quiz_questions" not in st.session_state:
-        st.session_state.quiz_questions = []
+    if "quiz" not in st.session_state:
+        st.session_state.quiz = None
     if "quiz_current_index" not in st.session_state:
         st.session_state.quiz_current_index = 0
-    if "quiz_answers" not in st.session_state:
-        st.session_state.quiz_answers = []
     if "quiz_score" not in st.session_state:
         st.session_state.quiz_score = 0
-    if "quiz_wrong_words" not in st.session_state:
-        st.session_state.quiz_wrong_words = []
     if "quiz_completed" not in st.session_state:
         st.session_state.quiz_completed = False
 
@@ -154,118 +35,244 @@ def generate_quiz_questions(
     words: List[Dict[str, Any]], 
     question_count: int = 10, 
     quiz_type: str = "en_to_tr"
-) -> List[Dict[str, Any]]:
+) -> Optional[Dict[str, Any]]:
     """
     Quiz soruları oluştur
     
+    Sorular kelime dict'lerini kopyalamak yerine süreç genelindeki
+    kelime kaydının (Vocabulary) index'leri olarak tutulur:
+    soru başına kelime index'i, 4 şık index'i, doğru şık konumu,
+    tür kodu ve varyant (seçilen cümle tamamlama sorusu).
+    Metinler render sırasında resolve_question ile üretilir.
+    
+    Cümle tamamlama soruları kelimenin önceden üretilmiş havuzundan
+    (completionItems) alınır; quiz başında LLM çağrısı yapılmaz. Bu
+    türde şık index'leri sorunun kendi şıklarının sırasını tutar.
+    Eş anlam sorularında şıklar eş/zıt anlam grafının düğümleridir;
+    hedefin eş anlamlıları yanlış şık olarak seçilmez.
+    
     Args:
         words: Kelime havuzu
         question_count: Soru sayısı
         quiz_type: Soru türü
     
     Returns:
-        Soru listesi
+        Kompakt quiz (kelime yetersizse None)
     """
-    if len(words) < 4:
-        return []
+    from services.vocabulary_service import get_vocabulary
+    from services.completion_service import get_completion_items
+    
+    if len(words) < OPTIONS_PER_QUESTION:
+        return None
     
-    # Rastgele kelimeler seç
-    question_words = random.sample(words, min(question_count, len(words)))
-    questions = []
+    vocabulary = get_vocabulary()
+    pool = vocabulary.intern_many(words)
+    count = min(question_count, len(pool))
     
-    for word in question_words:
-        # Yanlış şıkları belirle
-        wrong_options_pool = [w for w in words if w["id"] != word["id"]]
-        wrong_options = random.sample(wrong_options_pool, min(3, len(wrong_options_pool)))
+    graph = None
+    if quiz_type == "synonym":
+        from services.synonym_graph_service import get_synonym_graph
         
-        if quiz_type == "en_to_tr":
-            question = {
-                "type": "en_to_tr",
-                "question": f"'{word['english']}' kelimesinin Türkçe karşılığı nedir?",
-                "correct_answer": word["turkish"],
-                "options": [word["turkish"]] + [w["turkish"] for w in wrong_options],
-                "word_id": word["id"],
-                "word": word
-            }
-        elif quiz_type == "tr_to_en":
-            question = {
-                "type": "tr_to_en",
-                "question": f"'{word['turkish']}' kelimesinin İngilizce karşılığı nedir?",
-                "correct_answer": word["english"],
-                "options": [word["english"]] + [w["english"] for w in wrong_options],
-                "word_id": word["id"],
-                "word": word
-            }
-        elif quiz_type == "synonym":
-            synonyms = word.get("synonyms", [])
-            if synonyms:
-                correct = random.choice(synonyms)
-                question = {
-                    "type": "synonym",
-                    "question": f"'{word['english']}' kelimesinin eş anlamlısı hangisidir?",
-                    "correct_answer": correct,
-                    "options": [correct] + [w["english"] for w in wrong_options],
-                    "word_id": word["id"],
-                    "word": word
-                }
-            else:
-                # Eş anlam yoksa en_to_tr'ye dön
-                question = {
-                    "type": "en_to_tr",
-                    "question": f"'{word['english']}' kelimesinin Türkçe karşılığı nedir?",
-                    "correct_answer": word["turkish"],
-                    "options": [word["turkish"]] + [w["turkish"] for w in wrong_options],
-                    "word_id": word["id"],
-                    "word": word
-                }
-        else:
-            # Default: en_to_tr
-            question = {
-                "type": "en_to_tr",
-                "question": f"'{word['english']}' kelimesinin Türkçe karşılığı nedir?",
-                "correct_answer": word["turkish"],
-                "options": [word["turkish"]] + [w["turkish"] for w in wrong_options],
-                "word_id": word["id"],
-                "word": word
-            }
+        graph = get_synonym_graph()
+        graph.ensure_built()
+        # Quiz havuzundaki kelimeler grafta yoksa (örn: yeni onay) eklenir
+        graph.add_words(words)
+        pool_nodes = [graph.node_of(w.get("english", "")) for w in words]
+        pool_nodes = [node for node in pool_nodes if node is not None]
+    
+    # Rastgele kelimeler seç (cümle tamamlamada havuzu dolu kelimeler önce)
+    question_positions = random.sample(range(len(pool)), len(pool))
+    if quiz_type == "sentence_completion":
+        question_positions.sort(key=lambda p: not get_completion_items(vocabulary.get(pool[p])))
+    question_positions = question_positions[:count]
+    
+    word_indexes = array("I")
+    option_indexes = array("I")
+    kinds = bytearray()
+    correct_positions = bytearray()
+    variants = bytearray()
+    
+    for position in question_positions:
+        word_index = pool[position]
+        entry = vocabulary.get(word_index)
+        
+        kind = quiz_type if quiz_type in KIND_CODES else "en_to_tr"
+        variant = 0
+        options = None
+        
+        if kind == "synonym":
+            node = graph.node_of(entry["english"])
+            synonym_nodes = graph.synonyms(node) if node is not None else ()
+            if synonym_nodes:
+                answer = random.choice(synonym_nodes)
+                distractors = graph.pick_distractors(node, answer, OPTIONS_PER_QUESTION - 1, pool_nodes)
+                if len(distractors) == OPTIONS_PER_QUESTION - 1:
+                    options = [answer] + distractors
+                    random.shuffle(options)
+                    correct_position = options.index(answer)
+        elif kind == "sentence_completion":
+            completion_items = get_completion_items(entry)
+            if completion_items:
+                variant = random.randrange(min(len(completion_items), 256))
+                item = completion_items[variant]
+                options = list(range(OPTIONS_PER_QUESTION))
+                random.shuffle(options)
+                correct_position = options.index(item["options"].index(item["correct"]))
         
-        # Şıkları karıştır
-        random.shuffle(question["options"])
-        questions.append(question)
+        if options is None:
+            # Eş anlam / soru havuzu yoksa en_to_tr'ye dön
+            if kind not in ("en_to_tr", "tr_to_en"):
+                kind = "en_to_tr"
+                variant = 0
+            
+            # Yanlış şıkları belirle (aynı kelime hariç - havuz kopyalanmadan)
+            wrong = [
+                p + 1 if p >= position else p
+                for p in random.sample(range(len(pool) - 1), OPTIONS_PER_QUESTION - 1)
+            ]
+            
+            # Şıkları karıştır
+            options = [word_index] + [pool[p] for p in wrong]
+            random.shuffle(options)
+            correct_position = options.index(word_index)
+        
+        word_indexes.append(word_index)
+        option_indexes.extend(options)
+        kinds.append(KIND_CODES[kind])
+        correct_positions.append(correct_position)
+        variants.append(variant)
+    
+    total = len(word_indexes)
+    return {
+        "words": word_indexes,
+        "options": option_indexes,
+        "kinds": bytes(kinds),
+        "correct": bytes(correct_positions),
+        "variants": bytes(variants),
+        # Cevap vektörü: soru başına 1 bit (1 = doğru)
+        "answers": bytearray((total + 7) // 8)
+    }
+
+
+def resolve_question(quiz: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """
+    Kompakt sorudan render edilecek soruyu üret
+    
+    Returns:
+        {"type", "question", "options", "correct_answer", "word_id", "word"}
+    """
+    from services.vocabulary_service import get_vocabulary
+    
+    vocabulary = get_vocabulary()
+    word = vocabulary.get(quiz["words"][index])
+    kind = QUESTION_KINDS[quiz["kinds"][index]]
+    correct_position = quiz["correct"][index]
+    start = index * OPTIONS_PER_QUESTION
+    option_refs = quiz["options"][start:start + OPTIONS_PER_QUESTION]
+    
+    if kind == "sentence_completion":
+        from services.completion_service import get_completion_items
+        
+        item = get_completion_items(word)[quiz["variants"][index]]
+        question_text = f"Boşluğa hangisi gelmelidir? {item['sentence']}"
+        options = [item["options"][i] for i in option_refs]
+    elif kind == "tr_to_en":
+        question_text = f"'{word['turkish']}' kelimesinin İngilizce karşılığı nedir?"
+        options = [vocabulary.get(i)["english"] for i in option_refs]
+    elif kind == "synonym":
+        from services.synonym_graph_service import get_synonym_graph
+        
+        graph = get_synonym_graph()
+        question_text = f"'{word['english']}' kelimesinin eş anlamlısı hangisidir?"
+        options = [graph.term(node) for node in option_refs]
+    else:
+        question_text = f"'{word['english']}' kelimesinin Türkçe karşılığı nedir?"
+        options = [vocabulary.get(i)["turkish"] for i in option_refs]
+    
+    return {
+        "type": kind,
+        "question": question_text,
+        "options": options,
+        "correct_answer": options[correct_position],
+        "word_id": word["id"],
+        "word": word
+    }
+
+
+def get_quiz_total(quiz: Optional[Dict[str, Any]]) -> int:
+    """Quiz'deki soru sayısı"""
+    return len(quiz["words"]) if quiz else 0
+
+
+def is_answer_correct(quiz: Dict[str, Any], index: int) -> bool:
+    """Cevap vektöründeki bit"""
+    return bool(quiz["answers"][index >> 3] & (1 << (index & 7)))
+
+
+def get_wrong_words(quiz: Optional[Dict[str, Any]], answered: int) -> List[Dict[str, Any]]:
+    """Yanlış cevaplanan soruların kelimeleri"""
+    from services.vocabulary_service import get_vocabulary
     
-    return questions
+    if not quiz:
+        return []
+    vocabulary = get_vocabulary()
+    return [
+        vocabulary.get(quiz["words"][i])
+        for i in range(min(answered, get_quiz_total(quiz)))
+        if not is_answer_correct(quiz, i)
+    ]
 
 
-def start_quiz(questions: List[Dict[str, Any]]):
+def start_quiz(quiz: Dict[str, Any]):
     """Quiz'i başlat"""
     init_quiz_state()
     st.session_state.quiz_active = True
-    st.session_state.quiz_questions = questions
+    st.session_state.quiz = quiz
     st.session_state.quiz_current_index = 0
-    st.session_state.quiz_answers = []
     st.session_state.quiz_score = 0
-    st.session_state.quiz_wrong_words = []
     st.session_state.quiz_completed = False
+    st.session_state.pop("quiz_feedback", None)
 
 
+@st.fragment
 def render_quiz_question():
-    """Aktif soruyu render et"""
+    """
+    Aktif soruyu render et
+    
+    Fragment olarak çalışır: şık seçimi sadece bu fonksiyonu yeniden
+    çalıştırır; sayfa, kimlik kontrolü ve kelime yüklemesi tekrarlanmaz.
+    Quiz bitince sonuç ekranı için tüm sayfa yeniden çalıştırılır.
+    """
+    # Stil bu fragment'ın içinde gönderiliyor; tek başına çalışmada da gönderilsin
+    start_style_run()
     init_quiz_state()
     
-    if not st.session_state.quiz_active or st.session_state.quiz_completed:
+    if st.session_state.quiz_completed:
+        st.rerun()
+    
+    if not st.session_state.quiz_active:
         return
     
-    st.markdown(get_quiz_styles(), unsafe_allow_html=True)
+    inject_styles("quiz")
     
-    questions = st.session_state.quiz_questions
+    quiz = st.session_state.quiz
     current_idx = st.session_state.quiz_current_index
+    total = get_quiz_total(quiz)
     
-    if current_idx >= len(questions):
+    if current_idx >= total:
         st.session_state.quiz_completed = True
-        return
+        st.rerun()
+    
+    # Önceki cevabın geri bildirimi
+    feedback = st.session_state.pop("quiz_feedback", None)
+    if feedback:
+        is_correct, message = feedback
+        if is_correct:
+            st.success(message)
+        else:
+            st.error(message)
     
-    question = questions[current_idx]
-    total = len(questions)
+    question = resolve_question(quiz, current_idx)
     
     # Progress bar
     progress = (current_idx) / total
@@ -294,36 +301,40 @@ def render_quiz_question():
             st.markdown(f"**{letters[i]}**")
         
         with col2:
-            if st.button(option, key=f"option_{current_idx}_{i}", use_container_width=True):
-                handle_answer(option, question)
+            st.button(
+                option,
+                key=f"option_{current_idx}_{i}",
+                use_container_width=True,
+                on_click=handle_answer,
+                args=(current_idx, i)
+            )
 
 
-def handle_answer(selected_option: str, question: Dict[str, Any]):
-    """Cevabı işle"""
-    is_correct = selected_option == question["correct_answer"]
-    
-    st.session_state.quiz_answers.append({
-        "question": question["question"],
-        "selected": selected_option,
-        "correct": question["correct_answer"],
-        "is_correct": is_correct,
-        "word_id": question.get("word_id")
-    })
-    
-    if is_correct:
+def handle_answer(question_index: int, selected_position: int):
+    """
+    Cevabı işle (şık butonunun on_click callback'i)
+    
+    Callback fragment yeniden çalışmadan önce çalışır; bu yüzden ayrıca
+    st.rerun() gerekmez ve bir sonraki soru tek geçişte çizilir.
+    """
+    quiz = st.session_state.get("quiz")
+    # Çift tıklama veya eski soruya ait buton: yok say
+    if not quiz or question_index != st.session_state.quiz_current_index:
+        return
+    
+    if selected_position == quiz["correct"][question_index]:
+        quiz["answers"][question_index >> 3] |= 1 << (question_index & 7)
         st.session_state.quiz_score += 1
-        st.success("✅ Doğru!")
+        st.session_state.quiz_feedback = (True, "✅ Doğru!")
     else:
-        st.error(f"❌ Yanlış! Doğru cevap: **{question['correct_answer']}**")
-        st.session_state.quiz_wrong_words.append(question.get("word"))
+        correct_answer = resolve_question(quiz, question_index)["correct_answer"]
+        st.session_state.quiz_feedback = (False, f"❌ Yanlış! Doğru cevap: **{correct_answer}**")
     
     # Sonraki soruya geç
     st.session_state.quiz_current_index += 1
     
-    if st.session_state.quiz_current_index >= len(st.session_state.quiz_questions):
+    if st.session_state.quiz_current_index >= get_quiz_total(quiz):
         st.session_state.quiz_completed = True
-    
-    st.rerun()
 
 
 def render_quiz_result():
@@ -332,7 +343,7 @@ def render_quiz_result():
         return
     
     score = st.session_state.quiz_score
-    total = len(st.session_state.quiz_questions)
+    total = get_quiz_total(st.session_state.quiz)
     percentage = (score / total * 100) if total > 0 else 0
     
     # Grade belirleme
@@ -372,7 +383,7 @@ def render_quiz_result():
         st.metric("📊 Toplam", total)
     
     # Yanlış kelimeler
-    wrong_words = st.session_state.quiz_wrong_words
+    wrong_words = get_wrong_words(st.session_state.quiz, st.session_state.quiz_current_index)
     if wrong_words:
         st.markdown("---")
         st.subheader("📝 Tekrar Çalışılacak Kelimeler")
@@ -398,12 +409,11 @@ def render_quiz_result():
 def reset_quiz():
     """Quiz'i sıfırla"""
     st.session_state.quiz_active = False
-    st.session_state.quiz_questions = []
+    st.session_state.quiz = None
     st.session_state.quiz_current_index = 0
-    st.session_state.quiz_answers = []
     st.session_state.quiz_score = 0
-    st.session_state.quiz_wrong_words = []
     st.session_state.quiz_completed = False
+    st.session_state.pop("quiz_feedback", None)
 
 
 def render_quiz_setup(words: List[Dict[str, Any]]):
@@ -432,9 +442,9 @@ def render_quiz_setup(words: List[Dict[str, Any]]):
     st.markdown("---")
     
     if st.button("🚀 Quiz'e Başla", type="primary", use_container_width=True):
-        questions = generate_quiz_questions(words, question_count, quiz_type)
-        if questions:
-            start_quiz(questions)
+        quiz = generate_quiz_questions(words, question_count, quiz_type)
+        if quiz:
+            start_quiz(quiz)
             st.rerun()
         else:
             st.error("Yeterli kelime yok. En az 4 kelime gerekli.")
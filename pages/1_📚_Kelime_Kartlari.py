@@ -18,10 +18,11 @@ import components.auth as auth
 auth.check_auth()
 
 # Imports (sadece giriş yapılmışsa)
-from components.flashcard import render_flashcard, render_word_grid, get_flashcard_styles, render_word_of_the_day
+from components.flashcard import render_flashcard_viewer, render_paginated_words, render_word_of_the_day
 from services.firebase_service import get_words
 from utils.constants import EXAM_TYPES, DIFFICULTY_LEVELS
 from utils.helpers import init_session_state
+from utils.theme import inject_styles
 
 # Session state başlat
 init_session_state()
@@ -31,7 +32,7 @@ st.title("📚 Kelime Kartları")
 st.markdown("YDS, YÖKDİL, TOEFL ve IELTS sınavlarına hazırlık için kelime kartları")
 
 # CSS
-st.markdown(get_flashcard_styles(), unsafe_allow_html=True)
+inject_styles("flashcard")
 
 # Filtreler
 st.markdown("---")
@@ -112,59 +113,18 @@ else:
     st.markdown("---")
     
     if view_mode == "card":
-        # Kart görünümü
-        if "current_word_index" not in st.session_state:
-            st.session_state.current_word_index = 0
-        
-        current_idx = st.session_state.current_word_index
-        
-        # Navigasyon
-        col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
-        
-        with col1:
-            if st.button("⏮️ İlk", use_container_width=True):
-                st.session_state.current_word_index = 0
-                st.rerun()
-        
-        with col2:
-            if st.button("◀️ Önceki", use_container_width=True):
-                if current_idx > 0:
-                    st.session_state.current_word_index -= 1
-                    st.rerun()
-        
-        with col3:
-            st.markdown(f"<h3 style='text-align: center;'>{current_idx + 1} / {len(words)}</h3>", unsafe_allow_html=True)
-        
-        with col4:
-            if st.button("Sonraki ▶️", use_container_width=True):
-                if current_idx < len(words) - 1:
-                    st.session_state.current_word_index += 1
-                    st.rerun()
-        
-        with col5:
-            if st.button("Son ⏭️", use_container_width=True):
-                st.session_state.current_word_index = len(words) - 1
-                st.rerun()
-        
-        # Kelime kartı
-        if current_idx < len(words):
-            render_flashcard(words[current_idx], show_example=True, show_ai_button=True)
-        
-        # Rastgele kelime butonu
-        st.markdown("---")
-        if st.button("🎲 Rastgele Kelime", use_container_width=True):
-            st.session_state.current_word_index = random.randint(0, len(words) - 1)
-            st.rerun()
-    
-    elif view_mode == "grid":
-        # Grid görünümü
-        render_word_grid(words, columns=3)
+        # Kart görünümü (navigasyon sadece kartı yeniden çizer)
+        render_flashcard_viewer(words)
     
     else:
-        # Liste görünümü
-        for i, word in enumerate(words):
-            with st.expander(f"**{word.get('english', '')}** - {word.get('turkish', '')}", expanded=False):
-                render_flashcard(word, show_example=True, show_ai_button=True)
+        # Grid / liste görünümü (sadece geçerli sayfa çizilir)
+        render_paginated_words(
+            view_mode,
+            exam_type=exam_filter if exam_filter != "all" else None,
+            difficulty=difficulty_filter if difficulty_filter != "all" else None,
+            search_query=search_query or None,
+            search_results=words
+        )
 
 # Footer
 st.markdown("---")
@@ -18,6 +18,7 @@ auth.check_auth()
 
 # Imports (sadece giriş yapılmışsa)
 from services.firebase_service import add_word, add_trick, check_word_exists
+from services.word_index_service import find_similar_words
 from services.moderation_service import check_word_submission, check_trick_submission, check_moderation_availability
 from utils.constants import WORD_TYPES, EXAM_TYPES, DIFFICULTY_LEVELS, TRICK_CATEGORIES
 from utils.helpers import init_session_state, validate_word_input, sanitize_input
@@ -112,18 +113,35 @@ with tab1:
         
         st.markdown("---")
         
+        confirm_similar = st.checkbox(
+            "Benzer kelimeler olsa da ekle",
+            help="Yazım varyantı veya aynı kökten bir kelime bulunursa yine de göndermek için işaretleyin"
+        )
+        
         submitted = st.form_submit_button("📤 Kelime Ekle", type="primary", use_container_width=True)
         
         if submitted:
             # Validasyon
             is_valid, error_msg = validate_word_input(english, turkish)
+            similar = find_similar_words(english) if is_valid else {"exact": [], "similar": []}
             
             if not is_valid:
                 st.error(f"❌ {error_msg}")
             elif not selected_exams:
                 st.error("❌ En az bir sınav türü seçmelisiniz.")
-            elif check_word_exists(english):
+            elif similar["exact"] or check_word_exists(english):
+                # Index başka süreçlerdeki son eklemeleri henüz görmemiş olabilir
                 st.warning("⚠️ Bu kelime zaten mevcut!")
+            elif similar["similar"] and not confirm_similar:
+                matches = "\n".join(
+                    f"- **{w['english']}** – {w['turkish']} ({'onaylı' if w['status'] == 'approved' else 'onay bekliyor'})"
+                    for w in similar["similar"]
+                )
+                st.warning(
+                    "⚠️ Benzer kelimeler zaten mevcut:\n\n"
+                    f"{matches}\n\n"
+                    "Farklı bir kelime olduğundan eminseniz 'Benzer kelimeler olsa da ekle' seçeneğini işaretleyin."
+                )
             else:
                 # Moderasyon kontrolü
                 is_safe, mod_msg = check_word_submission(english, turkish, example_sentence)
@@ -244,7 +262,11 @@ with tab2:
                     
                     if trick_id:
                         st.success("✅ Trick başarıyla eklendi! Admin onayından sonra yayınlanacak.")
-                        st.balloons()
+                        if trick_data.get("possibleDuplicates"):
+                            titles = ", ".join(d["title"] for d in trick_data["possibleDuplicates"])
+                            st.info(f"ℹ️ Benzer trick'ler bulundu ({titles}); admin onay sırasında karşılaştıracak.")
+                        else:
+                            st.balloons()
                     else:
                         st.error("❌ Trick eklenirken bir hata oluştu.")
 
@@ -21,6 +21,8 @@ from components.quiz_card import (
     init_quiz_state, 
     render_quiz_question, 
     render_quiz_result,
+    get_quiz_total,
+    get_wrong_words,
 )
 from services.firebase_service import get_words, save_quiz_result
 from services.gamification_service import update_user_after_quiz
@@ -60,14 +62,16 @@ with tab1:
         
         if "quiz_result_saved" not in st.session_state or not st.session_state.quiz_result_saved:
             score = st.session_state.quiz_score
-            total = len(st.session_state.quiz_questions)
+            total = get_quiz_total(st.session_state.quiz)
             
             result_data = {
                 "userId": user["id"],
                 "score": score,
                 "totalQuestions": total,
                 "percentage": round((score / total * 100) if total > 0 else 0, 1),
-                "wrongAnswers": [w.get("id") for w in st.session_state.quiz_wrong_words if w]
+                "wrongAnswers": [
+                    w["id"] for w in get_wrong_words(st.session_state.quiz, st.session_state.quiz_current_index)
+                ]
             }
             
             save_quiz_result(result_data)
@@ -140,11 +144,11 @@ with tab1:
             if st.button("🚀 Kelime Testine Başla", type="primary", use_container_width=True, key="start_vocab"):
                 from components.quiz_card import generate_quiz_questions, start_quiz
                 
-                questions = generate_quiz_questions(words, question_count, quiz_type)
+                quiz = generate_quiz_questions(words, question_count, quiz_type)
                 
-                if questions:
+                if quiz:
                     st.session_state.quiz_result_saved = False
-                    start_quiz(questions)
+                    start_quiz(quiz)
                     st.rerun()
                 else:
                     st.error("Sorular oluşturulamadı.")
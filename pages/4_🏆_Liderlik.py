@@ -21,12 +21,12 @@ from components.badges import (
     render_badges_grid, 
     render_badge_showcase, 
     render_user_profile_card,
-    render_leaderboard_row,
-    get_badge_styles
+    render_leaderboard_row
 )
 from services.firebase_service import get_leaderboard
 from utils.constants import LEADERBOARD_PERIODS, BADGES
 from utils.helpers import init_session_state
+from utils.theme import inject_styles
 
 # Session state başlat
 init_session_state()
@@ -34,7 +34,7 @@ init_session_state()
 user = auth.get_current_user()
 
 # CSS
-st.markdown(get_badge_styles(), unsafe_allow_html=True)
+inject_styles("badges")
 
 # Ana içerik
 st.title("🏆 Liderlik Tablosu")
@@ -23,10 +23,9 @@ from services.firebase_service import (
     approve_word,
     reject_word,
     approve_trick,
-    update_word,
-    get_leaderboard
+    update_word
 )
-from services.gamification_service import update_user_after_word_approved
+from services.gamification_service import update_user_after_word_approved, apply_bulk_word_moderation
 from utils.constants import WORD_TYPES, EXAM_TYPES, DIFFICULTY_LEVELS, TRICK_CATEGORIES
 from utils.helpers import init_session_state, format_date
 
@@ -48,22 +47,82 @@ tab1, tab2, tab3 = st.tabs(["📝 Bekleyen Kelimeler", "💡 Bekleyen Trick'ler"
 with tab1:
     st.subheader("📝 Bekleyen Kelimeler")
     
+    col_refresh, col_limit = st.columns([1, 1])
+    
     # Yenile butonu
-    if st.button("🔄 Yenile", key="refresh_words"):
-        st.rerun()
+    with col_refresh:
+        if st.button("🔄 Yenile", key="refresh_words"):
+            st.rerun()
+    
+    with col_limit:
+        pending_limit = st.selectbox(
+            "Listelenecek kelime sayısı",
+            options=[50, 200, 500],
+            key="pending_words_limit"
+        )
     
-    pending_words = get_pending_words(limit=50)
+    pending_words = get_pending_words(limit=pending_limit)
     
     if not pending_words:
         st.success("✅ Bekleyen kelime yok!")
     else:
         st.info(f"📨 {len(pending_words)} kelime onay bekliyor")
         
+        # ---------- Toplu moderasyon ----------
+        def _toggle_all_words():
+            for w in pending_words:
+                st.session_state[f"select_word_{w.get('id')}"] = st.session_state.select_all_words
+        
+        selected_words = [
+            w for w in pending_words
+            if st.session_state.get(f"select_word_{w.get('id')}", False)
+        ]
+        
+        bulk_col1, bulk_col2, bulk_col3 = st.columns([1, 1, 1])
+        
+        with bulk_col1:
+            st.checkbox("☑️ Tümünü Seç", key="select_all_words", on_change=_toggle_all_words)
+        
+        with bulk_col2:
+            if st.button(f"✅ Seçilenleri Onayla ({len(selected_words)})", key="bulk_approve",
+                         type="primary", disabled=not selected_words, use_container_width=True):
+                result = apply_bulk_word_moderation(selected_words, "approve", admin["id"])
+                if result["success"]:
+                    for w in selected_words:
+                        st.session_state.pop(f"select_word_{w.get('id')}", None)
+                    st.session_state.pop("select_all_words", None)
+                    st.toast(f"✅ {result['count']} kelime onaylandı ({result['contributors']} katkıcı)", icon="📚")
+                    st.rerun()
+                else:
+                    st.error("Toplu onaylama başarısız!")
+        
+        with bulk_col3:
+            if st.button(f"❌ Seçilenleri Reddet ({len(selected_words)})", key="bulk_reject",
+                         disabled=not selected_words, use_container_width=True):
+                result = apply_bulk_word_moderation(
+                    selected_words, "reject", admin["id"], reason="Admin tarafından reddedildi"
+                )
+                if result["success"]:
+                    for w in selected_words:
+                        st.session_state.pop(f"select_word_{w.get('id')}", None)
+                    st.session_state.pop("select_all_words", None)
+                    st.toast(f"{result['count']} kelime reddedildi.", icon="❌")
+                    st.rerun()
+                else:
+                    st.error("Toplu reddetme başarısız!")
+        
+        st.markdown("---")
+        
         for word in pending_words:
             word_type_info = WORD_TYPES.get(word.get("type", "noun"), WORD_TYPES["noun"])
             diff_info = DIFFICULTY_LEVELS.get(word.get("difficulty", 3), DIFFICULTY_LEVELS[3])
             
-            with st.expander(f"**{word.get('english', '')}** - {word.get('turkish', '')} (Ekleyen: {word.get('addedByName', 'Anonim')})"):
+            select_col, word_col = st.columns([0.05, 0.95])
+            
+            with select_col:
+                st.checkbox("Seç", key=f"select_word_{word.get('id')}", label_visibility="collapsed")
+            
+            with word_col, st.expander(f"**{word.get('english', '')}** - {word.get('turkish', '')} (Ekleyen: {word.get('addedByName', 'Anonim')})"):
                 col1, col2 = st.columns(2)
                 
                 with col1:
@@ -158,6 +217,15 @@ with tab2:
             with st.expander(f"**{trick.get('title', '')}** ({cat_info['icon']} {cat_info['name']}) - Ekleyen: {trick.get('addedByName', 'Anonim')}"):
                 st.markdown(f"**Kategori:** {cat_info['icon']} {cat_info['name']}")
                 
+                duplicates = trick.get('possibleDuplicates', [])
+                if duplicates:
+                    st.warning(
+                        "⚠️ **Olası kopya:** " + ", ".join(
+                            f"{d.get('title', '')} (%{int(d.get('similarity', 0) * 100)})"
+                            for d in duplicates
+                        )
+                    )
+                
                 related = trick.get('relatedWords', [])
                 if related:
                     st.markdown(f"**İlgili Kelimeler:** {', '.join(related)}")
@@ -191,15 +259,40 @@ with tab3:
     st.subheader("👥 Kullanıcı Yönetimi")
     
     # Import güncelleme
-    from services.firebase_service import update_user_role
+    from services.firebase_service import update_user_role, list_users
+    
+    USERS_PAGE_SIZE = 25
+    
+    # Sayfalama durumu: her sayfanın başlangıç cursor'ı bir yığında tutulur
+    if "user_dir_cursors" not in st.session_state:
+        st.session_state.user_dir_cursors = [None]
+    if "user_dir_search" not in st.session_state:
+        st.session_state.user_dir_search = ""
+    
+    user_search = st.text_input(
+        "🔍 Kullanıcı Ara",
+        placeholder="İsim veya e-posta başlangıcı...",
+        key="user_dir_search_input"
+    )
     
-    users = get_leaderboard(limit=50)
+    # Arama değiştiyse ilk sayfaya dön
+    if user_search != st.session_state.user_dir_search:
+        st.session_state.user_dir_search = user_search
+        st.session_state.user_dir_cursors = [None]
+    
+    page_no = len(st.session_state.user_dir_cursors)
+    page = list_users(
+        page_size=USERS_PAGE_SIZE,
+        cursor=st.session_state.user_dir_cursors[-1],
+        search=user_search
+    )
+    users = page["users"]
     current_user_id = admin.get("id") if admin else None
     
     if not users:
-        st.info("Henüz kullanıcı yok.")
+        st.info("Kullanıcı bulunamadı." if user_search else "Henüz kullanıcı yok.")
     else:
-        st.info(f"👥 {len(users)} kullanıcı")
+        st.info(f"👥 Sayfa {page_no} - {len(users)} kullanıcı")
         
         # Tablo başlıkları
         header_cols = st.columns([0.5, 2, 1.5, 1, 1, 1.5])
@@ -219,7 +312,9 @@ with tab3:
         
         st.markdown("---")
         
-        for i, user in enumerate(users, 1):
+        first_rank = (page_no - 1) * USERS_PAGE_SIZE + 1
+        
+        for i, user in enumerate(users, first_rank):
             user_id = user.get("id", "")
             is_self = user_id == current_user_id
             role = user.get("role", "user")
@@ -266,6 +361,23 @@ with tab3:
                             st.rerun()
                         else:
                             st.error("❌ İşlem başarısız!")
+    
+    # Sayfa navigasyonu
+    st.markdown("---")
+    nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+    
+    with nav_col1:
+        if st.button("⬅️ Önceki", use_container_width=True, disabled=page_no == 1, key="users_prev"):
+            st.session_state.user_dir_cursors.pop()
+            st.rerun()
+    
+    with nav_col2:
+        st.markdown(f"<div style='text-align: center;'>Sayfa {page_no}</div>", unsafe_allow_html=True)
+    
+    with nav_col3:
+        if st.button("Sonraki ➡️", use_container_width=True, disabled=page["next_cursor"] is None, key="users_next"):
+            st.session_state.user_dir_cursors.append(page["next_cursor"])
+            st.rerun()
 
 # Sistem bilgisi
 st.markdown("---")
@@ -297,6 +409,25 @@ with col3:
     st.write(f"Giriş: {admin.get('displayName', 'Admin')}")
     st.write(f"E-posta: {admin.get('email', '')}")
 
+# Başlangıç süreleri
+from utils.startup_timing import get_timing_report
+
+with st.expander("⏱️ Başlangıç Süreleri"):
+    timing = get_timing_report()
+    st.write(f"Süreç çalışma süresi: {timing['uptime_s']} sn")
+    
+    st.markdown("**İlk Çizim (ms)**")
+    if timing["first_paint"]:
+        st.json(timing["first_paint"])
+    else:
+        st.caption("Henüz ölçüm yok.")
+    
+    st.markdown("**SDK Import Süreleri (ms)**")
+    if timing["imports"]:
+        st.json(timing["imports"])
+    else:
+        st.caption("Henüz yüklenen SDK yok.")
+
 # Kelime yükleme bölümü
 st.markdown("---")
 st.subheader("📚 Başlangıç Kelimeleri Yükle")
@@ -318,8 +449,10 @@ with col2:
                 loaded_count = initialize_words_from_json(json_path)
                 if loaded_count > 0:
                     st.success(f"✅ {loaded_count} kelime başarıyla yüklendi!")
-                    # Cache'i temizle
+                    # Cache'i temizle (diğer sunucu süreçleri dahil)
+                    from services.cache_service import invalidate_cache_tags
                     st.cache_data.clear()
+                    invalidate_cache_tags("words", "stats")
                     st.rerun()
                 else:
                     st.warning("Tüm kelimeler zaten mevcut veya yükleme yapılamadı.")
@@ -17,8 +17,11 @@ import components.auth as auth
 auth.check_auth()
 
 # Imports
-from services.firebase_service import update_user_name, change_user_password, get_user
+from services.firebase_service import update_user_name, update_user_timezone, change_user_password, get_user
+from services.streak_service import get_user_timezone
+from utils.constants import STREAK_SETTINGS
 from utils.helpers import init_session_state
+from utils.theme import inject_styles
 
 # Session state başlat
 init_session_state()
@@ -26,50 +29,7 @@ init_session_state()
 user = auth.get_current_user()
 
 # Custom CSS
-st.markdown("""
-<style>
-.profile-header {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    padding: 30px;
-    border-radius: 20px;
-    color: white;
-    text-align: center;
-    margin-bottom: 30px;
-}
-.profile-avatar {
-    width: 100px;
-    height: 100px;
-    border-radius: 50%;
-    border: 4px solid white;
-    margin-bottom: 15px;
-}
-.profile-name {
-    font-size: 24px;
-    font-weight: 700;
-    margin-bottom: 5px;
-}
-.profile-email {
-    font-size: 14px;
-    opacity: 0.9;
-}
-.stat-box {
-    background: rgba(102, 126, 234, 0.1);
-    padding: 20px;
-    border-radius: 12px;
-    text-align: center;
-    border: 1px solid rgba(102, 126, 234, 0.3);
-}
-.stat-value {
-    font-size: 28px;
-    font-weight: 700;
-    color: #667eea;
-}
-.stat-label {
-    font-size: 14px;
-    color: #a0aec0;
-}
-</style>
-""", unsafe_allow_html=True)
+inject_styles("profile")
 
 # Ana içerik
 st.title("👤 Profilim")
@@ -152,6 +112,19 @@ with tab1:
             label_visibility="collapsed"
         )
         
+        st.markdown("##### Saat Dilimi")
+        current_timezone = get_user_timezone(user)
+        timezone_options = list(STREAK_SETTINGS["timezones"])
+        if current_timezone not in timezone_options:
+            timezone_options.insert(0, current_timezone)
+        new_timezone = st.selectbox(
+            "Saat Dilimi",
+            options=timezone_options,
+            index=timezone_options.index(current_timezone),
+            help="Günlük seri (streak) bu saat dilimindeki gün değişimine göre hesaplanır",
+            label_visibility="collapsed"
+        )
+        
         st.markdown("")
         
         update_submitted = st.form_submit_button(
@@ -161,18 +134,29 @@ with tab1:
         )
         
         if update_submitted:
+            name_changed = new_name.strip() != user.get("displayName", "")
+            timezone_changed = new_timezone != current_timezone
+            
             if not new_name or len(new_name.strip()) < 2:
                 st.error("❌ İsim en az 2 karakter olmalı.")
-            elif new_name.strip() == user.get("displayName", ""):
-                st.warning("⚠️ İsim aynı, değişiklik yapılmadı.")
+            elif not name_changed and not timezone_changed:
+                st.warning("⚠️ Bilgiler aynı, değişiklik yapılmadı.")
             else:
-                result = update_user_name(user.get("id"), new_name.strip())
+                result = {"success": True}
+                
+                if name_changed:
+                    result = update_user_name(user.get("id"), new_name.strip())
+                    if result["success"]:
+                        # Session state'i güncelle
+                        st.session_state.user["displayName"] = new_name.strip()
+                        st.session_state.user["photoURL"] = f"https://ui-avatars.com/api/?name={new_name.replace(' ', '+')}&background=667eea&color=fff&size=128"
+                
+                if result["success"] and timezone_changed:
+                    result = update_user_timezone(user.get("id"), new_timezone)
+                    if result["success"]:
+                        st.session_state.user["timezone"] = new_timezone
                 
                 if result["success"]:
-                    # Session state'i güncelle
-                    st.session_state.user["displayName"] = new_name.strip()
-                    st.session_state.user["photoURL"] = f"https://ui-avatars.com/api/?name={new_name.replace(' ', '+')}&background=667eea&color=fff&size=128"
-                    
                     st.success("✅ Bilgiler başarıyla güncellendi!")
                     st.balloons()
                     
@@ -219,12 +203,9 @@ with tab2:
                 result = change_user_password(user.get("id"), new_password)
                 
                 if result["success"]:
-                    st.success("✅ Şifre başarıyla değiştirildi! Yeniden giriş yapmanız gerekiyor.")
-                    
-                    # Kullanıcıyı çıkış yaptır
-                    import time
-                    time.sleep(1)
+                    # Kullanıcıyı çıkış yaptır, mesaj giriş ekranında gösterilir
                     auth.logout()
+                    st.session_state.auth_notice = "✅ Şifre başarıyla değiştirildi! Yeniden giriş yapmanız gerekiyor."
                     st.rerun()
                 else:
                     st.error(f"❌ Hata: {result['error']}")
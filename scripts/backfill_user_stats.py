@@ -0,0 +1,58 @@
+"""
+Rozet düzeltme işi
+
+Rozet eşikleri değiştiğinde mevcut kullanıcılara hak ettikleri rozetleri
+ekler. Yarıda kalırsa veya bazı yazmalar başarısız olursa aynı komutla
+kaldığı yerden devam eder.
+
+Kullanım (proje kök dizininden):
+    python -m scripts.backfill_user_stats
+    python -m scripts.backfill_user_stats --dry-run
+    python -m scripts.backfill_user_stats --reset --page-size 1000
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.backfill_service import run_backfill
+from utils.constants import BACKFILL_SETTINGS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kullanıcı rozetlerini yeniden hesapla")
+    parser.add_argument("--checkpoint", default=BACKFILL_SETTINGS["checkpoint_path"], help="Checkpoint dosyası")
+    parser.add_argument("--page-size", type=int, default=BACKFILL_SETTINGS["page_size"], help="Sayfa başına kullanıcı")
+    parser.add_argument("--max-pages", type=int, default=None, help="En fazla işlenecek sayfa")
+    parser.add_argument("--dry-run", action="store_true", help="Yazmadan sadece değişecek kullanıcıları say")
+    parser.add_argument("--reset", action="store_true", help="Checkpoint'i silip baştan başla")
+    args = parser.parse_args()
+    
+    if args.reset and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    
+    def report(checkpoint):
+        print(
+            f"{checkpoint['processed']} kullanıcı işlendi, "
+            f"{checkpoint['updated']} güncellendi, {checkpoint['failed']} hata "
+            f"(son ID: {checkpoint['last_id']})"
+        )
+    
+    checkpoint = run_backfill(
+        checkpoint_path=args.checkpoint,
+        page_size=args.page_size,
+        dry_run=args.dry_run,
+        max_pages=args.max_pages,
+        on_page=report
+    )
+    
+    if checkpoint.get("done"):
+        print("✅ Tamamlandı")
+    else:
+        print(f"⏸️ Durduruldu - devam etmek için aynı komutu tekrar çalıştırın ({args.checkpoint})")
+
+
+if __name__ == "__main__":
+    main()
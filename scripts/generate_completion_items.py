@@ -0,0 +1,52 @@
+"""
+Cümle tamamlama soru havuzu üretme işi
+
+Onaylı kelimelerin completionItems havuzunu Groq ile toplu olarak
+doldurur; quiz başlarken canlı LLM çağrısı yapılmaz. Havuzu dolu
+kelimeler atlandığı için yarıda kalırsa aynı komutla tekrar çalıştırılabilir.
+
+Kullanım (proje kök dizininden):
+    python -m scripts.generate_completion_items
+    python -m scripts.generate_completion_items --dry-run
+    python -m scripts.generate_completion_items --per-word 5 --max-pages 2
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.completion_service import fill_completion_pool
+from utils.constants import COMPLETION_POOL
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cümle tamamlama soru havuzunu doldur")
+    parser.add_argument("--per-word", type=int, default=COMPLETION_POOL["items_per_word"], help="Kelime başına hedef soru sayısı")
+    parser.add_argument("--page-size", type=int, default=COMPLETION_POOL["page_size"], help="Sayfa başına kelime")
+    parser.add_argument("--max-pages", type=int, default=None, help="En fazla işlenecek sayfa")
+    parser.add_argument("--dry-run", action="store_true", help="Üretmeden sadece eksik havuzları say")
+    args = parser.parse_args()
+    
+    def report(stats):
+        print(
+            f"{stats['scanned']} kelime tarandı, {stats['requested']} kelime için soru istendi, "
+            f"{stats['added']} soru eklendi, {stats['rejected']} soru reddedildi"
+        )
+    
+    stats = fill_completion_pool(
+        per_word=args.per_word,
+        page_size=args.page_size,
+        dry_run=args.dry_run,
+        max_pages=args.max_pages,
+        on_page=report
+    )
+    
+    action = "soru üretilecek" if args.dry_run else "soru eklendi"
+    count = stats["requested"] if args.dry_run else stats["added"]
+    print(f"✅ Tamamlandı - {count} {'kelime için ' if args.dry_run else ''}{action}")
+
+
+if __name__ == "__main__":
+    main()
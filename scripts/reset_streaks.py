@@ -0,0 +1,37 @@
+"""
+Kırılan streak'leri sıfırlama işi (gece çalıştırılır)
+
+Süresi dolmuş streak'ler sıfırlanır; liderlik tablosu ve profil
+sayfası girişte yeniden hesaplama yapmadan doğru değeri gösterir.
+Saat dilimi farklı kullanıcılar varsa saatlik çalıştırmak da güvenlidir.
+
+Kullanım (proje kök dizininden):
+    python -m scripts.reset_streaks
+    python -m scripts.reset_streaks --dry-run
+
+Örnek cron (her gece 00:05, İstanbul):
+    5 0 * * * cd /app && python -m scripts.reset_streaks
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.streak_service import reset_broken_streaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Süresi dolmuş streak'leri sıfırla")
+    parser.add_argument("--dry-run", action="store_true", help="Yazmadan sadece sıfırlanacak kullanıcıları say")
+    args = parser.parse_args()
+    
+    stats = reset_broken_streaks(dry_run=args.dry_run)
+    
+    action = "sıfırlanacak" if args.dry_run else "sıfırlandı"
+    print(f"✅ {stats['reset']} streak {action}, {stats['skipped']} kullanıcı atlandı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Kelime snapshot'ı oluşturma işi
+
+Onaylı kelimelerin tamamını Firestore'dan okuyup sunucu süreçlerinin
+mmap ile paylaştığı sütunlu snapshot dosyasını baştan yazar. Dosya
+oluşturulduktan sonra onay/red ve içerik güncellemeleri uygulama
+tarafından dosyaya işlenir; bu komut ilk kurulumda veya dosyayı
+tamamen yenilemek için çalıştırılır.
+
+Kullanım (proje kök dizininden):
+    python -m scripts.write_vocabulary_snapshot
+    python -m scripts.write_vocabulary_snapshot --path /srv/lingua/vocabulary.snapshot
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.vocabulary_snapshot_service import build_vocabulary_snapshot
+from utils.constants import VOCABULARY_SNAPSHOT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Onaylı kelimelerin snapshot dosyasını yaz")
+    parser.add_argument("--path", default=VOCABULARY_SNAPSHOT["path"], help="Snapshot dosyası")
+    args = parser.parse_args()
+    
+    count = build_vocabulary_snapshot(args.path)
+    print(f"✅ Tamamlandı - {count} kelime {args.path} dosyasına yazıldı")
+
+
+if __name__ == "__main__":
+    main()
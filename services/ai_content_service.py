@@ -0,0 +1,150 @@
+"""
+AI Content Service
+Process-wide cache and background prefetch for per-word AI content
+"""
+
+import streamlit as st
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.constants import FLASHCARD_AI
+from services.cache_service import shared_cache
+
+# İçerik türü -> üretici
+CONTENT_KINDS = ("sentence", "hint")
+
+
+@shared_cache(ttl=FLASHCARD_AI["shared_ttl"], tags=("ai_content",), cache_none=False)
+def _generate_content(kind: str, english: str, word_type: str, turkish: str) -> Optional[Any]:
+    """İçeriği Groq ile üret; sonuç tüm sunucu süreçleriyle paylaşılır"""
+    from services.groq_service import generate_example_sentence, get_ai_hint
+    
+    if kind == "sentence":
+        return generate_example_sentence(english, word_type, turkish)
+    return get_ai_hint(english, f"Türkçe anlamı: {turkish}")
+
+
+def _generate(kind: str, word: Dict[str, Any]) -> Optional[Any]:
+    """İçeriği getir veya üret (arka plan thread'inde çalışır)"""
+    return _generate_content(
+        kind,
+        word.get("english", ""),
+        word.get("type", "noun"),
+        word.get("turkish", "")
+    )
+
+
+def _failed(future: Future) -> bool:
+    """Üretim iptal edildi, hata ile veya boş sonuçla bitti mi"""
+    if not future.done():
+        return False
+    if future.cancelled():
+        return True
+    return future.exception() is not None or future.result() is None
+
+
+class AIContentCache:
+    """
+    Kelime başına AI içeriğinin (örnek cümle, ipucu) süreç geneli önbelleği
+    
+    Her içerik bir Future olarak tutulur; aynı kelime için eşzamanlı
+    istekler tek API çağrısını paylaşır. Kayıtlar LRU sırasıyla sınırlanır,
+    başarısız üretimler tekrar denenebilsin diye atılır; LRU'dan düşen ve
+    henüz başlamamış üretimler iptal edilir.
+    
+    Üretimler ortak arka plan havuzunu meşgul etmesin diye kendi küçük
+    havuzunda çalışır. Ön yükleme kuyruğu sınırlıdır, doluysa ön yükleme
+    atlanır; kullanıcının doğrudan istediği içerik her zaman kuyruğa girer.
+    """
+    
+    def __init__(self, max_size: int, max_workers: int, max_queue: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._futures: "OrderedDict[Tuple[str, str], Future]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-content")
+        self._prefetch_slots = threading.BoundedSemaphore(max_workers + max_queue)
+    
+    @staticmethod
+    def _key(kind: str, word: Dict[str, Any]) -> Tuple[str, str]:
+        return kind, word.get("id") or word.get("english", "")
+    
+    def request(self, kind: str, word: Dict[str, Any], prefetch: bool = False) -> Optional[Future]:
+        """
+        İçeriğin Future'ı (yoksa arka planda üretimi başlatır)
+        
+        Args:
+            prefetch: True ise ön yükleme kuyruğu doluyken üretim başlatılmaz
+        
+        Returns:
+            Future veya None (ön yükleme kuyruğu dolu)
+        """
+        key = self._key(kind, word)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not _failed(future):
+                self._futures.move_to_end(key)
+                return future
+            
+            if prefetch:
+                if not self._prefetch_slots.acquire(blocking=False):
+                    return None
+                future = self._executor.submit(_generate, kind, dict(word))
+                future.add_done_callback(lambda _: self._prefetch_slots.release())
+            else:
+                future = self._executor.submit(_generate, kind, dict(word))
+            
+            self._futures[key] = future
+            while len(self._futures) > self._max_size:
+                _, evicted = self._futures.popitem(last=False)
+                evicted.cancel()
+            return future
+    
+    def get(self, kind: str, word: Dict[str, Any], timeout: Optional[float] = None) -> Optional[Any]:
+        """İçeriği getir; hazır değilse en fazla timeout kadar bekle"""
+        future = self.request(kind, word)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
+        except Exception:
+            return None
+    
+    def prefetch(self, words: List[Dict[str, Any]]):
+        """Kelimelerin tüm içerik türlerini arka planda üretmeye başla"""
+        for word in words:
+            for kind in CONTENT_KINDS:
+                self.request(kind, word, prefetch=True)
+
+
+@st.cache_resource
+def get_ai_content_cache() -> AIContentCache:
+    """Süreç genelinde paylaşılan AI içerik önbelleği"""
+    return AIContentCache(
+        FLASHCARD_AI["cache_size"],
+        FLASHCARD_AI["max_workers"],
+        FLASHCARD_AI["prefetch_queue"]
+    )
+
+
+def prefetch_ai_content(words: List[Dict[str, Any]]):
+    """Sıradaki kartların AI içeriğini arka planda hazırla"""
+    from services.groq_service import check_groq_availability
+    
+    # Onayda zenginleştirilmiş kelimelerin içeriği zaten dokümanda
+    words = [w for w in words if not w.get("enrichment")]
+    
+    # İstemci ana thread'de oluşturulur; arka plan görevleri önbellekten alır
+    if words and check_groq_availability():
+        get_ai_content_cache().prefetch(words)
+
+
+def get_example_sentence(word: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """Kelimenin örnek cümlesi (ön yüklendiyse beklemeden)"""
+    return get_ai_content_cache().get("sentence", word, FLASHCARD_AI["wait_timeout"])
+
+
+def get_memory_hint(word: Dict[str, Any]) -> Optional[str]:
+    """Kelimenin hafıza ipucu (ön yüklendiyse beklemeden)"""
+    return get_ai_content_cache().get("hint", word, FLASHCARD_AI["wait_timeout"])
@@ -0,0 +1,209 @@
+"""
+Backfill Service
+Resumable offline recomputation of user badges and legacy fields
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Callable, Set
+
+import numpy as np
+
+from utils.constants import BADGE_STAT_FIELDS, BACKFILL_SETTINGS
+from utils.helpers import get_zone, normalize_search_text, to_local_date
+
+# Backfill'in okuduğu kullanıcı alanları
+BACKFILL_FIELDS = sorted(set(BADGE_STAT_FIELDS.values()) | {
+    "points", "badges", "displayName", "nameKey",
+    "lastActiveDate", "lastActiveDay", "streakExpiresAt", "timezone"
+})
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Kaldığı yeri oku (dosya yoksa baştan başlanır)"""
+    if not os.path.exists(path):
+        return {"last_id": None, "processed": 0, "updated": 0, "failed": 0}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]):
+    """Checkpoint'i atomik olarak yaz (yarım dosya kalmasın)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def compute_user_updates(users: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Bir sayfa kullanıcının eksik rozetlerini vektörel olarak hesapla
+    
+    Her rozet türü için kullanıcı değerleri tek dizide toplanır ve
+    artan eşiklerde np.searchsorted ile kaç rozetin hak edildiği bulunur.
+    Kazanılmış rozetler geri alınmaz; "badges" sadece eklenecek rozetleri
+    içerir ve ArrayUnion ile yazılır (canlı rozet yazmaları ezilmesin).
+    Seviye saklanmaz, her zaman puandan hesaplanır. Arama anahtarı (nameKey) ve streak
+    kırılma zamanı (streakExpiresAt) eksik eski kayıtlar da aynı geçişte
+    tamamlanır.
+    
+    Returns:
+        {user_id: {alan: yeni değer}} - sadece değişenler
+    """
+    from services.gamification_service import get_badge_rules
+    
+    if not users:
+        return {}
+    
+    earned_badges: List[List[str]] = [[] for _ in users]
+    for badge_type, (thresholds, badge_ids) in get_badge_rules().families().items():
+        field = BADGE_STAT_FIELDS[badge_type]
+        values = np.fromiter((u.get(field) or 0 for u in users), dtype=np.float64, count=len(users))
+        earned_counts = np.searchsorted(np.asarray(thresholds, dtype=np.float64), values, side="right")
+        for i in np.flatnonzero(earned_counts):
+            earned_badges[i].extend(badge_ids[:earned_counts[i]])
+    
+    updates = {}
+    for i, user in enumerate(users):
+        current = user.get("badges") or []
+        missing = [b for b in earned_badges[i] if b not in current]
+        
+        update = {}
+        if missing:
+            update["badges"] = missing
+        name_key = normalize_search_text(user.get("displayName", ""))
+        if user.get("nameKey") != name_key:
+            update["nameKey"] = name_key
+        update.update(_legacy_streak_update(user))
+        if update:
+            updates[user["id"]] = update
+    return updates
+
+
+def _legacy_streak_update(user: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    streakExpiresAt'i olmayan aktif streak'ler için alanları tamamla
+    
+    Süresi çoktan dolmuş streak'ler doğrudan sıfırlanır; diğerleri gece
+    işinin sorgusuna dahil olsun diye kırılma zamanı yazılır.
+    """
+    from services.streak_service import get_user_timezone, streak_expires_at
+    
+    if not user.get("currentStreak") or user.get("streakExpiresAt"):
+        return {}
+    
+    timezone_name = get_user_timezone(user)
+    last_day = to_local_date(user.get("lastActiveDay") or user.get("lastActiveDate"), get_zone(timezone_name))
+    if last_day is None:
+        return {"currentStreak": 0}
+    
+    expires_at = streak_expires_at(last_day, timezone_name)
+    if expires_at <= datetime.now(timezone.utc):
+        return {"currentStreak": 0}
+    return {"lastActiveDay": last_day.isoformat(), "streakExpiresAt": expires_at}
+
+
+def _failed_ids(failures: List[Any]) -> Set[str]:
+    """BulkWriter hatalarından başarısız doküman ID'leri"""
+    return {failure.operation.reference.id for failure in failures}
+
+
+def run_backfill(
+    checkpoint_path: str = BACKFILL_SETTINGS["checkpoint_path"],
+    page_size: int = BACKFILL_SETTINGS["page_size"],
+    dry_run: bool = False,
+    max_pages: Optional[int] = None,
+    on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Tüm kullanıcıların rozetlerini yeniden hesapla ve yaz
+    
+    Kullanıcılar ID sırasıyla sayfa sayfa okunur; her sayfanın yazmaları
+    BulkWriter ile gönderilip flush edildikten sonra checkpoint, yazması
+    başarılı olan son kesintisiz ID'ye ilerler. Bir yazma başarısız
+    olursa checkpoint o kullanıcıdan önce durur; iş sonuna kadar devam
+    eder ama "done" işaretlenmez, bir sonraki çalıştırma başarısız
+    kullanıcıdan itibaren tekrar dener. Yazmalar idempotent olduğu için
+    sayfaların tekrar işlenmesi sorun değildir.
+    
+    Args:
+        checkpoint_path: Checkpoint dosyası
+        page_size: Sayfa başına kullanıcı
+        dry_run: True ise sadece sayar, yazmaz
+        max_pages: En fazla işlenecek sayfa (None = hepsi)
+        on_page: Her sayfadan sonra checkpoint ile çağrılır (ilerleme)
+    
+    Returns:
+        Son checkpoint (processed, updated, failed, last_id, done)
+    """
+    from services.firebase_service import get_users_page, get_bulk_writer, get_db
+    
+    checkpoint = load_checkpoint(checkpoint_path)
+    if checkpoint.get("done"):
+        return checkpoint
+    
+    db = get_db()
+    if not db:
+        raise RuntimeError("Firebase bağlantısı kurulamadı")
+    
+    from services.firebase_service import firestore
+    
+    failures = []
+    writer = None if dry_run else get_bulk_writer(on_error=failures.append)
+    pages = 0
+    # Okuma cursor'ı; checkpoint["last_id"] ilk başarısız yazmada durur
+    cursor = checkpoint["last_id"]
+    blocked = False
+    reached_end = False
+    
+    try:
+        while max_pages is None or pages < max_pages:
+            users = get_users_page(page_size, cursor, fields=BACKFILL_FIELDS)
+            if not users:
+                reached_end = True
+                break
+            
+            updates = compute_user_updates(users)
+            if writer is not None:
+                for user_id, update in updates.items():
+                    if "badges" in update:
+                        update = dict(update, badges=firestore.ArrayUnion(update["badges"]))
+                    writer.update(db.collection("users").document(user_id), update)
+                # Checkpoint ancak sayfanın yazmaları tamamlanınca ilerler
+                writer.flush()
+            
+            failed_ids = _failed_ids(failures)
+            if not blocked:
+                for user in users:
+                    if user["id"] in failed_ids:
+                        blocked = True
+                        break
+                    checkpoint["last_id"] = user["id"]
+            cursor = users[-1]["id"]
+            checkpoint["processed"] += len(users)
+            checkpoint["updated"] += len(updates)
+            checkpoint["failed"] += len(failures)
+            checkpoint["updatedAt"] = time.time()
+            failures.clear()
+            pages += 1
+            
+            if not dry_run:
+                save_checkpoint(checkpoint_path, checkpoint)
+            if on_page:
+                on_page(checkpoint)
+            
+            if len(users) < page_size:
+                reached_end = True
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    if reached_end and not blocked:
+        checkpoint["done"] = True
+    
+    if not dry_run:
+        save_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint
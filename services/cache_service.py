@@ -0,0 +1,335 @@
+"""
+Cache Service
+Pluggable cache backends shared across Streamlit server processes
+"""
+
+import streamlit as st
+import functools
+from abc import ABC, abstractmethod
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from utils.constants import SHARED_CACHE
+
+# Önbellekte bulunamadı işareti (None da geçerli bir değer olabilir)
+MISS = object()
+
+
+class CacheBackend(ABC):
+    """
+    Önbellek arka ucu arayüzü
+    
+    Değerler pickle edilmiş bayt olarak saklanır; her okuma yeni bir kopya
+    döndürür (st.cache_data ile aynı davranış). Her kayıt bir son kullanma
+    anı ve sıfır veya daha fazla etiket taşır; etiket geçersiz kılındığında
+    o etiketi taşıyan tüm kayıtlar silinir.
+    """
+    
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Kayıtlı değer (yoksa veya süresi dolduysa MISS)"""
+    
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()):
+        """Değeri ttl saniyeliğine (None = süresiz) etiketleriyle kaydet"""
+    
+    @abstractmethod
+    def invalidate_tags(self, *tags: str) -> int:
+        """Etiketlerden birini taşıyan kayıtları sil; silinen kayıt sayısı"""
+    
+    @abstractmethod
+    def clear(self):
+        """Tüm kayıtları sil"""
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    return time.time() + ttl if ttl is not None else None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Tek süreçlik önbellek (tek sunuculu kurulum ve testler için)
+    
+    Kayıtlar LRU sırasıyla max_entries ile sınırlanır.
+    """
+    
+    def __init__(self, max_entries: int = SHARED_CACHE["max_entries"]):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float], Tuple[str, ...]]]" = OrderedDict()
+        self._tagged: Dict[str, Set[str]] = {}
+    
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            payload, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._remove_locked(key)
+                return MISS
+            self._entries.move_to_end(key)
+        return pickle.loads(payload)
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        tags = tuple(tags)
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = (payload, _expires_at(ttl), tags)
+            for tag in tags:
+                self._tagged.setdefault(tag, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove_locked(next(iter(self._entries)))
+    
+    def invalidate_tags(self, *tags: str) -> int:
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._tagged.get(tag, ()))
+            for key in keys:
+                self._remove_locked(key)
+            return len(keys)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tagged.clear()
+    
+    def _remove_locked(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Aynı makinedeki tüm sunucu süreçlerinin paylaştığı SQLite dosyası
+    
+    Dosya WAL modunda açılır; okumalar yazmaları beklemez. Süre, boyut
+    sınırı ve etiketler tablodadır, bu yüzden bir süreçte yapılan
+    geçersiz kılma diğer süreçlerde de hemen görülür. Boyut sınırı
+    aşıldığında en uzun süredir okunmayan kayıtlar silinir; okuma anı
+    her okumada değil en fazla touch_interval saniyede bir yazılır, bu
+    yüzden okumaların çoğu yazma transaction'ı açmaz. Bağlantılar thread
+    başınadır.
+    """
+    
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+        " expires_at REAL, accessed_at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)",
+        "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at)",
+        "CREATE TABLE IF NOT EXISTS tags ("
+        " tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))",
+        "CREATE INDEX IF NOT EXISTS tags_key ON tags (key)"
+    )
+    
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = SHARED_CACHE["max_entries"],
+        touch_interval: float = SHARED_CACHE["touch_interval"]
+    ):
+        self._path = path
+        self._max_entries = max_entries
+        self._touch_interval = touch_interval
+        self._local = threading.local()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        with conn:
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+    
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=SHARED_CACHE["busy_timeout"])
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def get(self, key: str) -> Any:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return MISS
+        
+        payload, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            with conn:
+                self._delete_keys(conn, [key])
+            return MISS
+        
+        # LRU sırası için kaba okuma anı yeterli
+        if now - accessed_at >= self._touch_interval:
+            with conn:
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return pickle.loads(payload)
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, _expires_at(ttl), time.time())
+            )
+            conn.execute("DELETE FROM tags WHERE key = ?", (key,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO tags (tag, key) VALUES (?, ?)",
+                [(tag, key) for tag in set(tags)]
+            )
+            self._evict(conn)
+    
+    def _evict(self, conn: sqlite3.Connection):
+        """Süresi dolanları ve sınırı aşan en eski kayıtları sil"""
+        expired = [row[0] for row in conn.execute(
+            "SELECT key FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )]
+        self._delete_keys(conn, expired)
+        
+        overflow = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self._max_entries
+        if overflow > 0:
+            oldest = [row[0] for row in conn.execute(
+                "SELECT key FROM entries ORDER BY accessed_at LIMIT ?", (overflow,)
+            )]
+            self._delete_keys(conn, oldest)
+    
+    @staticmethod
+    def _delete_keys(conn: sqlite3.Connection, keys: list):
+        if keys:
+            rows = [(key,) for key in keys]
+            conn.executemany("DELETE FROM entries WHERE key = ?", rows)
+            conn.executemany("DELETE FROM tags WHERE key = ?", rows)
+    
+    def invalidate_tags(self, *tags: str) -> int:
+        conn = self._conn()
+        with conn:
+            keys = set()
+            for tag in tags:
+                keys.update(row[0] for row in conn.execute("SELECT key FROM tags WHERE tag = ?", (tag,)))
+            self._delete_keys(conn, list(keys))
+        return len(keys)
+    
+    def clear(self):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM tags")
+
+
+@st.cache_resource
+def get_cache_backend() -> CacheBackend:
+    """
+    Yapılandırılan önbellek arka ucu
+    
+    secrets.toml'daki [cache] bölümü (backend, path, max_entries, touch_interval)
+    SHARED_CACHE varsayılanlarını ezer. SQLite dosyası açılamazsa süreç
+    içi önbelleğe düşülür.
+    """
+    config = dict(SHARED_CACHE)
+    try:
+        config.update(st.secrets.get("cache", {}))
+    except Exception:
+        pass
+    
+    if config["backend"] == "sqlite":
+        try:
+            return SQLiteCacheBackend(
+                config["path"],
+                int(config["max_entries"]),
+                float(config["touch_interval"])
+            )
+        except (sqlite3.Error, OSError):
+            pass
+    return MemoryCacheBackend(int(config["max_entries"]))
+
+
+def _cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    """Fonksiyon ve argümanlarından kalıcı anahtar üret"""
+    name = f"{func.__module__}.{func.__qualname__}"
+    payload = pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+    return f"{name}:{hashlib.sha1(payload).hexdigest()}"
+
+
+def shared_cache(
+    ttl: Optional[float] = None,
+    tags: Iterable[str] = (),
+    cache_none: bool = True
+) -> Callable:
+    """
+    st.cache_data yerine kullanılan, süreçler arası paylaşılan önbellek
+    
+    Sonuç fonksiyon adı ve argümanlarıyla anahtarlanır; kayıt verilen
+    etiketlerin yanında "fn:<modül>.<fonksiyon>" etiketini de taşır.
+    Sarmalanan fonksiyonun .clear() metodu st.cache_data'daki gibi sadece
+    o fonksiyonun kayıtlarını siler. Önbellek hatası çağrıyı bozmaz,
+    fonksiyon doğrudan çalıştırılır.
+    
+    Args:
+        ttl: Kaydın geçerlilik süresi (saniye, None = süresiz)
+        tags: invalidate_cache_tags ile topluca silinebilecek etiketler
+        cache_none: False ise None sonuçlar (ör. başarısız API çağrısı) saklanmaz
+    """
+    tags = tuple(tags)
+    
+    def decorator(func: Callable) -> Callable:
+        func_tag = f"fn:{func.__module__}.{func.__qualname__}"
+        entry_tags = tags + (func_tag,)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                backend = get_cache_backend()
+                key = _cache_key(func, args, kwargs)
+                value = backend.get(key)
+            except Exception:
+                return func(*args, **kwargs)
+            
+            if value is not MISS:
+                return value
+            
+            value = func(*args, **kwargs)
+            if value is not None or cache_none:
+                try:
+                    backend.set(key, value, ttl, entry_tags)
+                except Exception:
+                    pass
+            return value
+        
+        def clear():
+            invalidate_cache_tags(func_tag)
+        
+        wrapper.clear = clear
+        return wrapper
+    
+    return decorator
+
+
+def invalidate_cache_tags(*tags: str) -> int:
+    """Etiketli kayıtları tüm süreçler için sil"""
+    try:
+        return get_cache_backend().invalidate_tags(*tags)
+    except Exception:
+        return 0
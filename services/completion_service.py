@@ -0,0 +1,155 @@
+"""
+Completion Service
+Pre-generated, validated sentence-completion item pools per word
+"""
+
+from typing import Dict, Any, List, Optional, Callable
+
+from utils.constants import COMPLETION_POOL, ENRICHMENT
+
+# Havuz işinin okuduğu kelime alanları
+POOL_FIELDS = ["english", "turkish", "type", "completionItems"]
+
+
+def _clean(value: Any) -> str:
+    return str(value).strip() if value else ""
+
+
+def _is_form_of(candidate: str, english: str) -> bool:
+    """Aday, hedef kelimenin kendisi veya bir çekimi mi"""
+    from services.word_index_service import lemma_candidates
+    
+    candidate = candidate.lower()
+    if candidate == english:
+        return True
+    if " " in english or " " in candidate:
+        return False
+    return english in lemma_candidates(candidate)
+
+
+def validate_completion_item(word: Dict[str, Any], item: Any) -> Optional[Dict[str, Any]]:
+    """
+    Cümle tamamlama sorusunu doğrula
+    
+    Cümlede tek boşluk olmalı, doğru cevap hedef kelime (veya çekimi)
+    olmalı, şıklar 4 farklı ifade olmalı ve yanlış şıklardan hiçbiri
+    hedef kelimenin bir biçimi olmamalı.
+    
+    Returns:
+        Normalize edilmiş soru veya geçersizse None
+    """
+    if not isinstance(item, dict):
+        return None
+    
+    sentence = _clean(item.get("sentence"))
+    correct = _clean(item.get("correct"))
+    options = [_clean(o) for o in item.get("options") or []]
+    english = word.get("english", "").strip().lower()
+    
+    if sentence.count(ENRICHMENT["blank"]) != 1 or not english:
+        return None
+    if len(options) != 4 or "" in options or len({o.lower() for o in options}) != 4:
+        return None
+    if correct not in options or not _is_form_of(correct, english):
+        return None
+    if any(_is_form_of(o, english) for o in options if o != correct):
+        return None
+    
+    return {"sentence": sentence, "correct": correct, "options": options}
+
+
+def get_completion_items(word: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Kelimenin quiz'de kullanılabilir cümle tamamlama soruları"""
+    return [
+        item for item in word.get("completionItems") or []
+        if isinstance(item, dict) and item.get("correct") in (item.get("options") or [])
+    ]
+
+
+def _match_generated(words: List[Dict[str, Any]], results: List[Any]) -> Dict[str, List[Any]]:
+    """Model sonuçlarını kelime ID'lerine eşleştir"""
+    by_english = {}
+    for result in results:
+        if isinstance(result, dict) and isinstance(result.get("items"), list):
+            by_english.setdefault(_clean(result.get("english")).lower(), result["items"])
+    return {
+        word["id"]: by_english.get(word.get("english", "").strip().lower(), [])
+        for word in words
+    }
+
+
+def fill_completion_pool(
+    per_word: int = COMPLETION_POOL["items_per_word"],
+    page_size: int = COMPLETION_POOL["page_size"],
+    dry_run: bool = False,
+    max_pages: Optional[int] = None,
+    on_page: Optional[Callable[[Dict[str, int]], None]] = None
+) -> Dict[str, int]:
+    """
+    Onaylı kelimelerin cümle tamamlama havuzunu doldur (çevrimdışı iş)
+    
+    Kelimeler ID sırasıyla sayfa sayfa okunur; havuzunda per_word'den az
+    soru olan kelimeler COMPLETION_POOL["batch_size"]'lık gruplar halinde
+    tek istekle Groq'a gönderilir. Her soru doğrulanır, aynı cümleyi
+    içeren sorular atlanır ve kalanlar completionItems'a eklenir. Dolu
+    havuzlar tekrar üretilmediği için iş yarıda kesilirse baştan
+    çalıştırmak güvenlidir.
+    
+    Returns:
+        {"scanned", "requested", "added", "rejected"}
+    """
+    from services.firebase_service import get_approved_words_page, add_completion_items
+    from services.groq_service import generate_completion_items
+    
+    stats = {"scanned": 0, "requested": 0, "added": 0, "rejected": 0}
+    batch_size = COMPLETION_POOL["batch_size"]
+    start_after_id = None
+    pages = 0
+    
+    while max_pages is None or pages < max_pages:
+        words = get_approved_words_page(page_size, start_after_id, fields=POOL_FIELDS)
+        if not words:
+            break
+        
+        stats["scanned"] += len(words)
+        needing = [w for w in words if len(get_completion_items(w)) < per_word]
+        
+        for i in range(0, len(needing), batch_size):
+            batch = needing[i:i + batch_size]
+            stats["requested"] += len(batch)
+            if dry_run:
+                continue
+            
+            results = generate_completion_items(batch, per_word)
+            if not results:
+                continue
+            
+            generated = _match_generated(batch, results)
+            additions = {}
+            for word in batch:
+                existing = get_completion_items(word)
+                seen = {item["sentence"].lower() for item in existing}
+                missing = per_word - len(existing)
+                
+                new_items = []
+                for raw in generated[word["id"]]:
+                    item = validate_completion_item(word, raw)
+                    if item is None:
+                        stats["rejected"] += 1
+                    elif item["sentence"].lower() not in seen and len(new_items) < missing:
+                        seen.add(item["sentence"].lower())
+                        new_items.append(item)
+                if new_items:
+                    additions[word["id"]] = new_items
+            
+            if additions and add_completion_items(additions):
+                stats["added"] += sum(len(items) for items in additions.values())
+        
+        start_after_id = words[-1]["id"]
+        pages += 1
+        if on_page:
+            on_page(stats)
+        if len(words) < page_size:
+            break
+    
+    return stats
@@ -0,0 +1,105 @@
+"""
+Enrichment Service
+Approval-time AI content for words, generated in batched single calls
+"""
+
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional
+
+from utils.constants import ENRICHMENT
+
+
+def _clean(value: Any) -> str:
+    return str(value).strip() if value else ""
+
+
+def validate_enrichment(word: Dict[str, Any], item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Model çıktısını kelimeye yazılacak biçime getir
+    
+    Cümle ve çevirisi zorunludur; açıklama/ipucu boş olabilir. Geçersiz
+    cümle tamamlama sorusu atılır, içeriğin geri kalanı yine saklanır;
+    geçerli soru kelimenin completionItems havuzuna da eklenir.
+    """
+    sentence = _clean(item.get("sentence"))
+    translation = _clean(item.get("translation"))
+    if not sentence or not translation:
+        return None
+    
+    enrichment = {
+        "sentence": sentence,
+        "translation": translation,
+        "explanation": _clean(item.get("explanation")),
+        "hint": _clean(item.get("hint"))
+    }
+    from services.completion_service import validate_completion_item
+    
+    completion = validate_completion_item(word, item.get("completion"))
+    if completion:
+        enrichment["completion"] = completion
+    return enrichment
+
+
+def _match_items(words: List[Dict[str, Any]], items: List[Any]) -> List[Optional[Dict[str, Any]]]:
+    """Model sonuçlarını kelimelerle eşleştir (önce İngilizce yazıma göre)"""
+    by_english = {}
+    for item in items:
+        if isinstance(item, dict):
+            by_english.setdefault(_clean(item.get("english")).lower(), item)
+    
+    matched = [by_english.get(w.get("english", "").strip().lower()) for w in words]
+    if not any(matched) and len(items) == len(words):
+        # Model kelimeleri yazmadıysa sıraya güven
+        matched = [item if isinstance(item, dict) else None for item in items]
+    return matched
+
+
+def enrich_words(word_ids: List[str]) -> int:
+    """
+    Kelimeleri zenginleştir ve sonucu kelime dokümanına yaz
+    
+    Daha önce zenginleştirilmiş kelimeler atlanır; kalanlar
+    ENRICHMENT["batch_size"]'lık gruplar halinde tek istekle üretilir.
+    
+    Returns:
+        Zenginleştirilen kelime sayısı
+    """
+    from services.firebase_service import get_words_by_ids, update_word_enrichments
+    from services.groq_service import generate_word_enrichments
+    
+    words = [w for w in get_words_by_ids(word_ids) if not w.get("enrichment")]
+    batch_size = ENRICHMENT["batch_size"]
+    enriched = 0
+    
+    for i in range(0, len(words), batch_size):
+        batch = words[i:i + batch_size]
+        items = generate_word_enrichments(batch)
+        if not items:
+            continue
+        
+        enrichments = {}
+        for word, item in zip(batch, _match_items(batch, items)):
+            enrichment = validate_enrichment(word, item) if item else None
+            if enrichment:
+                enrichments[word["id"]] = enrichment
+        
+        if enrichments and update_word_enrichments(enrichments):
+            enriched += len(enrichments)
+    
+    return enriched
+
+
+def schedule_word_enrichment(word_ids: List[str]) -> Optional[Future]:
+    """
+    Onaylanan kelimeleri arka planda zenginleştir
+    
+    Returns:
+        Görevin Future'ı (AI servisi kullanılamıyorsa None)
+    """
+    from services.groq_service import check_groq_availability
+    from services.task_service import submit_task
+    
+    # İstemci ana thread'de oluşturulur; görev önbellekteki istemciyi kullanır
+    if not word_ids or not check_groq_availability():
+        return None
+    return submit_task(enrich_words, list(word_ids))
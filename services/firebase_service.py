@@ -5,16 +5,18 @@ Firestore CRUD operations for Lingua-AI
 
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import json
 
-# Firebase Admin SDK
-try:
-    import firebase_admin
-    from firebase_admin import credentials, firestore
-    FIREBASE_AVAILABLE = True
-except ImportError:
-    FIREBASE_AVAILABLE = False
+from utils.helpers import normalize_search_text
+from utils.lazy_import import lazy_module, is_module_available
+from services.cache_service import shared_cache, invalidate_cache_tags
+
+# Firebase Admin SDK (ilk kullanımda yüklenir)
+FIREBASE_AVAILABLE = is_module_available("firebase_admin")
+firebase_admin = lazy_module("firebase_admin")
+credentials = lazy_module("firebase_admin.credentials")
+firestore = lazy_module("firebase_admin.firestore")
 
 
 @st.cache_resource
@@ -69,38 +71,121 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_users(user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Birden fazla kullanıcıyı tek bir toplu okuma ile getir
+    
+    Returns:
+        {user_id: user_data} - bulunamayan kullanıcılar dahil edilmez
+    """
+    db = get_db()
+    if not db or not user_ids:
+        return {}
+    
+    try:
+        refs = [db.collection("users").document(uid) for uid in dict.fromkeys(user_ids)]
+        users = {}
+        for doc in db.get_all(refs):
+            if doc.exists:
+                data = doc.to_dict()
+                data["id"] = doc.id
+                users[doc.id] = data
+        return users
+    except Exception as e:
+        st.error(f"Kullanıcı getirme hatası: {str(e)}")
+        return {}
+
+
+def _normalize_email(email: str) -> str:
+    """E-posta adresini index anahtarı olarak kullanılacak forma getir"""
+    return email.strip().lower()
+
+
+def _user_id_for_email(email: str) -> str:
+    """E-posta adresinden deterministik kullanıcı ID'si üret"""
+    import hashlib
+    return hashlib.md5(email.encode()).hexdigest()[:20]
+
+
+def _get_legacy_user_doc(db, email: str):
+    """
+    Index öncesi oluşturulmuş kullanıcıyı where() sorgusu ile bul
+    
+    Sadece AUTH_SETTINGS["legacy_email_lookup"] açıkken çalışır. Bulunan
+    kullanıcı için index dokümanı yazılır, böylece bir sonraki girişte
+    sorguya gerek kalmaz.
+    """
+    from utils.constants import AUTH_SETTINGS
+    
+    if not AUTH_SETTINGS["legacy_email_lookup"]:
+        return None
+    
+    for doc in db.collection("users").where("email", "==", email).limit(1).stream():
+        db.collection("emails").document(email).set({"userId": doc.id})
+        return doc
+    return None
+
+
+def _get_user_doc_by_email(db, email: str):
+    """
+    Kullanıcı dokümanını e-posta ile doğrudan anahtar üzerinden bul
+    
+    Sırasıyla deterministik ID (`users/{md5(email)}`) ve `emails/{email}`
+    index dokümanı denenir; göç bayrağı açıksa son çare olarak eski where()
+    sorgusu da çalışır.
+    
+    Returns:
+        DocumentSnapshot veya None
+    """
+    user_doc = db.collection("users").document(_user_id_for_email(email)).get()
+    if user_doc.exists and user_doc.to_dict().get("email") == email:
+        return user_doc
+    
+    index_doc = db.collection("emails").document(email).get()
+    if index_doc.exists:
+        user_id = index_doc.to_dict().get("userId")
+        if user_id:
+            user_doc = db.collection("users").document(user_id).get()
+            if user_doc.exists:
+                return user_doc
+    
+    # Index öncesi oluşturulmuş kullanıcılar için geriye dönük arama
+    return _get_legacy_user_doc(db, email)
+
+
 def signup_user(email: str, password: str, display_name: str) -> Dict[str, Any]:
     """
     Yeni kullanıcı kaydı oluştur
     
+    E-posta index dokümanı ve kullanıcı dokümanı tek bir transaction içinde
+    oluşturulur; aynı e-posta ile eşzamanlı iki kayıt isteğinden sadece biri
+    başarılı olur. Varlık kontrolü sadece transaction içinde yapılır.
+    
     Returns:
         {"success": True, "user_id": "..."} veya {"success": False, "error": "..."}
     """
-    import hashlib
+    from services.password_service import hash_password
+    from utils.constants import STREAK_SETTINGS
     
     db = get_db()
     if not db:
         return {"success": False, "error": "Veritabanı bağlantısı kurulamadı"}
     
-    email = email.strip().lower()
+    email = _normalize_email(email)
     
     try:
-        # Email zaten kayıtlı mı kontrol et
-        existing = db.collection("users").where("email", "==", email).limit(1).stream()
-        if any(True for _ in existing):
-            return {"success": False, "error": "Bu e-posta adresi zaten kayıtlı"}
-        
         # Kullanıcı ID oluştur
-        user_id = hashlib.md5(email.encode()).hexdigest()[:20]
+        user_id = _user_id_for_email(email)
         
         # Şifreyi hashle
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        password_hash = hash_password(password)
         
         # Kullanıcı verisi
         user_data = {
             "email": email,
             "passwordHash": password_hash,
             "displayName": display_name,
+            "nameKey": normalize_search_text(display_name),
             "photoURL": f"https://ui-avatars.com/api/?name={display_name.replace(' ', '+')}&background=667eea&color=fff&size=128",
             "role": "user",
             "points": 0,
@@ -112,12 +197,34 @@ def signup_user(email: str, password: str, display_name: str) -> Dict[str, Any]:
             "currentStreak": 0,
             "longestStreak": 0,
             "lastActiveDate": None,
+            "lastActiveDay": None,
+            "timezone": STREAK_SETTINGS["default_timezone"],
             "createdAt": firestore.SERVER_TIMESTAMP,
             "updatedAt": firestore.SERVER_TIMESTAMP
         }
         
+        email_ref = db.collection("emails").document(email)
+        user_ref = db.collection("users").document(user_id)
+        
+        @firestore.transactional
+        def _create_if_absent(transaction) -> bool:
+            # Email zaten kayıtlı mı kontrol et (index + deterministik ID)
+            if email_ref.get(transaction=transaction).exists:
+                return False
+            if user_ref.get(transaction=transaction).exists:
+                return False
+            
+            transaction.set(email_ref, {"userId": user_id})
+            transaction.set(user_ref, user_data)
+            return True
+        
+        # Index öncesi farklı ID ile oluşturulmuş kayıtları kontrol et (göç süresince)
+        if _get_legacy_user_doc(db, email):
+            return {"success": False, "error": "Bu e-posta adresi zaten kayıtlı"}
+        
         # Firestore'a kaydet
-        db.collection("users").document(user_id).set(user_data)
+        if not _create_if_absent(db.transaction()):
+            return {"success": False, "error": "Bu e-posta adresi zaten kayıtlı"}
         
         return {"success": True, "user_id": user_id}
         
@@ -125,6 +232,13 @@ def signup_user(email: str, password: str, display_name: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def _upgrade_password_hash(user_ref, password: str):
+    """Kullanıcının şifre hash'ini güncel scrypt formatına yükselt"""
+    from services.password_service import hash_password
+    
+    user_ref.update({"passwordHash": hash_password(password)})
+
+
 def authenticate_user(email: str, password: str) -> Dict[str, Any]:
     """
     Kullanıcı girişini doğrula
@@ -132,21 +246,17 @@ def authenticate_user(email: str, password: str) -> Dict[str, Any]:
     Returns:
         {"success": True, "user": {...}} veya {"success": False, "error": "..."}
     """
-    import hashlib
+    from services.password_service import verify_password
     
     db = get_db()
     if not db:
         return {"success": False, "error": "Veritabanı bağlantısı kurulamadı"}
     
-    email = email.strip().lower()
+    email = _normalize_email(email)
     
     try:
-        # Kullanıcıyı email ile bul
-        users = db.collection("users").where("email", "==", email).limit(1).stream()
-        user_doc = None
-        for doc in users:
-            user_doc = doc
-            break
+        # Kullanıcıyı email ile bul (doğrudan anahtar okuması)
+        user_doc = _get_user_doc_by_email(db, email)
         
         if not user_doc:
             return {"success": False, "error": "Kullanıcı bulunamadı"}
@@ -155,12 +265,22 @@ def authenticate_user(email: str, password: str) -> Dict[str, Any]:
         user_data["id"] = user_doc.id
         
         # Şifre kontrolü
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
         stored_hash = user_data.get("passwordHash", "")
+        verification = verify_password(password, stored_hash)
         
-        if password_hash != stored_hash:
+        # Servis hatası yanlış şifre olarak gösterilmesin
+        if verification.get("error"):
+            return {"success": False, "error": verification["error"]}
+        
+        if not verification["valid"]:
             return {"success": False, "error": "Şifre hatalı"}
         
+        # Eski/zayıf hash'i şeffaf şekilde yükselt (girişi bekletmeden)
+        if verification["needs_rehash"]:
+            from services.task_service import submit_task
+            
+            submit_task(_upgrade_password_hash, user_doc.reference, password)
+        
         # Şifre hash'ini dönüşten çıkar
         user_data.pop("passwordHash", None)
         
@@ -184,6 +304,7 @@ def update_user_name(user_id: str, new_name: str) -> Dict[str, Any]:
     try:
         db.collection("users").document(user_id).update({
             "displayName": new_name.strip(),
+            "nameKey": normalize_search_text(new_name),
             "photoURL": f"https://ui-avatars.com/api/?name={new_name.replace(' ', '+')}&background=667eea&color=fff&size=128",
             "updatedAt": firestore.SERVER_TIMESTAMP
         })
@@ -192,6 +313,47 @@ def update_user_name(user_id: str, new_name: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def update_user_timezone(user_id: str, timezone_name: str) -> Dict[str, Any]:
+    """
+    Kullanıcının saat dilimini güncelle
+    
+    Aktif streak'in kırılma anı (streakExpiresAt) yeni dilimin gece
+    yarısına göre yeniden hesaplanır.
+    
+    Returns:
+        {"success": True} veya {"success": False, "error": "..."}
+    """
+    from datetime import date
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    from services.streak_service import streak_expires_at
+    
+    db = get_db()
+    if not db:
+        return {"success": False, "error": "Veritabanı bağlantısı kurulamadı"}
+    
+    try:
+        ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return {"success": False, "error": "Geçersiz saat dilimi"}
+    
+    try:
+        user_ref = db.collection("users").document(user_id)
+        user = user_ref.get(["currentStreak", "lastActiveDay"]).to_dict() or {}
+        
+        updates = {
+            "timezone": timezone_name,
+            "updatedAt": firestore.SERVER_TIMESTAMP
+        }
+        if user.get("currentStreak") and user.get("lastActiveDay"):
+            last_day = date.fromisoformat(user["lastActiveDay"])
+            updates["streakExpiresAt"] = streak_expires_at(last_day, timezone_name)
+        
+        user_ref.update(updates)
+        return {"success": True}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 def change_user_password(user_id: str, new_password: str) -> Dict[str, Any]:
     """
     Kullanıcı şifresini değiştir
@@ -199,7 +361,7 @@ def change_user_password(user_id: str, new_password: str) -> Dict[str, Any]:
     Returns:
         {"success": True} veya {"success": False, "error": "..."}
     """
-    import hashlib
+    from services.password_service import hash_password
     
     db = get_db()
     if not db:
@@ -207,7 +369,7 @@ def change_user_password(user_id: str, new_password: str) -> Dict[str, Any]:
     
     try:
         # Yeni şifreyi hashle
-        password_hash = hashlib.sha256(new_password.encode()).hexdigest()
+        password_hash = hash_password(new_password)
         
         db.collection("users").document(user_id).update({
             "passwordHash": password_hash,
@@ -258,6 +420,7 @@ def create_or_update_user(user_id: str, user_data: Dict[str, Any]) -> bool:
             # Mevcut kullanıcıyı güncelle
             update_data = {
                 "displayName": user_data.get("displayName"),
+                "nameKey": normalize_search_text(user_data.get("displayName") or ""),
                 "photoURL": user_data.get("photoURL"),
                 "updatedAt": firestore.SERVER_TIMESTAMP
             }
@@ -267,6 +430,7 @@ def create_or_update_user(user_id: str, user_data: Dict[str, Any]) -> bool:
             new_user = {
                 "email": user_data.get("email"),
                 "displayName": user_data.get("displayName"),
+                "nameKey": normalize_search_text(user_data.get("displayName") or ""),
                 "photoURL": user_data.get("photoURL"),
                 "role": "user",
                 "points": 0,
@@ -278,10 +442,16 @@ def create_or_update_user(user_id: str, user_data: Dict[str, Any]) -> bool:
                 "currentStreak": 0,
                 "longestStreak": 0,
                 "lastActiveDate": None,
+                "lastActiveDay": None,
                 "createdAt": firestore.SERVER_TIMESTAMP,
                 "updatedAt": firestore.SERVER_TIMESTAMP
             }
             user_ref.set(new_user)
+            
+            # E-posta index'i (giriş sırasında doğrudan anahtar okuması için)
+            if new_user["email"]:
+                email = _normalize_email(new_user["email"])
+                db.collection("emails").document(email).set({"userId": user_id})
         
         return True
     except Exception as e:
@@ -304,6 +474,38 @@ def update_user_stats(user_id: str, updates: Dict[str, Any]) -> bool:
         return False
 
 
+def apply_user_stat_deltas(
+    user_id: str,
+    increments: Dict[str, float],
+    sets: Optional[Dict[str, Any]] = None,
+    badges: Optional[List[str]] = None
+) -> bool:
+    """
+    Birikmiş istatistik değişikliklerini tek bir güncellemeyle yaz
+    
+    Args:
+        user_id: Kullanıcı ID
+        increments: Artırılacak sayaçlar (örn: {"points": 7, "wordsLearned": 3})
+        sets: Doğrudan yazılacak alanlar
+        badges: Eklenecek rozetler
+    """
+    db = get_db()
+    if not db:
+        return False
+    
+    try:
+        updates = {field: firestore.Increment(delta) for field, delta in increments.items() if delta}
+        updates.update(sets or {})
+        if badges:
+            updates["badges"] = firestore.ArrayUnion(list(badges))
+        updates["updatedAt"] = firestore.SERVER_TIMESTAMP
+        
+        db.collection("users").document(user_id).update(updates)
+        return True
+    except Exception:
+        return False
+
+
 def add_badge_to_user(user_id: str, badge_id: str) -> bool:
     """Kullanıcıya rozet ekle"""
     db = get_db()
@@ -321,6 +523,7 @@ def add_badge_to_user(user_id: str, badge_id: str) -> bool:
         return False
 
 
+@shared_cache(ttl=60, tags=("leaderboard",))  # 1 dakika, tüm süreçlerde ortak
 def get_leaderboard(period: str = "all_time", limit: int = 10) -> List[Dict[str, Any]]:
     """Liderlik tablosunu getir"""
     db = get_db()
@@ -346,6 +549,154 @@ def get_leaderboard(period: str = "all_time", limit: int = 10) -> List[Dict[str,
         return []
 
 
+def get_expired_streak_users(now, limit: int, start_after_id: Optional[str] = None) -> List[Any]:
+    """
+    Streak süresi dolmuş kullanıcıları getir (streakExpiresAt < now)
+    
+    Yazma ön koşulu için update_time gerektiğinden dict yerine
+    DocumentSnapshot listesi döner.
+    """
+    db = get_db()
+    if not db:
+        return []
+    
+    query = db.collection("users")\
+        .where("streakExpiresAt", "<", now)\
+        .order_by("streakExpiresAt")\
+        .order_by("__name__")\
+        .select(["streakExpiresAt"])
+    if start_after_id:
+        # Dry run: dokümanlar değişmediği için son ID'den devam edilir
+        last = db.collection("users").document(start_after_id).get(["streakExpiresAt"])
+        if last.exists:
+            query = query.start_after(last)
+    
+    return list(query.limit(limit).stream())
+
+
+def get_bulk_writer(on_error: Optional[Callable[[Any], None]] = None):
+    """
+    Toplu yazma için BulkWriter döndür
+    
+    BulkWriter yazmaları paralel gönderir, hız sınırını kendisi ayarlar
+    ve geçici hataları yeniden dener.
+    
+    Args:
+        on_error: Yeniden denemeler tükendiğinde başarısız yazma için çağrılır
+    """
+    db = get_db()
+    if not db:
+        return None
+    
+    writer = db.bulk_writer()
+    if on_error:
+        def _on_write_error(error, bulk_writer) -> bool:
+            if error.attempts < 5:
+                return True
+            on_error(error)
+            return False
+        writer.on_write_error(_on_write_error)
+    return writer
+
+
+# Kullanıcı dizininde okunan alanlar (projeksiyon)
+USER_DIRECTORY_FIELDS = ["displayName", "email", "role", "points"]
+
+
+def get_users_page(
+    page_size: int,
+    start_after_id: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Kullanıcıları doküman ID sırasıyla sayfa sayfa getir (toplu işler için)
+    
+    Args:
+        page_size: Sayfa boyutu
+        start_after_id: Önceki sayfanın son kullanıcı ID'si
+        fields: Sadece bu alanları oku (projeksiyon)
+    """
+    db = get_db()
+    if not db:
+        return []
+    
+    query = db.collection("users").order_by("__name__")
+    if fields:
+        query = query.select(fields)
+    if start_after_id:
+        query = query.start_after({"__name__": start_after_id})
+    
+    users = []
+    for doc in query.limit(page_size).stream():
+        data = doc.to_dict()
+        data["id"] = doc.id
+        users.append(data)
+    return users
+
+
+def list_users(
+    page_size: int = 25,
+    cursor: Optional[Dict[str, Any]] = None,
+    search: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Admin kullanıcı dizini - cursor tabanlı sayfalama
+    
+    Her sayfa en fazla `page_size` doküman okur ve sadece
+    USER_DIRECTORY_FIELDS alanlarını getirir. Arama metni "@" içeriyorsa
+    e-posta, aksi halde normalize edilmiş isim (`nameKey`) üzerinde prefix
+    araması yapılır.
+    
+    Args:
+        page_size: Sayfa başına kullanıcı sayısı
+        cursor: Önceki sayfanın döndürdüğü "next_cursor"
+        search: Prefix arama metni
+    
+    Returns:
+        {"users": [...], "next_cursor": {...} veya None}
+    """
+    db = get_db()
+    if not db:
+        return {"users": [], "next_cursor": None}
+    
+    search = (search or "").strip()
+    if "@" in search:
+        order_field, prefix = "email", search.lower()
+    elif search:
+        order_field, prefix = "nameKey", normalize_search_text(search)
+    else:
+        order_field, prefix = "email", ""
+    
+    try:
+        query = db.collection("users").select(USER_DIRECTORY_FIELDS + ["nameKey"])
+        
+        if prefix:
+            query = query.where(order_field, ">=", prefix).where(order_field, "<", prefix + "\uf8ff")
+        
+        query = query.order_by(order_field).order_by("__name__")
+        
+        if cursor:
+            query = query.start_after({order_field: cursor["value"], "__name__": cursor["id"]})
+        
+        docs = list(query.limit(page_size).stream())
+        
+        users = []
+        for doc in docs:
+            data = doc.to_dict()
+            data["id"] = doc.id
+            users.append(data)
+        
+        next_cursor = None
+        if len(docs) == page_size:
+            last = users[-1]
+            next_cursor = {"value": last.get(order_field, ""), "id": last["id"]}
+        
+        return {"users": users, "next_cursor": next_cursor}
+    except Exception as e:
+        st.error(f"Kullanıcı listesi hatası: {str(e)}")
+        return {"users": [], "next_cursor": None}
+
+
 def is_user_admin(user_email: str) -> bool:
     """Kullanıcının admin olup olmadığını kontrol et"""
     try:
@@ -357,7 +708,7 @@ def is_user_admin(user_email: str) -> bool:
 
 # ==================== WORD OPERATIONS ====================
 
-@st.cache_data(ttl=120)  # 2 dakika cache
+@shared_cache(ttl=120, tags=("words",))  # 2 dakika, tüm süreçlerde ortak
 def _get_words_cached(
     status: str = "approved",
     exam_type: str = None,
@@ -402,8 +753,14 @@ def get_words(
     search_query: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """Kelimeleri getir (search client-side)"""
-    # Cached fonksiyonu çağır
-    words = _get_words_cached(status, exam_type, difficulty, limit)
+    from services.vocabulary_snapshot_service import get_vocabulary_snapshot
+    
+    # Onaylı kelimeler varsa mmap'lenmiş snapshot'tan, yoksa cache'ten
+    snapshot = get_vocabulary_snapshot() if status == "approved" else None
+    if snapshot is not None:
+        words = snapshot.query(exam_type, difficulty, limit)
+    else:
+        words = _get_words_cached(status, exam_type, difficulty, limit)
     
     # Arama filtresi (client-side)
     if search_query:
@@ -416,6 +773,131 @@ def get_words(
     return words
 
 
+@shared_cache(ttl=120, tags=("words",))  # 2 dakika, tüm süreçlerde ortak
+def get_words_page(
+    status: str = "approved",
+    exam_type: Optional[str] = None,
+    difficulty: Optional[int] = None,
+    page_size: int = 12,
+    start_after_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Kelimeleri doküman ID sırasıyla sayfa sayfa getir (cursor tabanlı)
+    
+    Sadece istenen sayfa okunur; bir fazla doküman istenerek sonraki
+    sayfanın olup olmadığı ayrıca sorgu yapmadan anlaşılır.
+    
+    Args:
+        page_size: Sayfa boyutu
+        start_after_id: Önceki sayfanın son kelime ID'si (None = ilk sayfa)
+    
+    Returns:
+        {"words": [...], "next_cursor": sonraki sayfanın cursor'ı veya None}
+    """
+    db = get_db()
+    if not db:
+        return {"words": [], "next_cursor": None}
+    
+    try:
+        query = db.collection("words").where("status", "==", status)
+        
+        if exam_type and exam_type != "all":
+            query = query.where("examTypes", "array_contains", exam_type)
+        
+        if difficulty and difficulty != "all":
+            query = query.where("difficulty", "==", int(difficulty))
+        
+        query = query.order_by("__name__")
+        if start_after_id:
+            query = query.start_after({"__name__": start_after_id})
+        
+        words = []
+        for doc in query.limit(page_size + 1).stream():
+            data = doc.to_dict()
+            data["id"] = doc.id
+            words.append(data)
+        
+        has_more = len(words) > page_size
+        words = words[:page_size]
+        return {
+            "words": words,
+            "next_cursor": words[-1]["id"] if has_more else None
+        }
+    except Exception as e:
+        return {"words": [], "next_cursor": None}
+
+
+def get_approved_words_page(
+    page_size: int,
+    start_after_id: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Onaylı kelimeleri doküman ID sırasıyla sayfa sayfa getir (toplu işler için)
+    
+    Args:
+        page_size: Sayfa boyutu
+        start_after_id: Önceki sayfanın son kelime ID'si
+        fields: Sadece bu alanları oku (projeksiyon)
+    
+    Returns:
+        Kelimeler; okuma başarısızsa None (son sayfa ile karışmasın)
+    """
+    db = get_db()
+    if not db:
+        return None
+    
+    try:
+        query = db.collection("words").where("status", "==", "approved").order_by("__name__")
+        if fields:
+            query = query.select(fields)
+        if start_after_id:
+            query = query.start_after({"__name__": start_after_id})
+        
+        words = []
+        for doc in query.limit(page_size).stream():
+            data = doc.to_dict()
+            data["id"] = doc.id
+            words.append(data)
+        return words
+    except Exception as e:
+        return None
+
+
+def get_words_for_index(
+    statuses: List[str],
+    fields: Optional[List[str]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Bellek içi index'ler için kelimeleri sadece gerekli alanlarla getir
+    
+    Args:
+        statuses: Dahil edilecek durumlar (örn: ["approved", "pending"])
+        fields: Okunacak alanlar (varsayılan: english, turkish, status)
+    
+    Returns:
+        Kelimeler; okuma başarısızsa None (boş index kalıcı olarak kurulmasın)
+    """
+    db = get_db()
+    if not db:
+        return None
+    
+    try:
+        query = db.collection("words")\
+            .where("status", "in", statuses)\
+            .select(fields or ["english", "turkish", "status"])
+        
+        words = []
+        for doc in query.stream():
+            data = doc.to_dict()
+            data["id"] = doc.id
+            words.append(data)
+        
+        return words
+    except Exception as e:
+        return None
+
+
 def get_word(word_id: str) -> Optional[Dict[str, Any]]:
     """Tek bir kelimeyi getir"""
     db = get_db()
@@ -434,6 +916,25 @@ def get_word(word_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_words_by_ids(word_ids: List[str]) -> List[Dict[str, Any]]:
+    """Birden fazla kelimeyi tek istekte getir (olmayanlar atlanır)"""
+    db = get_db()
+    if not db or not word_ids:
+        return []
+    
+    try:
+        refs = [db.collection("words").document(word_id) for word_id in word_ids]
+        words = []
+        for doc in db.get_all(refs):
+            if doc.exists:
+                data = doc.to_dict()
+                data["id"] = doc.id
+                words.append(data)
+        return words
+    except Exception as e:
+        return []
+
+
 def add_word(word_data: Dict[str, Any]) -> Optional[str]:
     """Yeni kelime ekle"""
     db = get_db()
@@ -446,7 +947,13 @@ def add_word(word_data: Dict[str, Any]) -> Optional[str]:
         word_data["status"] = "pending"
         
         doc_ref = db.collection("words").add(word_data)
-        return doc_ref[1].id
+        word_id = doc_ref[1].id
+        
+        # Benzerlik index'ini güncelle
+        from services.word_index_service import get_word_index
+        get_word_index().add({**word_data, "id": word_id})
+        
+        return word_id
     except Exception as e:
         st.error(f"Kelime ekleme hatası: {str(e)}")
         return None
@@ -461,6 +968,9 @@ def update_word(word_id: str, updates: Dict[str, Any]) -> bool:
     try:
         updates["updatedAt"] = firestore.SERVER_TIMESTAMP
         db.collection("words").document(word_id).update(updates)
+        # Onay/red tüm sunucu süreçlerindeki listelere hemen yansısın
+        invalidate_cache_tags("words")
+        _sync_vocabulary_snapshot([word_id])
         return True
     except Exception as e:
         st.error(f"Kelime güncelleme hatası: {str(e)}")
@@ -469,19 +979,201 @@ def update_word(word_id: str, updates: Dict[str, Any]) -> bool:
 
 def approve_word(word_id: str, admin_id: str) -> bool:
     """Kelimeyi onayla"""
-    return update_word(word_id, {
+    success = update_word(word_id, {
         "status": "approved",
         "approvedBy": admin_id
     })
+    if success:
+        _sync_word_index([word_id], "approved")
+        _sync_synonym_graph([word_id])
+        _schedule_enrichment([word_id])
+    return success
 
 
 def reject_word(word_id: str, admin_id: str, reason: str = "") -> bool:
     """Kelimeyi reddet"""
-    return update_word(word_id, {
+    success = update_word(word_id, {
         "status": "rejected",
         "rejectedBy": admin_id,
         "rejectionReason": reason
     })
+    if success:
+        _sync_word_index([word_id], "rejected")
+    return success
+
+
+def _schedule_enrichment(word_ids: List[str]):
+    """Onaylanan kelimelerin AI içeriğini arka planda üret"""
+    from services.enrichment_service import schedule_word_enrichment
+    
+    schedule_word_enrichment(word_ids)
+
+
+def _sync_synonym_graph(word_ids: List[str]):
+    """Onaylanan kelimelerin eş/zıt anlamlarını grafa arka planda ekle"""
+    from services.synonym_graph_service import get_synonym_graph
+    from services.task_service import submit_task
+    
+    submit_task(get_synonym_graph().refresh, list(word_ids))
+
+
+def _sync_vocabulary_snapshot(word_ids: List[str]):
+    """Değişen kelimeleri paylaşılan snapshot dosyasına arka planda işle"""
+    import os
+    from services.vocabulary_snapshot_service import schedule_snapshot_refresh
+    from utils.constants import VOCABULARY_SNAPSHOT
+    
+    # Snapshot kullanılmıyorsa (dosya yok) iş başlatma; yakın zamanda
+    # gelen değişiklikler tek yeniden yazımda birleştirilir
+    if word_ids and os.path.exists(VOCABULARY_SNAPSHOT["path"]):
+        schedule_snapshot_refresh(word_ids)
+
+
+def _sync_word_index(word_ids: List[str], status: str):
+    """Durum değişikliklerini bellek içi benzerlik index'ine yansıt"""
+    from services.word_index_service import get_word_index
+    
+    index = get_word_index()
+    for word_id in word_ids:
+        index.set_status(word_id, status)
+
+
+# Firestore WriteBatch başına izin verilen en fazla yazma
+MAX_BATCH_WRITES = 500
+
+
+def bulk_update_word_status(
+    word_ids: List[str],
+    status: str,
+    admin_id: str,
+    reason: str = "",
+    user_updates: Optional[Dict[str, Dict[str, Any]]] = None
+) -> bool:
+    """
+    Birden fazla kelimenin durumunu toplu olarak güncelle
+    
+    Kelime durumları ve kullanıcı güncellemeleri WriteBatch ile yazılır
+    (500 yazmayı aşan listeler parçalara bölünür).
+    
+    Args:
+        word_ids: Güncellenecek kelime ID'leri
+        status: "approved" veya "rejected"
+        admin_id: İşlemi yapan admin
+        reason: Red sebebi (status="rejected" için)
+        user_updates: {user_id: {"increments": {...}, "badges": [...]}}
+    
+    Returns:
+        True başarılı, False başarısız
+    """
+    db = get_db()
+    if not db:
+        return False
+    
+    if status == "approved":
+        word_update = {"status": "approved", "approvedBy": admin_id}
+    else:
+        word_update = {"status": "rejected", "rejectedBy": admin_id, "rejectionReason": reason}
+    word_update["updatedAt"] = firestore.SERVER_TIMESTAMP
+    
+    writes = [(db.collection("words").document(word_id), word_update) for word_id in word_ids]
+    
+    for user_id, update in (user_updates or {}).items():
+        user_update = {
+            field: firestore.Increment(delta)
+            for field, delta in update.get("increments", {}).items()
+        }
+        if update.get("badges"):
+            user_update["badges"] = firestore.ArrayUnion(list(update["badges"]))
+        user_update["updatedAt"] = firestore.SERVER_TIMESTAMP
+        writes.append((db.collection("users").document(user_id), user_update))
+    
+    try:
+        for i in range(0, len(writes), MAX_BATCH_WRITES):
+            batch = db.batch()
+            for ref, data in writes[i:i + MAX_BATCH_WRITES]:
+                batch.update(ref, data)
+            batch.commit()
+        
+        # Bekleyen/onaylı listeler hemen güncellensin
+        invalidate_cache_tags("words")
+        _sync_vocabulary_snapshot(word_ids)
+        _sync_word_index(word_ids, status)
+        if status == "approved":
+            _sync_synonym_graph(word_ids)
+            _schedule_enrichment(word_ids)
+        return True
+    except Exception as e:
+        st.error(f"Toplu güncelleme hatası: {str(e)}")
+        return False
+
+
+def update_word_enrichments(enrichments: Dict[str, Dict[str, Any]]) -> bool:
+    """
+    Kelimelere AI ile üretilmiş içeriği yaz
+    
+    Args:
+        enrichments: {word_id: enrichment}
+    
+    Returns:
+        True başarılı, False başarısız
+    """
+    db = get_db()
+    if not db:
+        return False
+    
+    items = list(enrichments.items())
+    try:
+        for i in range(0, len(items), MAX_BATCH_WRITES):
+            batch = db.batch()
+            for word_id, enrichment in items[i:i + MAX_BATCH_WRITES]:
+                update = {
+                    "enrichment": enrichment,
+                    "updatedAt": firestore.SERVER_TIMESTAMP
+                }
+                if enrichment.get("completion"):
+                    # Onayda üretilen soru cümle tamamlama havuzuna da girer
+                    update["completionItems"] = firestore.ArrayUnion([enrichment["completion"]])
+                batch.update(db.collection("words").document(word_id), update)
+            batch.commit()
+        
+        # Kartlar yeni içeriği bir sonraki yüklemede göstersin
+        invalidate_cache_tags("words")
+        _sync_vocabulary_snapshot(list(enrichments))
+        return True
+    except Exception as e:
+        return False
+
+
+def add_completion_items(items_by_word: Dict[str, List[Dict[str, Any]]]) -> bool:
+    """
+    Kelimelerin cümle tamamlama havuzlarına soru ekle
+    
+    Args:
+        items_by_word: {word_id: [{"sentence", "correct", "options"}]}
+    
+    Returns:
+        True başarılı, False başarısız
+    """
+    db = get_db()
+    if not db:
+        return False
+    
+    items = list(items_by_word.items())
+    try:
+        for i in range(0, len(items), MAX_BATCH_WRITES):
+            batch = db.batch()
+            for word_id, completion_items in items[i:i + MAX_BATCH_WRITES]:
+                batch.update(db.collection("words").document(word_id), {
+                    "completionItems": firestore.ArrayUnion(completion_items),
+                    "updatedAt": firestore.SERVER_TIMESTAMP
+                })
+            batch.commit()
+        
+        invalidate_cache_tags("words")
+        _sync_vocabulary_snapshot(list(items_by_word))
+        return True
+    except Exception as e:
+        return False
 
 
 def get_pending_words(limit: int = 50) -> List[Dict[str, Any]]:
@@ -557,20 +1249,65 @@ def get_tricks(
         return []
 
 
+def get_tricks_for_index(statuses: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Benzerlik index'i için trick'leri sadece metin alanlarıyla getir
+    
+    Returns:
+        Trick'ler; okuma başarısızsa None (boş index kalıcı olarak kurulmasın)
+    """
+    db = get_db()
+    if not db:
+        return None
+    
+    try:
+        query = db.collection("tricks")\
+            .where("status", "in", statuses)\
+            .select(["title", "content", "relatedWords", "status"])
+        
+        tricks = []
+        for doc in query.stream():
+            data = doc.to_dict()
+            data["id"] = doc.id
+            tricks.append(data)
+        
+        return tricks
+    except Exception as e:
+        return None
+
+
 def add_trick(trick_data: Dict[str, Any]) -> Optional[str]:
-    """Yeni trick ekle"""
+    """
+    Yeni trick ekle
+    
+    Benzer trick'ler "possibleDuplicates" alanına yazılır; admin
+    onay kuyruğunda kopyaları bu alan üzerinden görür.
+    """
+    from services.trick_similarity_service import get_trick_index
+    
     db = get_db()
     if not db:
         return None
     
     try:
+        index = get_trick_index()
+        signature = index.signature_for(trick_data)
+        duplicates = index.find_duplicates(trick_data, signature=signature)
+        
         trick_data["createdAt"] = firestore.SERVER_TIMESTAMP
         trick_data["status"] = "pending"
         trick_data["upvotes"] = 0
         trick_data["downvotes"] = 0
+        trick_data["score"] = 0
+        trick_data["possibleDuplicates"] = [
+            {"id": d["id"], "title": d["title"], "similarity": d["similarity"]}
+            for d in duplicates
+        ]
         
         doc_ref = db.collection("tricks").add(trick_data)
-        return doc_ref[1].id
+        trick_id = doc_ref[1].id
+        index.add(dict(trick_data, id=trick_id), signature=signature)
+        return trick_id
     except Exception as e:
         st.error(f"Trick ekleme hatası: {str(e)}")
         return None
@@ -588,6 +1325,9 @@ def approve_trick(trick_id: str, admin_id: str) -> bool:
             "approvedBy": admin_id,
             "updatedAt": firestore.SERVER_TIMESTAMP
         })
+        
+        from services.trick_similarity_service import get_trick_index
+        get_trick_index().set_status(trick_id, "approved")
         return True
     except Exception as e:
         st.error(f"Trick onaylama hatası: {str(e)}")
@@ -599,6 +1339,148 @@ def get_pending_tricks(limit: int = 50) -> List[Dict[str, Any]]:
     return get_tricks(status="pending", limit=limit)
 
 
+def watch_approved_tricks(callback: Callable[[List[Tuple[str, Dict[str, Any]]]], None]):
+    """
+    Onaylı trick'lerdeki değişiklikleri dinle
+    
+    İlk snapshot tüm onaylı trick'leri "added" olarak iletir; sonrasında
+    yalnızca değişen dokümanlar gelir. Onaydan çıkan trick "removed" olur.
+    
+    Args:
+        callback: Her snapshot için [(değişiklik türü, trick verisi), ...]
+            listesi alan fonksiyon; listener thread'inde çağrılır
+    
+    Returns:
+        Dinleyici (unsubscribe() ile durdurulur) veya bağlantı yoksa None
+    """
+    db = get_db()
+    if not db:
+        return None
+    
+    def on_snapshot(col_snapshot, changes, read_time):
+        batch = []
+        for change in changes:
+            data = change.document.to_dict() or {}
+            data["id"] = change.document.id
+            batch.append((change.type.name.lower(), data))
+        callback(batch)
+    
+    try:
+        return db.collection("tricks")\
+            .where("status", "==", "approved")\
+            .on_snapshot(on_snapshot)
+    except Exception as e:
+        return None
+
+
+# ==================== TRICK VOTE OPERATIONS ====================
+
+def record_trick_vote(trick_id: str, user_id: str, value: int, shard_id: int) -> Dict[str, Any]:
+    """
+    Kullanıcının trick oyunu kaydet
+    
+    Oylar trick dokümanına değil trick'in sayaç shard'larından birine
+    yazılır; kullanıcının oyları tek bir "user_votes" dokümanındaki
+    map'te tutulur. İkisi aynı transaction'da güncellendiği için bir
+    kullanıcı bir trick'e en fazla bir oy verebilir.
+    
+    Args:
+        value: 1 (beğen), -1 (beğenme), 0 (oyu geri al)
+        shard_id: Artışın yazılacağı shard
+    
+    Returns:
+        {"success": bool, "vote": int, "changed": bool, "error": str}
+    """
+    db = get_db()
+    if not db:
+        return {"success": False, "error": "Veritabanı bağlantısı yok"}
+    
+    try:
+        votes_ref = db.collection("user_votes").document(user_id)
+        shard_ref = db.collection("tricks").document(trick_id)\
+            .collection("vote_shards").document(str(shard_id))
+        
+        @firestore.transactional
+        def _vote(transaction) -> int:
+            snapshot = votes_ref.get(transaction=transaction)
+            votes = (snapshot.to_dict() or {}).get("tricks", {}) if snapshot.exists else {}
+            previous = votes.get(trick_id, 0)
+            if previous == value:
+                return previous
+            
+            transaction.set(shard_ref, {
+                "upvotes": firestore.Increment(int(value == 1) - int(previous == 1)),
+                "downvotes": firestore.Increment(int(value == -1) - int(previous == -1))
+            }, merge=True)
+            
+            if value:
+                transaction.set(votes_ref, {"tricks": {trick_id: value}}, merge=True)
+            else:
+                transaction.update(votes_ref, {f"tricks.{trick_id}": firestore.DELETE_FIELD})
+            return previous
+        
+        previous = _vote(db.transaction())
+        return {"success": True, "vote": value, "changed": previous != value}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def get_user_trick_votes(user_id: str) -> Dict[str, int]:
+    """Kullanıcının trick oylarını getir ({trick_id: 1 | -1})"""
+    db = get_db()
+    if not db:
+        return {}
+    
+    try:
+        doc = db.collection("user_votes").document(user_id).get()
+        if doc.exists:
+            return doc.to_dict().get("tricks", {})
+        return {}
+    except Exception as e:
+        return {}
+
+
+def sum_trick_vote_shards(trick_id: str) -> Dict[str, int]:
+    """Trick'in tüm shard'larındaki oyları topla"""
+    db = get_db()
+    if not db:
+        return {"upvotes": 0, "downvotes": 0}
+    
+    totals = {"upvotes": 0, "downvotes": 0}
+    shards = db.collection("tricks").document(trick_id).collection("vote_shards").stream()
+    for shard in shards:
+        data = shard.to_dict() or {}
+        totals["upvotes"] += data.get("upvotes", 0)
+        totals["downvotes"] += data.get("downvotes", 0)
+    return totals
+
+
+def update_trick_scores(scores: Dict[str, Dict[str, int]]) -> bool:
+    """
+    Toplanmış oy sayılarını trick dokümanlarına toplu yaz
+    
+    Args:
+        scores: {trick_id: {"upvotes", "downvotes", "score"}}
+    """
+    db = get_db()
+    if not db:
+        return False
+    
+    try:
+        trick_ids = list(scores)
+        for start in range(0, len(trick_ids), MAX_BATCH_WRITES):
+            batch = db.batch()
+            for trick_id in trick_ids[start:start + MAX_BATCH_WRITES]:
+                batch.update(db.collection("tricks").document(trick_id), dict(
+                    scores[trick_id],
+                    scoreUpdatedAt=firestore.SERVER_TIMESTAMP
+                ))
+            batch.commit()
+        return True
+    except Exception as e:
+        return False
+
+
 # ==================== QUIZ OPERATIONS ====================
 
 def save_quiz_result(result_data: Dict[str, Any]) -> Optional[str]:
@@ -643,7 +1525,7 @@ def get_user_quiz_results(user_id: str, limit: int = 10) -> List[Dict[str, Any]]
 
 # ==================== STATISTICS ====================
 
-@st.cache_data(ttl=300)  # 5 dakika cache
+@shared_cache(ttl=300, tags=("stats",))  # 5 dakika, tüm süreçlerde ortak
 def get_app_stats() -> Dict[str, Any]:
     """Uygulama istatistiklerini getir (5 dk cache)"""
     db = get_db()
@@ -677,6 +1559,42 @@ def get_app_stats() -> Dict[str, Any]:
         }
 
 
+def _load_words_from_json(db, json_path: str) -> int:
+    """
+    JSON dosyasındaki kelimelerden olmayanları ekle
+    
+    Hata durumunda exception fırlatır; 0, eklenecek yeni kelime
+    olmadığı anlamına gelir.
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    
+    added_ids = []
+    for word in words:
+        # Kelime zaten var mı kontrol et
+        if not check_word_exists(word.get("english", "")):
+            word_data = {
+                "english": word.get("english", "").lower().strip(),
+                "turkish": word.get("turkish", ""),
+                "type": word.get("type", "noun"),
+                "synonyms": word.get("synonyms", []),
+                "antonyms": word.get("antonyms", []),
+                "exampleSentence": word.get("exampleSentence", ""),
+                "difficulty": word.get("difficulty", 3),
+                "examTypes": word.get("examTypes", ["genel"]),
+                "status": "approved",
+                "addedBy": "system",
+                "addedByName": "Lingua-AI",
+                "createdAt": firestore.SERVER_TIMESTAMP,
+                "updatedAt": firestore.SERVER_TIMESTAMP
+            }
+            _, ref = db.collection("words").add(word_data)
+            added_ids.append(ref.id)
+    
+    _sync_vocabulary_snapshot(added_ids)
+    return len(added_ids)
+
+
 def initialize_words_from_json(json_path: str) -> int:
     """JSON dosyasından başlangıç kelimelerini yükle"""
     db = get_db()
@@ -684,32 +1602,55 @@ def initialize_words_from_json(json_path: str) -> int:
         return 0
     
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            words = json.load(f)
-        
-        count = 0
-        for word in words:
-            # Kelime zaten var mı kontrol et
-            if not check_word_exists(word.get("english", "")):
-                word_data = {
-                    "english": word.get("english", "").lower().strip(),
-                    "turkish": word.get("turkish", ""),
-                    "type": word.get("type", "noun"),
-                    "synonyms": word.get("synonyms", []),
-                    "antonyms": word.get("antonyms", []),
-                    "exampleSentence": word.get("exampleSentence", ""),
-                    "difficulty": word.get("difficulty", 3),
-                    "examTypes": word.get("examTypes", ["genel"]),
-                    "status": "approved",
-                    "addedBy": "system",
-                    "addedByName": "Lingua-AI",
-                    "createdAt": firestore.SERVER_TIMESTAMP,
-                    "updatedAt": firestore.SERVER_TIMESTAMP
-                }
-                db.collection("words").add(word_data)
-                count += 1
-        
-        return count
+        return _load_words_from_json(db, json_path)
     except Exception as e:
         st.error(f"Kelime yükleme hatası: {str(e)}")
         return 0
+
+
+@st.cache_resource(show_spinner=False)
+def _seed_initial_words() -> Dict[str, Any]:
+    """
+    Veritabanı boşsa başlangıç kelimelerini yükle (başarılı sonuç süreç başına bir kez)
+    
+    Kontrol veya yükleme başarısız olursa exception fırlatılır;
+    st.cache_resource exception'ları saklamadığı için bir sonraki
+    çalıştırmada tekrar denenir. Tüm kelimeler zaten varsa (ör. onay
+    bekleyen olarak) eklenecek kelime yoktur; bu da başarılı sayılır.
+    """
+    import os
+    
+    status = {"loaded": 0, "announced": False}
+    
+    db = get_db()
+    if not db:
+        raise RuntimeError("Veritabanı bağlantısı kurulamadı")
+    
+    # Kelime var mı kontrol et (cache'siz; boş sonuç hata ile karışmasın)
+    if list(db.collection("words").where("status", "==", "approved").limit(1).stream()):
+        return status
+    
+    # Kelime yoksa JSON'dan yükle
+    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "initial_words.json")
+    if os.path.exists(json_path):
+        status["loaded"] = _load_words_from_json(db, json_path)
+    
+    return status
+
+
+def ensure_initial_words() -> Dict[str, Any]:
+    """
+    Veritabanı boşsa başlangıç kelimelerini yükle
+    
+    Her oturumun ilk açılışında yapılan kontrol yerine sunucu süreci
+    başına tek bir başarılı kontrol yapılır; geçici hatalar önbelleğe
+    alınmaz.
+    
+    Returns:
+        {"loaded": int, "announced": bool} - announced, bildirimi gösteren
+        oturum tarafından True yapılır
+    """
+    try:
+        return _seed_initial_words()
+    except Exception:
+        return {"loaded": 0, "announced": False}
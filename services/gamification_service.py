@@ -4,60 +4,76 @@ Points, badges, and streak management
 """
 
 import streamlit as st
-from datetime import datetime, date
-from typing import Dict, Any, List, Optional
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Tuple
 
-from utils.constants import BADGES, POINTS
+from utils.constants import BADGES, BADGE_EVENT_TYPES, BADGE_STAT_FIELDS, POINTS
 from utils.helpers import calculate_streak
 
 
-def check_and_award_badges(user_data: Dict[str, Any]) -> List[str]:
+class BadgeRules:
+    """
+    BADGES sabitinden derlenen rozet kuralları
+    
+    Her rozet türü için eşikler artan sırada tutulur; bir değerin
+    kazandırdığı rozetler bisect ile bulunur. Olaylar yalnızca ilgili
+    rozet türlerini kontrol eder. Yeni rozet eklemek için BADGES'e
+    kayıt eklemek yeterlidir.
+    """
+    
+    def __init__(self, badges: Dict[str, Dict[str, Any]]):
+        # tür -> ([eşikler], [rozet ID'leri]) (eşiğe göre sıralı)
+        self._rules: Dict[str, Tuple[List[float], List[str]]] = {}
+        
+        grouped: Dict[str, List[Tuple[float, str]]] = {}
+        for badge_id, badge in badges.items():
+            if badge.get("type") in BADGE_STAT_FIELDS:
+                grouped.setdefault(badge["type"], []).append((badge.get("threshold", 1), badge_id))
+        
+        for badge_type, rules in grouped.items():
+            rules.sort()
+            self._rules[badge_type] = ([t for t, _ in rules], [b for _, b in rules])
+    
+    def families(self) -> Dict[str, Tuple[List[float], List[str]]]:
+        """tür -> (artan eşikler, rozet ID'leri) - toplu hesaplamalar için"""
+        return self._rules
+    
+    def evaluate(self, user_data: Dict[str, Any], event: Optional[str] = None) -> List[str]:
+        """Kullanıcının henüz almadığı ama hak ettiği rozetler"""
+        badge_types = BADGE_EVENT_TYPES.get(event, self._rules.keys())
+        current_badges = user_data.get("badges", [])
+        new_badges = []
+        
+        for badge_type in badge_types:
+            rules = self._rules.get(badge_type)
+            if not rules:
+                continue
+            thresholds, badge_ids = rules
+            value = user_data.get(BADGE_STAT_FIELDS[badge_type], 0)
+            earned = bisect_right(thresholds, value)
+            new_badges.extend(b for b in badge_ids[:earned] if b not in current_badges)
+        
+        return new_badges
+
+
+@st.cache_resource
+def get_badge_rules() -> BadgeRules:
+    """BADGES'ten bir kez derlenen kurallar"""
+    return BadgeRules(BADGES)
+
+
+def check_and_award_badges(user_data: Dict[str, Any], event: Optional[str] = None) -> List[str]:
     """
     Kullanıcının hak ettiği rozetleri kontrol et
     
     Args:
         user_data: Kullanıcı verileri
+        event: Olay tipi (BADGE_EVENT_TYPES); verilmezse tüm rozetler kontrol edilir
     
     Returns:
         Yeni kazanılan rozetlerin listesi
     """
-    current_badges = user_data.get("badges", [])
-    new_badges = []
-    
-    words_contributed = user_data.get("wordsContributed", 0)
-    words_learned = user_data.get("wordsLearned", 0)
-    current_streak = user_data.get("currentStreak", 0)
-    high_score_quizzes = user_data.get("highScoreQuizzes", 0)
-    
-    # Katkı rozetleri
-    if words_contributed >= 1 and "caylak" not in current_badges:
-        new_badges.append("caylak")
-    
-    if words_contributed >= 10 and "katkici" not in current_badges:
-        new_badges.append("katkici")
-    
-    if words_contributed >= 50 and "uzman" not in current_badges:
-        new_badges.append("uzman")
-    
-    if words_contributed >= 100 and "efsane" not in current_badges:
-        new_badges.append("efsane")
-    
-    # Öğrenme rozeti
-    if words_learned >= 100 and "kelime_avcisi" not in current_badges:
-        new_badges.append("kelime_avcisi")
-    
-    # Streak rozetleri
-    if current_streak >= 7 and "streak_master" not in current_badges:
-        new_badges.append("streak_master")
-    
-    if current_streak >= 30 and "streak_efsanesi" not in current_badges:
-        new_badges.append("streak_efsanesi")
-    
-    # Quiz rozeti
-    if high_score_quizzes >= 10 and "quiz_sampiyonu" not in current_badges:
-        new_badges.append("quiz_sampiyonu")
-    
-    return new_badges
+    return get_badge_rules().evaluate(user_data, event)
 
 
 def calculate_points_for_action(action: str, extra: Dict[str, Any] = None) -> int:
@@ -94,39 +110,111 @@ def update_user_after_word_approved(user_id: str) -> Dict[str, Any]:
     Returns:
         Güncellenmiş veriler ve yeni rozetler
     """
-    from services.firebase_service import get_user, update_user_stats, add_badge_to_user
+    from services.stats_buffer_service import get_stats_buffer
     
-    user = get_user(user_id)
+    buffer = get_stats_buffer()
+    user = buffer.get_user_view(user_id)
     if not user:
         return {"success": False}
     
     # Puanları güncelle
-    new_points = user.get("points", 0) + POINTS["word_approved"]
-    new_contributed = user.get("wordsContributed", 0) + 1
-    
-    updates = {
-        "points": new_points,
-        "wordsContributed": new_contributed
+    increments = {
+        "points": POINTS["word_approved"],
+        "wordsContributed": 1
     }
     
     # Rozetleri kontrol et
-    user_with_updates = {**user, **updates}
-    new_badges = check_and_award_badges(user_with_updates)
+    user_with_updates = _apply_increments(user, increments)
+    new_badges = check_and_award_badges(user_with_updates, "word_approved")
     
-    # Güncelle
-    success = update_user_stats(user_id, updates)
-    
-    # Yeni rozetleri ekle
-    for badge_id in new_badges:
-        add_badge_to_user(user_id, badge_id)
+    # Tampona yaz (periyodik olarak tek güncellemeyle Firestore'a aktarılır)
+    written = buffer.add(user_id, increments=increments, badges=new_badges)
     
     return {
-        "success": success,
+        "success": written is not False,
+        "pending": written is None,
         "points_earned": POINTS["word_approved"],
         "new_badges": new_badges
     }
 
 
+def apply_bulk_word_moderation(
+    words: List[Dict[str, Any]],
+    action: str,
+    admin_id: str,
+    reason: str = ""
+) -> Dict[str, Any]:
+    """
+    Çoklu kelime onayı/reddi
+    
+    Onaylarda katkıcı puanları ve `wordsContributed` artışları kullanıcı
+    başına gruplanır; rozetler tek bir toplu okuma ile kontrol edilir ve
+    tüm yazmalar kelime durumlarıyla aynı WriteBatch'te yapılır.
+    
+    Args:
+        words: Kelime listesi (id ve addedBy alanları kullanılır)
+        action: "approve" veya "reject"
+        admin_id: İşlemi yapan admin
+        reason: Red sebebi
+    
+    Returns:
+        {"success": bool, "count": int, "contributors": int, "new_badges": {user_id: [...]}}
+    """
+    from services.firebase_service import bulk_update_word_status, get_users
+    from services.stats_buffer_service import get_stats_buffer
+    
+    word_ids = [w["id"] for w in words if w.get("id")]
+    if not word_ids:
+        return {"success": False, "count": 0, "contributors": 0, "new_badges": {}}
+    
+    if action != "approve":
+        success = bulk_update_word_status(word_ids, "rejected", admin_id, reason=reason)
+        return {"success": success, "count": len(word_ids), "contributors": 0, "new_badges": {}}
+    
+    # Katkıcı başına onaylanan kelime sayısı
+    contributions: Dict[str, int] = {}
+    for word in words:
+        contributor = word.get("addedBy")
+        if contributor and contributor != "system":
+            contributions[contributor] = contributions.get(contributor, 0) + 1
+    
+    buffer = get_stats_buffer()
+    users = get_users(list(contributions))
+    buffer.prime_snapshots(users)
+    user_updates = {}
+    new_badges_by_user = {}
+    
+    for user_id, count in contributions.items():
+        if user_id not in users:
+            continue
+        
+        increments = {
+            "points": POINTS["word_approved"] * count,
+            "wordsContributed": count
+        }
+        
+        # Tamponda bekleyen değişiklikler de hesaba katılsın
+        view = buffer.get_user_view(user_id)
+        new_badges = check_and_award_badges(_apply_increments(view, increments), "word_approved")
+        
+        user_updates[user_id] = {"increments": increments, "badges": new_badges}
+        if new_badges:
+            new_badges_by_user[user_id] = new_badges
+    
+    success = bulk_update_word_status(word_ids, "approved", admin_id, user_updates=user_updates)
+    
+    if success:
+        for user_id in user_updates:
+            buffer.invalidate_snapshot(user_id)
+    
+    return {
+        "success": success,
+        "count": len(word_ids),
+        "contributors": len(user_updates),
+        "new_badges": new_badges_by_user
+    }
+
+
 def update_user_after_quiz(user_id: str, score: int, total: int) -> Dict[str, Any]:
     """
     Quiz tamamlandıktan sonra kullanıcı istatistiklerini güncelle
@@ -134,9 +222,10 @@ def update_user_after_quiz(user_id: str, score: int, total: int) -> Dict[str, An
     Returns:
         Güncellenmiş veriler ve yeni rozetler
     """
-    from services.firebase_service import get_user, update_user_stats, add_badge_to_user
+    from services.stats_buffer_service import get_stats_buffer
     
-    user = get_user(user_id)
+    buffer = get_stats_buffer()
+    user = buffer.get_user_view(user_id)
     if not user:
         return {"success": False}
     
@@ -144,28 +233,24 @@ def update_user_after_quiz(user_id: str, score: int, total: int) -> Dict[str, An
     points_earned = calculate_points_for_action("quiz_complete", {"percentage": percentage})
     
     # Güncelleme verileri
-    updates = {
-        "points": user.get("points", 0) + points_earned,
-        "quizzesTaken": user.get("quizzesTaken", 0) + 1
+    increments = {
+        "points": points_earned,
+        "quizzesTaken": 1
     }
     
     # %90+ ise high score sayısını artır
     if percentage >= 90:
-        updates["highScoreQuizzes"] = user.get("highScoreQuizzes", 0) + 1
+        increments["highScoreQuizzes"] = 1
     
     # Rozetleri kontrol et
-    user_with_updates = {**user, **updates}
-    new_badges = check_and_award_badges(user_with_updates)
-    
-    # Güncelle
-    success = update_user_stats(user_id, updates)
+    user_with_updates = _apply_increments(user, increments)
+    new_badges = check_and_award_badges(user_with_updates, "quiz_complete")
     
-    # Yeni rozetleri ekle
-    for badge_id in new_badges:
-        add_badge_to_user(user_id, badge_id)
+    written = buffer.add(user_id, increments=increments, badges=new_badges)
     
     return {
-        "success": success,
+        "success": written is not False,
+        "pending": written is None,
         "points_earned": points_earned,
         "new_badges": new_badges,
         "percentage": percentage
@@ -179,17 +264,20 @@ def update_user_streak(user_id: str) -> Dict[str, Any]:
     Returns:
         Güncellenmiş streak bilgisi
     """
-    from services.firebase_service import get_user, update_user_stats, add_badge_to_user
+    from services.stats_buffer_service import get_stats_buffer
+    from services.streak_service import build_streak_fields, get_user_timezone
     
-    user = get_user(user_id)
+    buffer = get_stats_buffer()
+    user = buffer.get_user_view(user_id)
     if not user:
         return {"success": False}
     
-    last_active = user.get("lastActiveDate")
+    # Eski kayıtlarda sadece lastActiveDate bulunur
+    last_active = user.get("lastActiveDay") or user.get("lastActiveDate")
     current_streak = user.get("currentStreak", 0)
     longest_streak = user.get("longestStreak", 0)
     
-    new_streak, is_new_day = calculate_streak(last_active, current_streak)
+    new_streak, is_new_day = calculate_streak(last_active, current_streak, get_user_timezone(user))
     
     if not is_new_day:
         return {
@@ -200,33 +288,27 @@ def update_user_streak(user_id: str) -> Dict[str, Any]:
             "new_badges": []
         }
     
-    # Yeni gün - streak güncelle
-    updates = {
-        "currentStreak": new_streak,
-        "lastActiveDate": datetime.now().isoformat(),
-        "points": user.get("points", 0) + POINTS["daily_login"] + (POINTS["streak_bonus"] if new_streak > 1 else 0)
-    }
+    points_earned = POINTS["daily_login"]
+    if new_streak > 1:
+        points_earned += POINTS["streak_bonus"]
+    
+    # Yeni gün - streak güncelle (kırılma zamanı gece işi için saklanır)
+    sets = build_streak_fields(user, new_streak)
+    increments = {"points": points_earned}
     
     # En uzun streak'i güncelle
     if new_streak > longest_streak:
-        updates["longestStreak"] = new_streak
+        sets["longestStreak"] = new_streak
     
     # Rozetleri kontrol et
-    user_with_updates = {**user, **updates}
-    new_badges = check_and_award_badges(user_with_updates)
+    user_with_updates = {**_apply_increments(user, increments), **sets}
+    new_badges = check_and_award_badges(user_with_updates, "daily_login")
     
-    success = update_user_stats(user_id, updates)
-    
-    # Yeni rozetleri ekle
-    for badge_id in new_badges:
-        add_badge_to_user(user_id, badge_id)
-    
-    points_earned = POINTS["daily_login"]
-    if new_streak > 1:
-        points_earned += POINTS["streak_bonus"]
+    written = buffer.add(user_id, increments=increments, sets=sets, badges=new_badges)
     
     return {
-        "success": success,
+        "success": written is not False,
+        "pending": written is None,
         "streak": new_streak,
         "is_new_day": True,
         "points_earned": points_earned,
@@ -234,30 +316,78 @@ def update_user_streak(user_id: str) -> Dict[str, Any]:
     }
 
 
-def update_words_learned(user_id: str, count: int = 1) -> bool:
-    """Öğrenilen kelime sayısını artır"""
-    from services.firebase_service import get_user, update_user_stats, add_badge_to_user
+def run_post_login_updates(user_id: str) -> Dict[str, Any]:
+    """
+    Girişten sonra arka planda çalışan güncellemeler
+    
+    Streak, günlük giriş puanı ve streak rozetleri burada güncellenir;
+    sonuç bir sonraki rerun'da kullanıcıya gösterilir.
     
-    user = get_user(user_id)
+    Returns:
+        update_user_streak sonucu ve güncel kullanıcı verisi ("user")
+    """
+    from services.stats_buffer_service import get_stats_buffer
+    
+    result = update_user_streak(user_id)
+    
+    if result.get("is_new_day"):
+        user = get_stats_buffer().get_user_view(user_id)
+        if user:
+            user.pop("passwordHash", None)
+            result["user"] = user
+    
+    return result
+
+
+def update_words_learned(user_id: str, count: int = 1) -> Dict[str, Any]:
+    """
+    Öğrenilen kelime sayısını artır
+    
+    Yazma işlemi tamponda birleştirilir. success False ise olay erken
+    yazmayı tetiklemiş ve yazma başarısız olmuştur; pending True ise
+    değişiklik henüz Firestore'a yazılmamıştır.
+    
+    Returns:
+        {"success": bool, "pending": bool, "points_earned": int, "new_badges": [...]}
+    """
+    from services.stats_buffer_service import get_stats_buffer
+    
+    buffer = get_stats_buffer()
+    user = buffer.get_user_view(user_id)
     if not user:
-        return False
+        return {"success": False}
     
-    new_count = user.get("wordsLearned", 0) + count
-    updates = {
-        "wordsLearned": new_count,
-        "points": user.get("points", 0) + (POINTS["word_learned"] * count)
+    increments = {
+        "wordsLearned": count,
+        "points": POINTS["word_learned"] * count
     }
     
-    success = update_user_stats(user_id, updates)
+    # Öğrenme rozetleri kontrolü
+    new_badges = check_and_award_badges(_apply_increments(user, increments), "word_learned")
+    
+    written = buffer.add(user_id, increments=increments, badges=new_badges)
     
-    # Kelime avcısı rozeti kontrolü
-    if new_count >= 100:
-        user_with_updates = {**user, **updates}
-        new_badges = check_and_award_badges(user_with_updates)
-        for badge_id in new_badges:
-            add_badge_to_user(user_id, badge_id)
+    return {
+        "success": written is not False,
+        "pending": written is None,
+        "points_earned": increments["points"],
+        "new_badges": new_badges
+    }
+
+
+def flush_user_stats(user_id: str) -> bool:
+    """Kullanıcının tampondaki istatistiklerini hemen yaz (oturum sonu)"""
+    from services.stats_buffer_service import get_stats_buffer
     
-    return success
+    return get_stats_buffer().flush_user(user_id)
+
+
+def _apply_increments(user: Dict[str, Any], increments: Dict[str, float]) -> Dict[str, Any]:
+    """Kullanıcı verisine sayaç artışlarını uygula (yeni dict döner)"""
+    updated = dict(user)
+    for field, delta in increments.items():
+        updated[field] = updated.get(field, 0) + delta
+    return updated
 
 
 def get_badge_info(badge_id: str) -> Optional[Dict[str, Any]]:
@@ -278,28 +408,15 @@ def get_user_badge_progress(user_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         Her rozet için ilerleme yüzdesi ve durum
     """
     current_badges = user_data.get("badges", [])
-    words_contributed = user_data.get("wordsContributed", 0)
-    words_learned = user_data.get("wordsLearned", 0)
-    current_streak = user_data.get("currentStreak", 0)
-    high_score_quizzes = user_data.get("highScoreQuizzes", 0)
     
     progress_list = []
     
     for badge_id, badge in BADGES.items():
         threshold = badge.get("threshold", 1)
-        badge_type = badge.get("type", "")
         
         # İlgili değeri al
-        if badge_type == "contribution":
-            current_value = words_contributed
-        elif badge_type == "learning":
-            current_value = words_learned
-        elif badge_type == "streak":
-            current_value = current_streak
-        elif badge_type == "quiz":
-            current_value = high_score_quizzes
-        else:
-            current_value = 0
+        stat_field = BADGE_STAT_FIELDS.get(badge.get("type", ""))
+        current_value = user_data.get(stat_field, 0) if stat_field else 0
         
         progress = min((current_value / threshold) * 100, 100)
         is_earned = badge_id in current_badges
@@ -4,16 +4,15 @@ AI-powered sentence generation using Groq API (Llama 3.1)
 """
 
 import streamlit as st
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
+from utils.constants import GROQ_SETTINGS, SYSTEM_PROMPTS, ENRICHMENT
+from utils.lazy_import import lazy_module, is_module_available
 
-from utils.constants import GROQ_SETTINGS, SYSTEM_PROMPTS
+# Groq SDK (ilk kullanımda yüklenir)
+GROQ_AVAILABLE = is_module_available("groq")
+groq = lazy_module("groq")
 
 
 @st.cache_resource
@@ -26,7 +25,7 @@ def get_groq_client():
         api_key = st.secrets.get("groq", {}).get("api_key")
         if not api_key:
             return None
-        return Groq(api_key=api_key)
+        return groq.Groq(api_key=api_key)
     except Exception as e:
         st.error(f"Groq bağlantı hatası: {str(e)}")
         return None
@@ -221,6 +220,117 @@ Açıklama:
         return None
 
 
+def _format_word_list(words: List[Dict[str, Any]]) -> str:
+    """Kelimeleri prompt için "- english (type): turkish" satırlarına çevir"""
+    return "\n".join(
+        f"- {w.get('english', '')} ({w.get('type', 'noun')}): {w.get('turkish', '')}"
+        for w in words
+    )
+
+
+def _request_word_batch(
+    system_prompt: str,
+    user_content: str,
+    max_tokens: int,
+    temperature: float
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Toplu kelime isteğini JSON modunda gönder ve "words" listesini döndür
+    
+    Arka plan işlerinden çağrılır; hata durumunda st.* ile mesaj
+    göstermez, sadece None döner.
+    """
+    client = get_groq_client()
+    if not client:
+        return None
+    
+    try:
+        response = client.chat.completions.create(
+            model=GROQ_SETTINGS["model"],
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format={"type": "json_object"}
+        )
+        
+        if response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content.strip()
+            
+            # Bazen model JSON'u code block içinde döndürebilir
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0]
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0]
+            
+            result = json.loads(content.strip())
+            items = result.get("words") if isinstance(result, dict) else None
+            if isinstance(items, list):
+                return items
+        
+        return None
+    
+    except Exception as e:
+        return None
+
+
+def generate_word_enrichments(words: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Birden fazla kelime için örnek cümle, çeviri, açıklama, ipucu ve cümle
+    tamamlama sorusunu tek istekte üret
+    
+    Onay sonrası arka plan görevinden çağrılır; bu yüzden hata durumunda
+    st.* ile mesaj göstermez, sadece None döner.
+    
+    Args:
+        words: english/turkish/type alanları olan kelimeler
+    
+    Returns:
+        Kelime başına ham sonuç listesi (doğrulanmamış) veya None
+    """
+    if not words:
+        return None
+    
+    return _request_word_batch(
+        SYSTEM_PROMPTS["word_enrichment"],
+        f"Kelimeler:\n{_format_word_list(words)}",
+        ENRICHMENT["tokens_per_word"] * len(words),
+        GROQ_SETTINGS["temperature"]
+    )
+
+
+def generate_completion_items(words: List[Dict[str, Any]], per_word: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Birden fazla kelime için cümle tamamlama soruları üret (tek istek)
+    
+    Çevrimdışı havuz işi tarafından kullanılır; st.* ile mesaj göstermez.
+    
+    Args:
+        words: english/turkish/type alanları olan kelimeler
+        per_word: Kelime başına istenen soru sayısı
+    
+    Returns:
+        [{"english": ..., "items": [...]}] ham sonuç (doğrulanmamış) veya None
+    """
+    if not words:
+        return None
+    
+    return _request_word_batch(
+        SYSTEM_PROMPTS["completion_pool"],
+        f"Kelime başına soru sayısı: {per_word}\nKelimeler:\n{_format_word_list(words)}",
+        ENRICHMENT["tokens_per_word"] * per_word * len(words),
+        0.8
+    )
+
+
 def check_groq_availability() -> bool:
     """Groq API'nin kullanılabilir olup olmadığını kontrol et"""
     if not GROQ_AVAILABLE:
@@ -6,11 +6,11 @@ Content moderation using OpenAI Moderation API (FREE)
 import streamlit as st
 from typing import Dict, Any, Tuple
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+from utils.lazy_import import lazy_module, is_module_available
+
+# OpenAI SDK (ilk kullanımda yüklenir)
+OPENAI_AVAILABLE = is_module_available("openai")
+openai = lazy_module("openai")
 
 
 @st.cache_resource
@@ -23,7 +23,7 @@ def get_openai_client():
         api_key = st.secrets.get("openai", {}).get("api_key")
         if not api_key:
             return None
-        return OpenAI(api_key=api_key)
+        return openai.OpenAI(api_key=api_key)
     except Exception as e:
         st.error(f"OpenAI bağlantı hatası: {str(e)}")
         return None
@@ -0,0 +1,252 @@
+"""
+Password Service
+Salted scrypt password hashing with calibrated cost
+"""
+
+import streamlit as st
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Tuple, Callable
+
+from utils.constants import PASSWORD_SETTINGS
+
+# Hash formatı: scrypt$n$r$p$salt$hash (salt ve hash base64)
+SCRYPT_PREFIX = "scrypt"
+
+
+class PasswordServiceBusy(RuntimeError):
+    """KDF havuzu dolu veya işlem zaman aşımına uğradı (şifre hatası değil)"""
+    
+    def __init__(self, message: str = "Şifre servisi şu anda yoğun, lütfen biraz sonra tekrar deneyin."):
+        super().__init__(message)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data.encode("ascii"))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    """scrypt KDF'i çalıştır"""
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        # 128 * n * r byte bellek gerekir, biraz pay bırak
+        maxmem=256 * n * r,
+        dklen=PASSWORD_SETTINGS["key_bytes"]
+    )
+
+
+@st.cache_resource
+def get_scrypt_params() -> Dict[str, int]:
+    """
+    Sunucuya göre scrypt maliyetini kalibre et (süreç başına bir kez)
+    
+    n, hedef doğrulama süresine ulaşılana kadar ikiye katlanır;
+    min_n ve max_n sınırlarının dışına çıkılmaz.
+    """
+    r = PASSWORD_SETTINGS["r"]
+    p = PASSWORD_SETTINGS["p"]
+    n = PASSWORD_SETTINGS["min_n"]
+    target = PASSWORD_SETTINGS["target_verify_ms"] / 1000
+    salt = os.urandom(PASSWORD_SETTINGS["salt_bytes"])
+    
+    while n < PASSWORD_SETTINGS["max_n"]:
+        start = time.perf_counter()
+        _scrypt("calibration", salt, n, r, p)
+        elapsed = time.perf_counter() - start
+        
+        # Bir sonraki adım yaklaşık iki kat sürer
+        if elapsed * 2 > target:
+            break
+        n *= 2
+    
+    return {"n": n, "r": r, "p": p}
+
+
+class _BoundedExecutor:
+    """
+    Kuyruğu sınırlı thread havuzu
+    
+    ThreadPoolExecutor'ın kuyruğu sınırsızdır; çalışan + bekleyen iş
+    sayısı semaphore ile sınırlanır, sınır doluysa yeni iş beklemeden
+    PasswordServiceBusy ile reddedilir.
+    """
+    
+    def __init__(self, max_workers: int, max_queue: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-kdf")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+    
+    def submit(self, fn: Callable, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordServiceBusy()
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+@st.cache_resource
+def get_password_executor() -> _BoundedExecutor:
+    """
+    KDF işlemleri için sınırlı thread havuzu
+    
+    Aynı sunucudaki diğer oturumlar, eşzamanlı giriş denemeleri
+    yüzünden CPU/bellek açlığı çekmesin diye havuz ve kuyruğu küçük tutulur.
+    """
+    return _BoundedExecutor(PASSWORD_SETTINGS["max_workers"], PASSWORD_SETTINGS["max_queue"])
+
+
+class _VerificationCache:
+    """
+    Başarılı doğrulamaların kısa süreli cache'i
+    
+    Anahtar, süreç başına rastgele bir sırla HMAC'lenir; böylece cache
+    içeriği şifreler için offline bir kestirme oluşturmaz.
+    """
+    
+    def __init__(self, max_size: int, ttl: int):
+        self._secret = os.urandom(32)
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+    
+    def _key(self, password: str, stored_hash: str) -> str:
+        message = stored_hash.encode() + b"\x00" + password.encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+    
+    def contains(self, password: str, stored_hash: str) -> bool:
+        key = self._key(password, stored_hash)
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False
+            self._entries.move_to_end(key)
+            return True
+    
+    def add(self, password: str, stored_hash: str):
+        key = self._key(password, stored_hash)
+        with self._lock:
+            self._entries[key] = time.monotonic() + self._ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource
+def get_verification_cache() -> _VerificationCache:
+    """Süreç genelinde paylaşılan doğrulama cache'i"""
+    return _VerificationCache(
+        PASSWORD_SETTINGS["cache_size"],
+        PASSWORD_SETTINGS["cache_ttl"]
+    )
+
+
+def hash_password(password: str) -> str:
+    """
+    Şifreyi kullanıcıya özel salt ile scrypt kullanarak hashle
+    
+    Returns:
+        "scrypt$n$r$p$salt$hash" formatında hash
+    
+    Raises:
+        PasswordServiceBusy: Havuz dolu veya işlem zaman aşımına uğradı
+    """
+    params = get_scrypt_params()
+    salt = os.urandom(PASSWORD_SETTINGS["salt_bytes"])
+    
+    future = get_password_executor().submit(
+        _scrypt, password, salt, params["n"], params["r"], params["p"]
+    )
+    try:
+        derived = future.result(timeout=PASSWORD_SETTINGS["verify_timeout"])
+    except FutureTimeoutError:
+        raise PasswordServiceBusy()
+    
+    return "$".join([
+        SCRYPT_PREFIX,
+        str(params["n"]),
+        str(params["r"]),
+        str(params["p"]),
+        _b64encode(salt),
+        _b64encode(derived)
+    ])
+
+
+def _verify_hash(password: str, stored_hash: str) -> Tuple[bool, bool]:
+    """Hash'i doğrula, (is_valid, needs_rehash) döndür"""
+    if not stored_hash:
+        return False, False
+    
+    # Eski format: tuzsuz sha256
+    if not stored_hash.startswith(SCRYPT_PREFIX + "$"):
+        legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy_hash, stored_hash), True
+    
+    try:
+        _, n, r, p, salt, expected = stored_hash.split("$")
+        n, r, p = int(n), int(r), int(p)
+        derived = _scrypt(password, _b64decode(salt), n, r, p)
+    except ValueError:
+        return False, False
+    
+    is_valid = hmac.compare_digest(derived, _b64decode(expected))
+    
+    # Sadece parametreler güncel kalibrasyondan zayıfsa yeniden hashle;
+    # kalibrasyon süreç başına ve gürültülü olduğundan daha güçlü hash'ler
+    # düşürülmez
+    params = get_scrypt_params()
+    needs_rehash = n < params["n"] or r < params["r"] or p < params["p"]
+    
+    return is_valid, needs_rehash
+
+
+def verify_password(password: str, stored_hash: str) -> Dict[str, Any]:
+    """
+    Şifreyi saklı hash ile doğrula
+    
+    KDF sınırlı thread havuzunda çalışır. Eski sha256 hash'ler de kabul
+    edilir ancak needs_rehash=True döner; çağıran taraf yeni hash'i
+    kaydederek şifreyi şeffaf şekilde yükseltmelidir.
+    
+    Havuz dolu, zaman aşımı veya beklenmeyen hata durumunda "error"
+    döner; bu durumda şifrenin doğru olup olmadığı bilinmez.
+    
+    Returns:
+        {"valid": bool, "needs_rehash": bool} (hata varsa ayrıca "error": str)
+    """
+    cache = get_verification_cache()
+    if stored_hash.startswith(SCRYPT_PREFIX + "$") and cache.contains(password, stored_hash):
+        return {"valid": True, "needs_rehash": False}
+    
+    try:
+        future = get_password_executor().submit(_verify_hash, password, stored_hash)
+        is_valid, needs_rehash = future.result(timeout=PASSWORD_SETTINGS["verify_timeout"])
+    except (PasswordServiceBusy, FutureTimeoutError):
+        return {"valid": False, "needs_rehash": False, "error": str(PasswordServiceBusy())}
+    except Exception:
+        return {"valid": False, "needs_rehash": False, "error": "Şifre doğrulanamadı, lütfen tekrar deneyin."}
+    
+    if is_valid and not needs_rehash:
+        cache.add(password, stored_hash)
+    
+    return {"valid": is_valid, "needs_rehash": is_valid and needs_rehash}
@@ -0,0 +1,273 @@
+"""
+Stats Buffer Service
+Write-behind buffer that coalesces per-user point and counter updates
+"""
+
+import streamlit as st
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+
+from utils.constants import STATS_BUFFER
+
+
+class StatsBuffer:
+    """
+    Kullanıcı istatistik değişikliklerini bellekte biriktiren tampon
+    
+    Her olay (quiz, günlük giriş, öğrenilen kelime, onaylanan kelime)
+    Firestore'a ayrı ayrı yazılmak yerine kullanıcı başına birleştirilir:
+    sayaçlar toplanır (`points += 7`), alanlar son değeriyle tutulur,
+    rozetler kümeye eklenir. Tampon `flush_interval` saniyede bir veya
+    kullanıcı `max_pending_events` olaya ulaştığında tek bir
+    `firestore.Increment` güncellemesiyle yazılır.
+    
+    Rozet kontrolleri için kullanıcı verisi bir kez okunur ve bekleyen
+    değişikliklerle birleştirilerek sunulur (`get_user_view`). Yazılmakta
+    olan değişiklikler de yazma bitene kadar görünümde kalır. Okunan
+    kullanıcı verileri LRU sırasıyla max_snapshots ile sınırlanır, süresi
+    dolanlar periyodik yazmada atılır.
+    """
+    
+    def __init__(
+        self,
+        flush_interval: int,
+        max_pending_events: int,
+        snapshot_ttl: int,
+        max_snapshots: int
+    ):
+        self._lock = threading.RLock()
+        self._increments: Dict[str, Dict[str, float]] = {}
+        self._sets: Dict[str, Dict[str, Any]] = {}
+        self._badges: Dict[str, List[str]] = {}
+        self._event_counts: Dict[str, int] = {}
+        # Yazılmakta olan değişiklikler: user_id -> [(increments, sets, badges)]
+        self._inflight: Dict[str, List[tuple]] = {}
+        self._snapshots: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._snapshot_times: Dict[str, float] = {}
+        self._flush_interval = flush_interval
+        self._max_pending_events = max_pending_events
+        self._snapshot_ttl = snapshot_ttl
+        self._max_snapshots = max_snapshots
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    # ---------- Olay kaydı ----------
+    
+    def add(
+        self,
+        user_id: str,
+        increments: Optional[Dict[str, float]] = None,
+        sets: Optional[Dict[str, Any]] = None,
+        badges: Optional[List[str]] = None
+    ) -> Optional[bool]:
+        """
+        Kullanıcı için bekleyen değişiklik ekle
+        
+        Returns:
+            None: değişiklik tamponda bekliyor; True/False: olay erken
+            yazmayı tetikledi ve yazma başarılı/başarısız oldu (başarısız
+            değişiklikler tamponda kalır ve tekrar denenir)
+        """
+        if not user_id:
+            return None
+        
+        with self._lock:
+            pending = self._increments.setdefault(user_id, {})
+            for field, delta in (increments or {}).items():
+                pending[field] = pending.get(field, 0) + delta
+            
+            if sets:
+                self._sets.setdefault(user_id, {}).update(sets)
+            
+            if badges:
+                pending_badges = self._badges.setdefault(user_id, [])
+                for badge_id in badges:
+                    if badge_id not in pending_badges:
+                        pending_badges.append(badge_id)
+            
+            self._event_counts[user_id] = self._event_counts.get(user_id, 0) + 1
+            should_flush = self._event_counts[user_id] >= self._max_pending_events
+        
+        if should_flush:
+            return self.flush_user(user_id)
+        return None
+    
+    def get_user_view(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Kullanıcı verisini bekleyen değişikliklerle birleştirerek döndür
+        
+        Firestore'dan sadece snapshot yoksa veya eskidiyse okunur.
+        """
+        from services.firebase_service import get_user
+        
+        with self._lock:
+            snapshot = self._snapshots.get(user_id)
+            fetched_at = self._snapshot_times.get(user_id, 0)
+            if snapshot is not None:
+                self._snapshots.move_to_end(user_id)
+        
+        if snapshot is None or time.monotonic() - fetched_at > self._snapshot_ttl:
+            snapshot = get_user(user_id)
+            if not snapshot:
+                return None
+            with self._lock:
+                self._store_snapshot_locked(user_id, snapshot, time.monotonic())
+        
+        with self._lock:
+            view = dict(snapshot)
+            view["badges"] = list(view.get("badges", []))
+            # Önce yazılmakta olanlar, sonra tamponda bekleyenler
+            changes = list(self._inflight.get(user_id, []))
+            changes.append((
+                self._increments.get(user_id, {}),
+                self._sets.get(user_id, {}),
+                self._badges.get(user_id, [])
+            ))
+            for increments, sets, badges in changes:
+                _apply_changes(view, increments, sets, badges)
+        
+        return view
+    
+    def prime_snapshots(self, users: Dict[str, Dict[str, Any]]):
+        """Toplu okunan kullanıcıları snapshot olarak kaydet (tekrar okunmasın)"""
+        now = time.monotonic()
+        with self._lock:
+            for user_id, user in users.items():
+                self._store_snapshot_locked(user_id, dict(user), now)
+    
+    def invalidate_snapshot(self, user_id: str):
+        """Kullanıcı başka bir yoldan güncellendiyse snapshot'ı düşür"""
+        with self._lock:
+            self._snapshots.pop(user_id, None)
+            self._snapshot_times.pop(user_id, None)
+    
+    def _store_snapshot_locked(self, user_id: str, snapshot: Dict[str, Any], fetched_at: float):
+        self._snapshots[user_id] = snapshot
+        self._snapshots.move_to_end(user_id)
+        self._snapshot_times[user_id] = fetched_at
+        while len(self._snapshots) > self._max_snapshots:
+            evicted, _ = self._snapshots.popitem(last=False)
+            self._snapshot_times.pop(evicted, None)
+    
+    def _prune_snapshots(self):
+        """Süresi dolan snapshot'ları at (tekrar kullanılmadan yeniden okunurlar)"""
+        cutoff = time.monotonic() - self._snapshot_ttl
+        with self._lock:
+            expired = [uid for uid, fetched_at in self._snapshot_times.items() if fetched_at < cutoff]
+            for user_id in expired:
+                self._snapshots.pop(user_id, None)
+                self._snapshot_times.pop(user_id, None)
+    
+    # ---------- Yazma ----------
+    
+    def _take(self, user_id: str):
+        """Kullanıcının bekleyen değişikliklerini tampondan çıkar"""
+        increments = self._increments.pop(user_id, {})
+        sets = self._sets.pop(user_id, {})
+        badges = self._badges.pop(user_id, [])
+        self._event_counts.pop(user_id, None)
+        return increments, sets, badges
+    
+    def flush_user(self, user_id: str) -> bool:
+        """Tek kullanıcının bekleyen değişikliklerini yaz"""
+        from services.firebase_service import apply_user_stat_deltas
+        
+        with self._lock:
+            change = self._take(user_id)
+            increments, sets, badges = change
+            if not increments and not sets and not badges:
+                return True
+            # Yazma sürerken get_user_view bu değişiklikleri görmeye devam eder
+            self._inflight.setdefault(user_id, []).append(change)
+        
+        try:
+            success = apply_user_stat_deltas(user_id, increments, sets, badges)
+        except Exception:
+            success = False
+        
+        with self._lock:
+            inflight = self._inflight.get(user_id, [])
+            inflight.remove(change)
+            if not inflight:
+                self._inflight.pop(user_id, None)
+            
+            if success:
+                # Yazılan değişiklikleri snapshot'a işle
+                snapshot = self._snapshots.get(user_id)
+                if snapshot is not None:
+                    snapshot["badges"] = list(snapshot.get("badges", []))
+                    _apply_changes(snapshot, increments, sets, badges)
+            else:
+                # Başarısız yazma - değişiklikleri bir sonraki denemeye bırak
+                pending = self._increments.setdefault(user_id, {})
+                for field, delta in increments.items():
+                    pending[field] = pending.get(field, 0) + delta
+                self._sets.setdefault(user_id, {}).update(
+                    {k: v for k, v in sets.items() if k not in self._sets.get(user_id, {})}
+                )
+                pending_badges = self._badges.setdefault(user_id, [])
+                pending_badges.extend(b for b in badges if b not in pending_badges)
+        
+        return success
+    
+    def flush_all(self):
+        """Tüm kullanıcıların bekleyen değişikliklerini yaz"""
+        with self._lock:
+            user_ids = set(self._increments) | set(self._sets) | set(self._badges)
+        
+        for user_id in user_ids:
+            self.flush_user(user_id)
+        
+        self._prune_snapshots()
+    
+    # ---------- Periyodik yazma ----------
+    
+    def start(self):
+        """Periyodik yazma thread'ini başlat"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="stats-buffer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def stop(self):
+        """Thread'i durdur ve kalan değişiklikleri yaz"""
+        self._stop.set()
+        self.flush_all()
+    
+    def _run(self):
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush_all()
+            except Exception:
+                # Bir sonraki periyotta tekrar denenir
+                pass
+
+
+def _apply_changes(
+    user: Dict[str, Any],
+    increments: Dict[str, float],
+    sets: Dict[str, Any],
+    badges: List[str]
+):
+    """Değişiklikleri kullanıcı dict'ine yerinde uygula"""
+    for field, delta in increments.items():
+        user[field] = user.get(field, 0) + delta
+    user.update(sets)
+    user["badges"].extend(b for b in badges if b not in user["badges"])
+
+
+@st.cache_resource
+def get_stats_buffer() -> StatsBuffer:
+    """Süreç genelinde paylaşılan (rerun'lardan etkilenmeyen) tampon"""
+    buffer = StatsBuffer(
+        STATS_BUFFER["flush_interval"],
+        STATS_BUFFER["max_pending_events"],
+        STATS_BUFFER["snapshot_ttl"],
+        STATS_BUFFER["max_snapshots"]
+    )
+    buffer.start()
+    return buffer
@@ -0,0 +1,106 @@
+"""
+Streak Service
+Timezone-aware streak bookkeeping and the nightly broken-streak reset
+"""
+
+from datetime import datetime, date, time, timedelta, timezone
+from typing import Dict, Any, Optional
+
+from utils.constants import STREAK_SETTINGS
+from utils.helpers import get_zone
+
+
+def get_user_timezone(user: Dict[str, Any]) -> str:
+    """Kullanıcının saat dilimi (kayıtlı değilse varsayılan)"""
+    return user.get("timezone") or STREAK_SETTINGS["default_timezone"]
+
+
+def streak_expires_at(active_day: date, timezone_name: Optional[str] = None) -> datetime:
+    """
+    Streak'in kırılacağı an (UTC)
+    
+    Son aktif günün ertesi günü de giriş yapılmazsa streak, kullanıcının
+    saat diliminde ondan sonraki günün başında kırılmış olur.
+    """
+    tz = get_zone(timezone_name)
+    local_midnight = datetime.combine(active_day + timedelta(days=2), time.min, tzinfo=tz)
+    return local_midnight.astimezone(timezone.utc)
+
+
+def build_streak_fields(user: Dict[str, Any], new_streak: int) -> Dict[str, Any]:
+    """
+    Günlük girişte yazılacak streak alanları
+    
+    lastActiveDay kullanıcının yerel günüdür; streakExpiresAt gece işinin
+    tek alanlı index üzerinden kırılan streak'leri bulmasını sağlar.
+    """
+    timezone_name = get_user_timezone(user)
+    now = datetime.now(timezone.utc)
+    today = now.astimezone(get_zone(timezone_name)).date()
+    
+    return {
+        "currentStreak": new_streak,
+        "lastActiveDate": now.isoformat(),
+        "lastActiveDay": today.isoformat(),
+        "streakExpiresAt": streak_expires_at(today, timezone_name)
+    }
+
+
+def reset_broken_streaks(now: Optional[datetime] = None, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Süresi dolmuş streak'leri toplu olarak sıfırla (gece işi)
+    
+    streakExpiresAt < şimdi olan kullanıcılar sayfa sayfa okunur ve
+    BulkWriter ile sıfırlanır. Her yazma dokümanın okunduğu andaki
+    update_time ön koşuluyla gönderilir; arada giriş yapıp streak'ini
+    uzatan kullanıcının yazması ezilmez. Sıfırlanan kullanıcıdan
+    streakExpiresAt silindiği için sorgu bir sonraki sayfada onu
+    tekrar döndürmez.
+    
+    Returns:
+        {"reset": int, "skipped": int}
+    """
+    from services.firebase_service import get_expired_streak_users, get_bulk_writer, get_db, firestore
+    
+    now = now or datetime.now(timezone.utc)
+    batch_size = STREAK_SETTINGS["reset_batch_size"]
+    stats = {"reset": 0, "skipped": 0}
+    
+    db = get_db()
+    if not db:
+        raise RuntimeError("Firebase bağlantısı kurulamadı")
+    
+    failures = []
+    writer = None if dry_run else get_bulk_writer(on_error=failures.append)
+    start_after_id = None
+    
+    try:
+        while True:
+            # Dry run'da dokümanlar değişmediği için cursor ile ilerlenir
+            snapshots = get_expired_streak_users(now, batch_size, start_after_id if dry_run else None)
+            if not snapshots:
+                break
+            
+            if writer is not None:
+                for snapshot in snapshots:
+                    writer.update(
+                        snapshot.reference,
+                        {"currentStreak": 0, "streakExpiresAt": firestore.DELETE_FIELD},
+                        option=db.write_option(last_update_time=snapshot.update_time)
+                    )
+                writer.flush()
+            stats["reset"] += len(snapshots) - len(failures)
+            stats["skipped"] += len(failures)
+            if failures and len(failures) == len(snapshots):
+                # Sayfanın tamamı başarısız - sonsuz döngüye girme
+                break
+            failures.clear()
+            
+            start_after_id = snapshots[-1].id
+            if len(snapshots) < batch_size:
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    return stats
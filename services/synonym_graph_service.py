@@ -0,0 +1,183 @@
+"""
+Synonym Graph Service
+Process-wide synonym/antonym graph with adjacency arrays for quiz distractors
+"""
+
+import streamlit as st
+import random
+import threading
+from array import array
+from typing import Dict, Any, List, Optional, Set
+
+# Graf için okunan kelime alanları
+GRAPH_FIELDS = ["english", "synonyms", "antonyms", "type"]
+
+
+def _normalize_term(term: Any) -> str:
+    return str(term).lower().strip() if term else ""
+
+
+class SynonymGraph:
+    """
+    Kelimelerin synonyms/antonyms alanlarından kurulan yönsüz graf
+    
+    Her terim (kelime veya listedeki eş/zıt anlamlı) sabit bir düğüm
+    numarası alır; komşuluklar düğüm başına array("I") olarak tutulur,
+    bu yüzden bir terimin eş/zıt anlamlıları O(derece) sürede okunur.
+    Graf sadece büyür; onaylanan kelimeler add_words ile eklenir ve
+    düğüm numaraları değişmediği için quiz state'inde saklanabilir.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built = False
+        self._node_of: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._synonyms: List[array] = []
+        self._antonyms: List[array] = []
+        self._types: List[str] = []
+        self._by_type: Dict[str, array] = {}
+    
+    # ---------- Yükleme / güncelleme ----------
+    
+    def ensure_built(self):
+        """Graf henüz kurulmadıysa onaylı kelimelerden kur"""
+        if self._built:
+            return
+        
+        from services.firebase_service import get_words_for_index
+        
+        words = get_words_for_index(["approved"], fields=GRAPH_FIELDS)
+        if words is None:
+            # Okuma başarısız - bir sonraki kullanımda tekrar dene
+            return
+        with self._lock:
+            if self._built:
+                return
+            for word in words:
+                self._add_locked(word)
+            self._built = True
+    
+    def add_words(self, words: List[Dict[str, Any]]):
+        """Kelimeleri ve ilişkilerini ekle (tekrar eklemek zararsız)"""
+        with self._lock:
+            for word in words:
+                self._add_locked(word)
+    
+    def refresh(self, word_ids: List[str]):
+        """Onaylanan kelimeleri Firestore'dan okuyup ekle (arka plan görevi)"""
+        if not self._built:
+            # Graf ilk kullanımda zaten bu kelimelerle kurulacak
+            return
+        
+        from services.firebase_service import get_words_by_ids
+        
+        self.add_words(get_words_by_ids(word_ids))
+    
+    def _node_locked(self, term: str, display: str) -> int:
+        node = self._node_of.get(term)
+        if node is None:
+            node = len(self._terms)
+            self._node_of[term] = node
+            self._terms.append(display)
+            self._synonyms.append(array("I"))
+            self._antonyms.append(array("I"))
+            self._types.append("")
+        return node
+    
+    def _add_locked(self, word: Dict[str, Any]):
+        english = _normalize_term(word.get("english"))
+        if not english:
+            return
+        
+        node = self._node_locked(english, str(word["english"]).strip())
+        word_type = word.get("type") or ""
+        if word_type and not self._types[node]:
+            self._types[node] = word_type
+            self._by_type.setdefault(word_type, array("I")).append(node)
+        
+        for relation, adjacency in (("synonyms", self._synonyms), ("antonyms", self._antonyms)):
+            for raw in word.get(relation) or []:
+                term = _normalize_term(raw)
+                if not term or term == english:
+                    continue
+                other = self._node_locked(term, str(raw).strip())
+                if other not in adjacency[node]:
+                    adjacency[node].append(other)
+                    adjacency[other].append(node)
+    
+    # ---------- Sorgular ----------
+    
+    def node_of(self, term: str) -> Optional[int]:
+        """Terimin düğüm numarası (yoksa None)"""
+        return self._node_of.get(_normalize_term(term))
+    
+    def term(self, node: int) -> str:
+        """Düğümün gösterilecek yazımı"""
+        return self._terms[node]
+    
+    def synonyms(self, node: int) -> array:
+        """Eş anlamlı düğümler"""
+        return self._synonyms[node]
+    
+    def antonyms(self, node: int) -> array:
+        """Zıt anlamlı düğümler"""
+        return self._antonyms[node]
+    
+    def pick_distractors(
+        self,
+        node: int,
+        answer: int,
+        count: int,
+        pool: Optional[List[int]] = None
+    ) -> List[int]:
+        """
+        Eş anlam sorusu için yanlış şıklar seç
+        
+        Hedefin ve doğru cevabın eş anlamlıları hiçbir zaman şık olmaz
+        (birden fazla doğru cevap çıkmasın). Öncelik sırası: hedefin ve
+        eş anlamlılarının zıt anlamlıları, aynı türdeki havuz kelimeleri,
+        havuzun geri kalanı, son olarak aynı türdeki diğer kelimeler.
+        
+        Args:
+            node: Sorulan kelimenin düğümü
+            answer: Doğru cevabın (eş anlamlı) düğümü
+            count: İstenen şık sayısı
+            pool: Quiz'deki kelimelerin düğümleri
+        
+        Returns:
+            En fazla count düğüm (graf küçükse daha az)
+        """
+        excluded: Set[int] = {node, answer}
+        excluded.update(self._synonyms[node])
+        excluded.update(self._synonyms[answer])
+        
+        antonyms = set(self._antonyms[node])
+        for synonym in self._synonyms[node]:
+            antonyms.update(self._antonyms[synonym])
+        
+        word_type = self._types[node]
+        pool = pool or []
+        tiers = [
+            list(antonyms),
+            [p for p in pool if word_type and self._types[p] == word_type],
+            pool,
+            list(self._by_type.get(word_type, ())) if word_type else []
+        ]
+        
+        chosen: List[int] = []
+        for tier in tiers:
+            candidates = [c for c in set(tier) if c not in excluded]
+            random.shuffle(candidates)
+            for candidate in candidates[:count - len(chosen)]:
+                chosen.append(candidate)
+                excluded.add(candidate)
+            if len(chosen) == count:
+                break
+        return chosen
+
+
+@st.cache_resource
+def get_synonym_graph() -> SynonymGraph:
+    """Süreç genelinde paylaşılan eş/zıt anlam grafı"""
+    return SynonymGraph()
@@ -0,0 +1,51 @@
+"""
+Task Service
+Background executor for work that should not block a page rerun
+"""
+
+import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from utils.constants import BACKGROUND_SETTINGS
+
+
+@st.cache_resource
+def get_background_executor() -> ThreadPoolExecutor:
+    """Süreç genelinde paylaşılan arka plan thread havuzu"""
+    return ThreadPoolExecutor(
+        max_workers=BACKGROUND_SETTINGS["max_workers"],
+        thread_name_prefix="lingua-bg"
+    )
+
+
+def submit_task(fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Fonksiyonu arka planda çalıştır
+    
+    Returns:
+        Future - sonucu sonraki rerun'da session state üzerinden okunabilir
+    """
+    return get_background_executor().submit(fn, *args, **kwargs)
+
+
+def pop_finished_task(key: str) -> Optional[Any]:
+    """
+    Session state'te saklanan tamamlanmış bir görevin sonucunu al
+    
+    Görev henüz bitmediyse None döner ve future yerinde bırakılır.
+    Görev hata ile bittiyse future temizlenir ve None döner.
+    
+    Args:
+        key: Future'ın saklandığı session state anahtarı
+    """
+    future = st.session_state.get(key)
+    if future is None or not future.done():
+        return None
+    
+    del st.session_state[key]
+    
+    try:
+        return future.result()
+    except Exception:
+        return None
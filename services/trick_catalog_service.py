@@ -0,0 +1,274 @@
+"""
+Trick Catalog Service
+Process-wide trick catalog (built-in + approved community tricks)
+"""
+
+import streamlit as st
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from utils.constants import TRICK_CATEGORIES, TRICK_CATALOG
+from utils.helpers import normalize_search_text
+
+BUILTIN_TRICKS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "builtin_tricks.json"
+)
+
+
+def _load_builtin_tricks() -> List[Dict[str, Any]]:
+    """Uygulamayla gelen trick'leri JSON'dan oku"""
+    try:
+        with open(BUILTIN_TRICKS_PATH, "r", encoding="utf-8") as f:
+            tricks = json.load(f)
+    except (OSError, ValueError):
+        return []
+    
+    for trick in tricks:
+        trick["source"] = "builtin"
+    return tricks
+
+
+def _word_keys(word: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Kelimenin (yazımları, olası kökleri)
+    
+    Yazımlar kelimenin kendisi ve yazım varyantıdır (colour, color);
+    kökler gerçek kelime olmayabilir (abandone), bu yüzden sadece karşı
+    tarafın yazımlarıyla eşleştirilir. İki taraf da aynı normalizasyondan
+    geçer.
+    """
+    from services.word_index_service import lemma_candidates, surface_forms
+    
+    word = normalize_search_text(word)
+    if not word:
+        return set(), set()
+    if " " in word:
+        return {word}, {word}
+    return surface_forms(word), lemma_candidates(word)
+
+
+def _normalize_community_trick(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Firestore trick'ini sayfanın beklediği biçime getir"""
+    category = data.get("category", "grammar")
+    cat_info = TRICK_CATEGORIES.get(category, TRICK_CATEGORIES["grammar"])
+    
+    return {
+        "id": data["id"],
+        "title": data.get("title", ""),
+        "content": data.get("content", ""),
+        "category": category,
+        "tag": data.get("tag") or cat_info["name"],
+        "color": cat_info["color"],
+        "relatedWords": data.get("relatedWords", []),
+        "examTypes": data.get("examTypes", []),
+        "addedByName": data.get("addedByName", "Anonim"),
+        "upvotes": data.get("upvotes", 0),
+        "downvotes": data.get("downvotes", 0),
+        "score": data.get("score", 0),
+        "source": "community"
+    }
+
+
+class TrickCatalog:
+    """
+    Yerleşik ve onaylı topluluk trick'lerinin bellek içi kataloğu
+    
+    Süreç başına bir kez yüklenir; Firestore listener'ı onay/geri alma
+    değişikliklerini uygular. Sayfa gezinmesi Firestore okuması yapmaz.
+    """
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = threading.Event()
+        self._builtin = _load_builtin_tricks()
+        self._community: Dict[str, Dict[str, Any]] = {}
+        self._watch = None
+        self._last_refresh = 0.0
+        
+        self._ordered: List[Dict[str, Any]] = []
+        self._by_category: Dict[str, List[int]] = {}
+        self._by_tag: Dict[str, List[int]] = {}
+        self._positions: Dict[str, int] = {}
+        self._score_rank: List[int] = []
+        self._by_word: Dict[str, List[int]] = {}
+        self._by_form: Dict[str, List[int]] = {}
+        self._reindex_locked()
+    
+    # ---------- Yükleme / senkronizasyon ----------
+    
+    def ensure_loaded(self):
+        """Topluluk trick'lerini ilk kullanımda yükle ve dinlemeye başla"""
+        with self._lock:
+            if self._watch is None and not self._loaded.is_set():
+                from services.firebase_service import watch_approved_tricks
+                
+                self._watch = watch_approved_tricks(self._apply_changes)
+                if self._watch is None:
+                    # Listener yok (bağlantı/SDK) - periyodik yenilemeye düş
+                    self._refresh_locked()
+        
+        if self._watch is not None:
+            if not self._loaded.wait(TRICK_CATALOG["load_timeout"]):
+                # İlk snapshot gelmedi - listener'ı bırakıp tek seferlik oku
+                self.stop()
+                with self._lock:
+                    self._refresh_locked()
+        elif time.time() - self._last_refresh > TRICK_CATALOG["fallback_refresh"]:
+            with self._lock:
+                self._refresh_locked()
+    
+    def _refresh_locked(self):
+        from services.firebase_service import get_tricks
+        
+        tricks = get_tricks(status="approved", limit=TRICK_CATALOG["fallback_limit"])
+        self._community = {t["id"]: _normalize_community_trick(t) for t in tricks}
+        self._last_refresh = time.time()
+        self._reindex_locked()
+        self._loaded.set()
+    
+    def _apply_changes(self, changes: List[Tuple[str, Dict[str, Any]]]):
+        """Listener thread'inden gelen değişiklikleri uygula"""
+        with self._lock:
+            for change_type, data in changes:
+                if change_type == "removed":
+                    self._community.pop(data["id"], None)
+                else:
+                    self._community[data["id"]] = _normalize_community_trick(data)
+            if changes or not self._loaded.is_set():
+                self._reindex_locked()
+        self._loaded.set()
+    
+    def _reindex_locked(self):
+        """Sıralı listeyi ve kategori/etiket index'lerini yeniden kur"""
+        ordered = self._builtin + sorted(
+            self._community.values(), key=lambda t: t["title"].lower()
+        )
+        by_category: Dict[str, List[int]] = {}
+        by_tag: Dict[str, List[int]] = {}
+        by_word: Dict[str, List[int]] = {}
+        by_form: Dict[str, List[int]] = {}
+        for position, trick in enumerate(ordered):
+            by_category.setdefault(trick["category"], []).append(position)
+            by_tag.setdefault(trick["tag"], []).append(position)
+            surfaces, forms = set(), set()
+            for word in trick.get("relatedWords", []):
+                word_surfaces, word_forms = _word_keys(word)
+                surfaces.update(word_surfaces)
+                forms.update(word_forms)
+            for key in surfaces:
+                by_word.setdefault(key, []).append(position)
+            for key in forms:
+                by_form.setdefault(key, []).append(position)
+        
+        self._ordered = ordered
+        self._by_category = by_category
+        self._by_tag = by_tag
+        self._by_word = by_word
+        self._by_form = by_form
+        self._positions = {t["id"]: i for i, t in enumerate(ordered)}
+        
+        # Pozisyon -> en beğenilenler sıralamasındaki yeri
+        by_score = sorted(range(len(ordered)), key=lambda p: -ordered[p].get("score", 0))
+        score_rank = [0] * len(ordered)
+        for rank, position in enumerate(by_score):
+            score_rank[position] = rank
+        self._score_rank = score_rank
+    
+    def stop(self):
+        """Listener'ı durdur"""
+        with self._lock:
+            if self._watch is not None:
+                self._watch.unsubscribe()
+                self._watch = None
+    
+    # ---------- Sorgular ----------
+    
+    def _select(self, category: Optional[str], tag: Optional[str], sort: str = "default") -> List[int]:
+        positions = self._filter(category, tag)
+        if sort == "top":
+            return sorted(positions, key=self._score_rank.__getitem__)
+        return positions
+    
+    def _filter(self, category: Optional[str], tag: Optional[str]) -> List[int]:
+        if category and tag:
+            tag_positions = set(self._by_tag.get(tag, []))
+            return [p for p in self._by_category.get(category, []) if p in tag_positions]
+        if category:
+            return self._by_category.get(category, [])
+        if tag:
+            return self._by_tag.get(tag, [])
+        return list(range(len(self._ordered)))
+    
+    def categories(self) -> List[str]:
+        """Katalogda trick'i olan kategoriler"""
+        self.ensure_loaded()
+        with self._lock:
+            return [c for c in TRICK_CATEGORIES if c in self._by_category]
+    
+    def tags(self, category: Optional[str] = None) -> List[str]:
+        """Etiketler (ilk görülme sırasıyla)"""
+        self.ensure_loaded()
+        with self._lock:
+            seen = {}
+            for position in self._select(category, None):
+                seen.setdefault(self._ordered[position]["tag"], None)
+            return list(seen)
+    
+    def count(self, category: Optional[str] = None, tag: Optional[str] = None) -> int:
+        """Filtreye uyan trick sayısı"""
+        self.ensure_loaded()
+        with self._lock:
+            return len(self._select(category, tag))
+    
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        sort: str = "default"
+    ) -> List[Dict[str, Any]]:
+        """
+        Filtreye uyan trick'lerden offset'ten başlayan bir sayfa
+        
+        Args:
+            sort: "default" (yerleşikler önce) veya "top" (skora göre)
+        """
+        self.ensure_loaded()
+        with self._lock:
+            positions = self._select(category, tag, sort)
+            return [self._ordered[p] for p in positions[offset:offset + limit]]
+    
+    def tricks_for_word(self, english: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """
+        Kelimeyi ilgili kelimeleri arasında sayan trick'ler
+        
+        Kelime -> trick ters index'inden okunur; kart başına sorgu yapılmaz.
+        İlgili kelime kartın kendisi, yazım varyantı, kökü (abandoned ->
+        abandon) veya çekimi (abandon -> abandoned) olabilir.
+        """
+        self.ensure_loaded()
+        surfaces, forms = _word_keys(english)
+        with self._lock:
+            positions = set()
+            for key in forms:
+                positions.update(self._by_word.get(key, ()))
+            for key in surfaces:
+                positions.update(self._by_form.get(key, ()))
+            return [self._ordered[p] for p in sorted(positions)[:limit]]
+    
+    def get(self, trick_id: str) -> Optional[Dict[str, Any]]:
+        """ID ile trick getir"""
+        self.ensure_loaded()
+        with self._lock:
+            position = self._positions.get(trick_id)
+            return self._ordered[position] if position is not None else None
+
+
+@st.cache_resource
+def get_trick_catalog() -> TrickCatalog:
+    """Süreç genelinde paylaşılan trick kataloğu"""
+    return TrickCatalog()
@@ -0,0 +1,225 @@
+"""
+Trick Similarity Service
+In-memory near-duplicate detection for tricks (MinHash + LSH)
+"""
+
+import streamlit as st
+import hashlib
+import random
+import re
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from utils.constants import TRICK_SIMILARITY
+from utils.helpers import normalize_search_text
+
+_MASK_64 = (1 << 64) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Markdown ve noktalama işaretlerini atıp kelimelere ayır"""
+    return _TOKEN_PATTERN.findall(normalize_search_text(text))
+
+
+def trick_shingles(trick: Dict[str, Any]) -> Set[str]:
+    """
+    Trick metninden shingle kümesi üret
+    
+    Başlık, içerik ve ilgili kelimeler tek metin olarak ele alınır.
+    Tekil kelimeler yeniden sıralanmış kopyaları, ardışık kelime
+    çiftleri (shingle_size) ise ifade düzenini yakalar.
+    """
+    size = TRICK_SIMILARITY["shingle_size"]
+    tokens = _tokenize(trick.get("title", "")) + _tokenize(trick.get("content", ""))
+    shingles = set(tokens)
+    shingles.update(
+        " ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)
+    )
+    for word in trick.get("relatedWords", []) or []:
+        shingles.update(_tokenize(word))
+    return shingles
+
+
+def _hash_shingle(shingle: str) -> int:
+    """Süreçler arasında sabit 64-bit hash (Python hash() tohumlanır)"""
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class MinHasher:
+    """
+    Sabit tohumlu multiply-shift hash ailesiyle MinHash imzası
+    
+    ((a*x + b) mod 2^64) >> 32 - mod p aritmetiğine göre belirgin
+    şekilde hızlı, MinHash için yeterince bağımsız.
+    """
+    
+    def __init__(self, num_perm: int, seed: int):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [
+            (rng.getrandbits(64) | 1, rng.getrandbits(64))
+            for _ in range(num_perm)
+        ]
+    
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        """Shingle kümesinin MinHash imzası (boş küme için sabit imza)"""
+        if not shingles:
+            return tuple([_MAX_HASH] * self.num_perm)
+        
+        hashes = [_hash_shingle(s) for s in shingles]
+        return tuple(
+            min([(a * h + b) & _MASK_64 for h in hashes]) >> 32
+            for a, b in self._params
+        )
+
+
+def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """İki imzanın eşleşen bileşen oranı ~ Jaccard benzerliği"""
+    if not sig_a or len(sig_a) != len(sig_b):
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class TrickIndex:
+    """
+    Onaylı ve bekleyen trick'lerin MinHash/LSH index'i
+    
+    İmza bands x rows parçaya bölünür; herhangi bir bandı aynı olan
+    trick'ler aday sayılır. Sorgu yalnızca aynı kovadaki adaylarla
+    karşılaştırıldığı için maliyet koleksiyon boyutuyla doğrusal artmaz.
+    """
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built = False
+        self._hasher = MinHasher(TRICK_SIMILARITY["num_perm"], TRICK_SIMILARITY["seed"])
+        self._bands = TRICK_SIMILARITY["bands"]
+        self._rows = TRICK_SIMILARITY["num_perm"] // self._bands
+        # (band no, band değerleri) -> trick ID'leri
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._tricks: Dict[str, Dict[str, Any]] = {}
+    
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [
+            (band, signature[band * self._rows:(band + 1) * self._rows])
+            for band in range(self._bands)
+        ]
+    
+    def ensure_built(self):
+        """Index henüz doldurulmadıysa Firestore'dan yükle (hata olursa sonra tekrar denenir)"""
+        if self._built:
+            return
+        
+        from services.firebase_service import get_tricks_for_index
+        
+        tricks = get_tricks_for_index(["approved", "pending"])
+        if tricks is None:
+            return
+        # İmza hesaplama kilit dışında yapılır
+        signed = [
+            (trick, self._hasher.signature(trick_shingles(trick)))
+            for trick in tricks if trick.get("id")
+        ]
+        with self._lock:
+            if self._built:
+                return
+            for trick, signature in signed:
+                self._add_locked(trick, signature)
+            self._built = True
+    
+    def _add_locked(self, trick: Dict[str, Any], signature: Tuple[int, ...]):
+        trick_id = trick["id"]
+        if trick_id in self._signatures:
+            self._remove_locked(trick_id)
+        
+        self._signatures[trick_id] = signature
+        self._tricks[trick_id] = {
+            "id": trick_id,
+            "title": trick.get("title", ""),
+            "status": trick.get("status", "pending")
+        }
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, set()).add(trick_id)
+    
+    def _remove_locked(self, trick_id: str):
+        signature = self._signatures.pop(trick_id, None)
+        self._tricks.pop(trick_id, None)
+        if signature is None:
+            return
+        for key in self._band_keys(signature):
+            ids = self._buckets.get(key)
+            if ids:
+                ids.discard(trick_id)
+                if not ids:
+                    del self._buckets[key]
+    
+    def add(self, trick: Dict[str, Any], signature: Optional[Tuple[int, ...]] = None):
+        """Yeni trick'i index'e ekle (index henüz kurulmadıysa atlanır)"""
+        if not self._built or not trick.get("id"):
+            return
+        if signature is None:
+            signature = self._hasher.signature(trick_shingles(trick))
+        with self._lock:
+            if self._built:
+                self._add_locked(trick, signature)
+    
+    def set_status(self, trick_id: str, status: str):
+        """Trick'in durumunu güncelle; reddedilenler index'ten çıkar"""
+        with self._lock:
+            if trick_id not in self._tricks:
+                return
+            if status in ("approved", "pending"):
+                self._tricks[trick_id]["status"] = status
+            else:
+                self._remove_locked(trick_id)
+    
+    def signature_for(self, trick: Dict[str, Any]) -> Tuple[int, ...]:
+        """Trick'in MinHash imzası"""
+        return self._hasher.signature(trick_shingles(trick))
+    
+    def find_duplicates(
+        self,
+        trick: Dict[str, Any],
+        limit: int = 5,
+        signature: Optional[Tuple[int, ...]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Trick'e benzer mevcut trick'leri bul
+        
+        Returns:
+            Benzerliğe göre azalan sırada trick özetleri ("similarity" 0-1)
+        """
+        self.ensure_built()
+        if signature is None:
+            signature = self.signature_for(trick)
+        threshold = TRICK_SIMILARITY["threshold"]
+        
+        with self._lock:
+            candidates: Set[str] = set()
+            for key in self._band_keys(signature):
+                candidates.update(self._buckets.get(key, ()))
+            candidates.discard(trick.get("id"))
+            
+            matches = []
+            for trick_id in candidates:
+                similarity = estimate_similarity(signature, self._signatures[trick_id])
+                if similarity >= threshold:
+                    matches.append(dict(self._tricks[trick_id], similarity=round(similarity, 2)))
+        
+        matches.sort(key=lambda m: m["similarity"], reverse=True)
+        return matches[:limit]
+
+
+@st.cache_resource
+def get_trick_index() -> TrickIndex:
+    """Süreç genelinde paylaşılan trick index'i"""
+    return TrickIndex()
+
+
+def find_similar_tricks(trick: Dict[str, Any], limit: int = 5) -> List[Dict[str, Any]]:
+    """Trick eklerken benzer trick'leri bul (Firestore sorgusu yok)"""
+    return get_trick_index().find_duplicates(trick, limit=limit)
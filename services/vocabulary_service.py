@@ -0,0 +1,65 @@
+"""
+Vocabulary Service
+Process-wide, append-only word registry addressed by small integer indices
+"""
+
+import streamlit as st
+import threading
+from typing import Dict, Any, List, Optional
+
+# Oturum state'inde kelime yerine index tutan bileşenlerin ihtiyaç duyduğu alanlar
+VOCABULARY_FIELDS = ("id", "english", "turkish", "synonyms", "antonyms", "type", "completionItems")
+LIST_FIELDS = ("synonyms", "antonyms", "completionItems")
+
+
+class Vocabulary:
+    """
+    Kelimeleri süreç genelinde bir kez tutan salt-okunur kayıt
+
+    Her kelime ilk görüldüğünde sabit bir index alır ve bu index hiç
+    değişmez; oturumlar kelime dict'leri yerine bu index'leri saklar.
+    Kelime içeriği güncellenirse aynı index'teki kayıt yenilenir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, Any]] = []
+        self._index_of: Dict[str, int] = {}
+
+    def intern(self, word: Dict[str, Any]) -> int:
+        """Kelimenin index'ini döndür (yoksa ekle)"""
+        entry = {
+            field: (tuple(word.get(field) or ()) if field in LIST_FIELDS else word.get(field, ""))
+            for field in VOCABULARY_FIELDS
+        }
+
+        with self._lock:
+            index = self._index_of.get(entry["id"])
+            if index is None:
+                index = len(self._entries)
+                self._entries.append(entry)
+                self._index_of[entry["id"]] = index
+            elif self._entries[index] != entry:
+                self._entries[index] = entry
+            return index
+
+    def intern_many(self, words: List[Dict[str, Any]]) -> List[int]:
+        """Kelime listesinin index'leri"""
+        return [self.intern(word) for word in words]
+
+    def get(self, index: int) -> Dict[str, Any]:
+        """Index'teki kelime kaydı (değiştirilmemeli)"""
+        return self._entries[index]
+
+    def index_of(self, word_id: str) -> Optional[int]:
+        """Kelime ID'sinin index'i (kayıtlı değilse None)"""
+        return self._index_of.get(word_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@st.cache_resource
+def get_vocabulary() -> Vocabulary:
+    """Süreç genelinde paylaşılan kelime kaydı"""
+    return Vocabulary()
@@ -0,0 +1,447 @@
+"""
+Vocabulary Snapshot Service
+Memory-mapped columnar snapshot of approved words shared by all server processes
+"""
+
+import streamlit as st
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from utils.constants import EXAM_TYPES, VOCABULARY_SNAPSHOT
+
+try:
+    import fcntl
+except ImportError:  # Windows - süreçler arası kilit yok
+    fcntl = None
+
+MAGIC = b"LVSNAP01"
+_HEADER_LEN = struct.Struct("<I")
+_ALIGN = 8
+NO_TYPE = 0xFFFF
+
+
+def _pad(offset: int) -> int:
+    return -offset % _ALIGN
+
+
+def _encode_strings(values: List[str]) -> Tuple[np.ndarray, bytes]:
+    """String sütununu (uint64 offset'ler, UTF-8 blob) olarak kodla"""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(e) for e in encoded])
+    return offsets, b"".join(encoded)
+
+
+def write_vocabulary_snapshot(
+    words: List[Dict[str, Any]],
+    path: str = VOCABULARY_SNAPSHOT["path"],
+    generated_at: Optional[float] = None
+) -> int:
+    """
+    Kelimeleri sütunlu ikili dosyaya yaz
+    
+    Dosya düzeni: MAGIC, başlık uzunluğu, JSON başlık (kelime sayısı,
+    Firestore'dan tam okuma anı, tür ve sınav sözlükleri, bölüm
+    offset'leri), ardından 8 bayta hizalı
+    bölümler: difficulty (uint8), type (uint16), exams (uint64 bit
+    maskesi), id ve doc string sütunları (offset dizisi + UTF-8 blob). doc, kelimenin tamamının
+    JSON'udur ve sadece döndürülen satırlar için çözülür. Dosya geçici
+    isimle yazılıp atomik olarak yerine konur; okuyan süreçlerin açık
+    eşlemeleri eski dosyada kalır.
+    
+    Args:
+        generated_at: Kelimelerin Firestore'dan tam okunduğu an (None = şimdi);
+            yamalar eski snapshot'ın değerini korur
+    
+    Returns:
+        Yazılan kelime sayısı
+    """
+    words = sorted(words, key=lambda w: w["id"])
+    
+    types = sorted({w.get("type") for w in words if w.get("type")})
+    type_codes = {t: i for i, t in enumerate(types)}
+    exam_types = list(EXAM_TYPES)
+    for word in words:
+        for exam in word.get("examTypes") or []:
+            if exam not in exam_types:
+                exam_types.append(exam)
+    exam_bits = {exam: i for i, exam in enumerate(exam_types[:64])}
+    
+    difficulty = np.array([int(w.get("difficulty") or 0) for w in words], dtype=np.uint8)
+    word_type = np.array([type_codes.get(w.get("type"), NO_TYPE) for w in words], dtype=np.uint16)
+    exams = np.array([
+        sum(1 << exam_bits[e] for e in set(w.get("examTypes") or []) if e in exam_bits)
+        for w in words
+    ], dtype=np.uint64)
+    id_offsets, id_blob = _encode_strings([w["id"] for w in words])
+    doc_offsets, doc_blob = _encode_strings([
+        json.dumps(w, ensure_ascii=False, default=str) for w in words
+    ])
+    
+    sections = [
+        ("difficulty", difficulty.tobytes()),
+        ("type", word_type.tobytes()),
+        ("exams", exams.tobytes()),
+        ("id_offsets", id_offsets.tobytes()),
+        ("id_data", id_blob),
+        ("doc_offsets", doc_offsets.tobytes()),
+        ("doc_data", doc_blob)
+    ]
+    
+    # Bölüm offset'leri başlıktan sonraki hizalı veri başlangıcına göredir
+    layout, offset = {}, 0
+    for name, data in sections:
+        offset += _pad(offset)
+        layout[name] = [offset, len(data)]
+        offset += len(data)
+    header = json.dumps({
+        "count": len(words),
+        "generated_at": time.time() if generated_at is None else generated_at,
+        "types": types,
+        "exam_types": list(exam_bits),
+        "sections": layout
+    }).encode("utf-8")
+    header_end = len(MAGIC) + _HEADER_LEN.size + len(header)
+    data_start = header_end + _pad(header_end)
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        for name, data in sections:
+            f.write(b"\0" * (data_start + layout[name][0] - f.tell()))
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(words)
+
+
+class VocabularySnapshot:
+    """
+    Snapshot dosyasının salt-okunur, mmap'lenmiş görünümü
+    
+    Sütunlar kopyalanmadan mmap üzerinde numpy dizisi olarak açılır;
+    sayfalar işletim sisteminin önbelleğinde tüm süreçlerce paylaşılır,
+    süreç sayısı arttıkça bellek kullanımı artmaz. Filtreler sütunlar
+    üzerinde vektörel maske işlemleridir; sadece sonuçtaki satırların
+    JSON'u çözülür.
+    """
+    
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Geçersiz snapshot dosyası: {path}")
+        start = len(MAGIC) + _HEADER_LEN.size
+        (header_len,) = _HEADER_LEN.unpack_from(self._mmap, len(MAGIC))
+        header = json.loads(self._mmap[start:start + header_len])
+        data_start = start + header_len + _pad(start + header_len)
+        sections = {name: (data_start + offset, size) for name, (offset, size) in header["sections"].items()}
+        
+        self.count: int = header["count"]
+        self.generated_at: float = header.get("generated_at", 0.0)
+        self.types: List[str] = header["types"]
+        self._type_codes = {t: i for i, t in enumerate(self.types)}
+        self._exam_bits = {exam: i for i, exam in enumerate(header["exam_types"])}
+        
+        def column(name: str, dtype) -> np.ndarray:
+            offset, size = sections[name]
+            return np.frombuffer(self._mmap, dtype=dtype, count=size // np.dtype(dtype).itemsize, offset=offset)
+        
+        self.difficulty = column("difficulty", np.uint8)
+        self.word_type = column("type", np.uint16)
+        self.exams = column("exams", np.uint64)
+        self._id_offsets = column("id_offsets", np.uint64)
+        self._id_data = sections["id_data"][0]
+        self._doc_offsets = column("doc_offsets", np.uint64)
+        self._doc_data = sections["doc_data"][0]
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _string(self, offsets: np.ndarray, base: int, row: int) -> str:
+        return self._mmap[base + int(offsets[row]):base + int(offsets[row + 1])].decode("utf-8")
+    
+    def select(
+        self,
+        exam_type: Optional[str] = None,
+        difficulty: Optional[Any] = None,
+        word_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Filtreye uyan satır numaraları (ID sırasıyla)
+        
+        "all" veya boş değerler filtre uygulamaz.
+        """
+        mask = None
+        
+        def combine(condition):
+            return condition if mask is None else mask & condition
+        
+        if exam_type and exam_type != "all":
+            bit = self._exam_bits.get(exam_type)
+            if bit is None:
+                return np.empty(0, dtype=np.intp)
+            mask = combine((self.exams & np.uint64(1 << bit)) != 0)
+        if difficulty and difficulty != "all":
+            mask = combine(self.difficulty == int(difficulty))
+        if word_type:
+            code = self._type_codes.get(word_type)
+            if code is None:
+                return np.empty(0, dtype=np.intp)
+            mask = combine(self.word_type == code)
+        
+        if mask is None:
+            rows = np.arange(self.count if limit is None else min(limit, self.count))
+        else:
+            rows = np.flatnonzero(mask)
+        return rows if limit is None else rows[:limit]
+    
+    def word_id(self, row: int) -> str:
+        return self._string(self._id_offsets, self._id_data, row)
+    
+    def word(self, row: int) -> Dict[str, Any]:
+        """Satırdaki kelimenin tamamı (her çağrıda yeni dict)"""
+        return json.loads(self._string(self._doc_offsets, self._doc_data, row))
+    
+    def words(self, rows) -> List[Dict[str, Any]]:
+        return [self.word(int(row)) for row in rows]
+    
+    def query(
+        self,
+        exam_type: Optional[str] = None,
+        difficulty: Optional[Any] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Filtreye uyan kelimeler (_get_words_cached ile aynı sıra ve biçim)"""
+        return self.words(self.select(exam_type, difficulty, limit=limit))
+
+
+class _SnapshotHolder:
+    """
+    Süreçteki açık snapshot; dosya değiştiğinde yeniden eşler
+    
+    Değişen kelime ID'leri biriktirilir ve tek bir arka plan görevi
+    tarafından işlenir; görev çalışırken gelen ID'ler bir sonraki tek
+    yeniden yazıma eklenir. Yama başarısız olursa veya snapshot max_age'den
+    eskiyse snapshot kullanılmaz (Firestore'a düşülür) ve arka planda
+    baştan kurulur.
+    """
+    
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._snapshot: Optional[VocabularySnapshot] = None
+        
+        self._tasks_lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._draining = False
+        self._rebuild: Optional[Future] = None
+        self._rebuild_at = 0.0
+    
+    def _mapped(self) -> Optional[VocabularySnapshot]:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        
+        with self._lock:
+            if self._snapshot is None or self._snapshot.signature != signature:
+                try:
+                    self._snapshot = VocabularySnapshot(self._path)
+                except (OSError, ValueError):
+                    return None
+            return self._snapshot
+    
+    def current(self) -> Optional[VocabularySnapshot]:
+        snapshot = self._mapped()
+        if snapshot is None:
+            return None
+        
+        # Kaçırılmış yamalar süresiz kalmasın
+        if time.time() - snapshot.generated_at > VOCABULARY_SNAPSHOT["max_age"]:
+            self.schedule_rebuild()
+            return None
+        return snapshot
+    
+    def schedule_rebuild(self, force: bool = False):
+        """
+        Snapshot'ı arka planda baştan kur
+        
+        Args:
+            force: False ise sadece eskimişse ve en fazla retry_interval'de
+                bir kurulur; True ise (başarısız yama) hemen kurulur
+        """
+        from services.task_service import submit_task
+        
+        with self._tasks_lock:
+            if self._rebuild is not None and not self._rebuild.done():
+                return
+            if not force and time.time() < self._rebuild_at:
+                return
+            self._rebuild_at = time.time() + VOCABULARY_SNAPSHOT["retry_interval"]
+            self._rebuild = submit_task(build_vocabulary_snapshot if force else _rebuild_if_stale, self._path)
+    
+    def schedule_refresh(self, word_ids: Iterable[str]):
+        """Değişen kelimeleri sıraya al; çalışan görev yoksa başlat"""
+        from services.task_service import submit_task
+        
+        with self._tasks_lock:
+            self._pending.update(word_ids)
+            if self._draining or not self._pending:
+                return
+            self._draining = True
+        try:
+            submit_task(self._drain)
+        except Exception:
+            with self._tasks_lock:
+                self._draining = False
+            raise
+    
+    def _drain(self):
+        """Biriken ID'leri, kuyruk boşalana kadar tek yazımda işle"""
+        while True:
+            with self._tasks_lock:
+                word_ids, self._pending = self._pending, set()
+                if not word_ids:
+                    self._draining = False
+                    return
+            
+            try:
+                refresh_vocabulary_snapshot(list(word_ids), self._path)
+            except Exception:
+                self.schedule_rebuild(force=True)
+
+
+@st.cache_resource
+def _get_snapshot_holder() -> _SnapshotHolder:
+    return _SnapshotHolder(VOCABULARY_SNAPSHOT["path"])
+
+
+def get_vocabulary_snapshot() -> Optional[VocabularySnapshot]:
+    """Güncel snapshot (dosya yoksa veya eskiyse None - Firestore'a düşülür)"""
+    return _get_snapshot_holder().current()
+
+
+def schedule_snapshot_refresh(word_ids: Iterable[str]):
+    """Değişen kelimeleri snapshot'a arka planda, toplu olarak işle"""
+    _get_snapshot_holder().schedule_refresh(word_ids)
+
+
+@contextmanager
+def _writer_lock(path: str):
+    """Aynı dosyayı güncelleyen süreçleri sıraya sok"""
+    if fcntl is None:
+        yield
+        return
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def build_vocabulary_snapshot(path: str = VOCABULARY_SNAPSHOT["path"]) -> int:
+    """
+    Tüm onaylı kelimeleri Firestore'dan okuyup snapshot'ı baştan yaz
+    
+    Returns:
+        Yazılan kelime sayısı
+    """
+    from services.firebase_service import get_approved_words_page, get_db
+    
+    # Bağlantı yokken boş snapshot yazılırsa uygulama boş liste gösterir
+    if not get_db():
+        raise RuntimeError("Firebase bağlantısı kurulamadı")
+    
+    page_size = VOCABULARY_SNAPSHOT["page_size"]
+    words, start_after_id = [], None
+    while True:
+        page = get_approved_words_page(page_size, start_after_id)
+        if page is None:
+            # Yarım okunan liste snapshot'ı sessizce eksik bırakır
+            raise RuntimeError("Onaylı kelimeler okunamadı")
+        words.extend(page)
+        if len(page) < page_size:
+            break
+        start_after_id = page[-1]["id"]
+    
+    with _writer_lock(path):
+        return write_vocabulary_snapshot(words, path)
+
+
+def _rebuild_if_stale(path: str) -> int:
+    """Başka bir süreç yeniden kurmadıysa snapshot'ı baştan kur"""
+    # Aynı anda eskiyi gören süreçler sırayla girer; sonrakiler taze dosyayı görür
+    with _writer_lock(f"{path}.rebuild"):
+        try:
+            if time.time() - VocabularySnapshot(path).generated_at <= VOCABULARY_SNAPSHOT["max_age"]:
+                return 0
+        except (OSError, ValueError):
+            pass
+        return build_vocabulary_snapshot(path)
+
+
+def refresh_vocabulary_snapshot(word_ids: List[str], path: str = VOCABULARY_SNAPSHOT["path"]) -> bool:
+    """
+    Değişen kelimeleri snapshot'a işle (arka plan görevi)
+    
+    Dosyadaki kelimeler korunur, sadece word_ids Firestore'dan yeniden
+    okunur; onaylı olmayanlar çıkarılır. Snapshot hiç oluşturulmadıysa
+    bir şey yapılmaz. Snapshot'ın tam okuma anı (generated_at) korunur.
+    
+    Returns:
+        Snapshot güncellendiyse True
+    
+    Raises:
+        RuntimeError: Değişen kelimeler okunamadı (snapshot eskimiş kalır)
+    """
+    from services.firebase_service import get_words_by_ids
+    
+    if not word_ids or not os.path.exists(path):
+        return False
+    
+    changed = get_words_by_ids(list(word_ids))
+    if not changed:
+        # Kelimeler silinmediği için boş sonuç okuma hatasıdır
+        raise RuntimeError("Değişen kelimeler okunamadı")
+    
+    with _writer_lock(path):
+        snapshot = VocabularySnapshot(path)
+        removed = {w["id"] for w in changed}
+        words = [
+            snapshot.word(row) for row in range(len(snapshot))
+            if snapshot.word_id(row) not in removed
+        ]
+        words.extend(w for w in changed if w.get("status") == "approved")
+        write_vocabulary_snapshot(words, path, snapshot.generated_at)
+    return True
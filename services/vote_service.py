@@ -0,0 +1,127 @@
+"""
+Vote Service
+Sharded trick voting with periodically materialized scores
+"""
+
+import streamlit as st
+import atexit
+import random
+import threading
+from typing import Dict, Any, Set
+
+from utils.constants import VOTE_SETTINGS
+
+
+class ScoreMaterializer:
+    """
+    Oy alan trick'lerin shard toplamlarını periyodik olarak trick
+    dokümanına yazan arka plan görevi
+
+    Trick dokümanı oy başına değil aralık başına bir kez yazılır; böylece
+    popüler bir trick'e gelen oylar doküman başına yazma sınırına takılmaz.
+    "score" alanı en beğenilen sıralaması için kullanılır.
+    """
+
+    def __init__(self, interval: int):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._dirty: Set[str] = set()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def mark_dirty(self, trick_id: str):
+        """Trick'i bir sonraki hesaplamaya ekle"""
+        with self._lock:
+            self._dirty.add(trick_id)
+
+    def materialize(self) -> int:
+        """Bekleyen trick'lerin skorlarını hesapla ve yaz"""
+        from services.firebase_service import sum_trick_vote_shards, update_trick_scores
+
+        with self._lock:
+            trick_ids, self._dirty = self._dirty, set()
+        if not trick_ids:
+            return 0
+
+        scores = {}
+        try:
+            for trick_id in trick_ids:
+                totals = sum_trick_vote_shards(trick_id)
+                totals["score"] = totals["upvotes"] - totals["downvotes"]
+                scores[trick_id] = totals
+            written = update_trick_scores(scores)
+        except Exception:
+            written = False
+
+        if not written:
+            # Bir sonraki periyotta tekrar denenir
+            with self._lock:
+                self._dirty.update(trick_ids)
+            return 0
+        return len(scores)
+
+    def start(self):
+        """Periyodik hesaplama thread'ini başlat"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="vote-materializer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Thread'i durdur ve bekleyen skorları yaz"""
+        self._stop.set()
+        self.materialize()
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self.materialize()
+
+
+@st.cache_resource
+def get_score_materializer() -> ScoreMaterializer:
+    """Süreç genelinde paylaşılan skor hesaplayıcı"""
+    materializer = ScoreMaterializer(VOTE_SETTINGS["materialize_interval"])
+    materializer.start()
+    return materializer
+
+
+def get_user_votes(user_id: str) -> Dict[str, int]:
+    """Kullanıcının oylarını getir (oturum boyunca tek okuma)"""
+    from services.firebase_service import get_user_trick_votes
+
+    cache = st.session_state.setdefault("trick_votes", {})
+    if user_id not in cache:
+        cache[user_id] = get_user_trick_votes(user_id)
+    return cache[user_id]
+
+
+def vote_trick(trick_id: str, user_id: str, value: int) -> Dict[str, Any]:
+    """
+    Trick'e oy ver; aynı oyu tekrar vermek oyu geri alır
+
+    Args:
+        value: 1 (beğen) veya -1 (beğenme)
+
+    Returns:
+        {"success": bool, "vote": int, "error": str}
+    """
+    from services.firebase_service import record_trick_vote
+
+    votes = get_user_votes(user_id)
+    if votes.get(trick_id) == value:
+        value = 0
+
+    shard_id = random.randrange(VOTE_SETTINGS["num_shards"])
+    result = record_trick_vote(trick_id, user_id, value, shard_id)
+    if not result["success"]:
+        return result
+
+    if value:
+        votes[trick_id] = value
+    else:
+        votes.pop(trick_id, None)
+
+    if result["changed"]:
+        get_score_materializer().mark_dirty(trick_id)
+    return result
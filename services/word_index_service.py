@@ -0,0 +1,390 @@
+"""
+Word Index Service
+In-memory near-duplicate detection for the vocabulary (BK-tree + lemmatizer)
+"""
+
+import streamlit as st
+import threading
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from utils.constants import WORD_INDEX
+
+# İngiliz -> Amerikan yazım eşlemeleri (kelime sonu)
+_SPELLING_SUFFIXES = [
+    ("isation", "ization"),
+    ("ising", "izing"),
+    ("ised", "ized"),
+    ("ises", "izes"),
+    ("ise", "ize"),
+    ("ysing", "yzing"),
+    ("ysed", "yzed"),
+    ("yse", "yze"),
+    ("ours", "ors"),
+    ("oured", "ored"),
+    ("our", "or"),
+    ("tres", "ters"),
+    ("tre", "ter"),
+    ("ogue", "og"),
+]
+
+# Ek kuralıyla yakalanamayan kelimeler (-ence/-ense genel bir kural değil:
+# evidence, influence)
+_SPELLING_WORDS = {
+    "defence": "defense",
+    "offence": "offense",
+    "licence": "license",
+    "pretence": "pretense"
+}
+
+# İngilizcede çekimde l'si ikilenen kökler (travelled -> traveled); genel
+# "lled -> led" kuralı filled/filed gibi farklı kelimeleri birleştirir
+_DOUBLE_L_ROOTS = {
+    "travel", "cancel", "label", "model", "level", "fuel", "signal",
+    "counsel", "quarrel", "marvel", "total", "equal", "channel", "tunnel",
+    "dial", "duel", "jewel", "panel", "pedal", "shovel", "libel", "rival",
+    "refuel", "funnel", "unravel", "enrol", "fulfil"
+}
+
+# Kısa kelimelerde yazım kuralları yanlış pozitif üretmesin
+_MIN_SPELLING_LENGTH = 5
+
+# -ly atıldıktan sonra kalması gereken en kısa kök (early -> ear olmasın)
+_MIN_LY_STEM = 4
+
+
+def _normalize_spelling(word: str) -> str:
+    """İngiliz yazımını Amerikan yazımına çevir (colour -> color)"""
+    if len(word) < _MIN_SPELLING_LENGTH:
+        return word
+    if word in _SPELLING_WORDS:
+        return _SPELLING_WORDS[word]
+    for suffix, replacement in (("lled", "led"), ("lling", "ling")):
+        root = word[:-len(suffix) + 1]
+        if word.endswith(suffix) and root in _DOUBLE_L_ROOTS:
+            return root + replacement[1:]
+    for british, american in _SPELLING_SUFFIXES:
+        if word.endswith(british):
+            return word[: -len(british)] + american
+    return word
+
+
+def lemma_candidates(word: str) -> Set[str]:
+    """
+    Kelimenin olası kök biçimlerini üret (hafif, kural tabanlı lemmatizer)
+    
+    Tek bir "doğru" kök bulmak yerine olası kökler kümesi üretilir;
+    kümede gerçek olmayan kökler de bulunur (abandone). Bu yüzden iki
+    kelime, biri diğerinin kümesinde geçiyorsa aynı kelimenin çekimi
+    sayılır; kümelerin sadece kesişmesi yetmez (filled/filed ikisi de
+    "fil" üretir). Küme kelimenin kendisini ve yazım varyantlarını da içerir.
+    Örn: "abandoned" -> {"abandoned", "abandon", "abandone"}
+    """
+    word = word.lower().strip()
+    candidates = {word}
+    
+    if len(word) > 4:
+        if word.endswith("ies") or word.endswith("ied"):
+            candidates.add(word[:-3] + "y")
+        if word.endswith("es"):
+            candidates.add(word[:-2])
+        if word.endswith("s") and not word.endswith("ss"):
+            candidates.add(word[:-1])
+        if word.endswith("ed"):
+            stem = word[:-2]
+            candidates.update({stem, stem + "e", word[:-1]})
+            if len(stem) > 2 and stem[-1] == stem[-2]:
+                candidates.add(stem[:-1])
+        if word.endswith("ing"):
+            stem = word[:-3]
+            candidates.update({stem, stem + "e"})
+            if len(stem) > 2 and stem[-1] == stem[-2]:
+                candidates.add(stem[:-1])
+        if word.endswith("ly") and len(word) - 2 >= _MIN_LY_STEM:
+            candidates.add(word[:-2])
+        if word.endswith("ily"):
+            candidates.add(word[:-3] + "y")
+    
+    candidates = {c for c in candidates if len(c) >= 2}
+    return candidates | {_normalize_spelling(c) for c in candidates}
+
+
+def surface_forms(word: str) -> Set[str]:
+    """Kelimenin kendisi ve yazım varyantı (kök üretilmez)"""
+    word = word.lower().strip()
+    return {word, _normalize_spelling(word)} if word else set()
+
+
+def is_form_of(word: str, other: str) -> bool:
+    """word, other'ın kendisi, yazım varyantı veya bir çekimi mi"""
+    return bool(surface_forms(other) & lemma_candidates(word))
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    İki kelime arasındaki düzenleme mesafesi
+    
+    max_distance verilirse satır minimumu bu değeri aştığında erken çıkılır.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > (max_distance if max_distance is not None else len(a) + len(b)):
+        return max_distance + 1
+    
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    
+    return previous[-1]
+
+
+class BKTree:
+    """Düzenleme mesafesi üzerinde BK-tree (metrik ağaç)"""
+    
+    def __init__(self):
+        # Düğüm: [term, {distance: child_node}]
+        self._root: Optional[list] = None
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def add(self, term: str):
+        if self._root is None:
+            self._root = [term, {}]
+            self._size = 1
+            return
+        
+        node = self._root
+        while True:
+            distance = levenshtein(term, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [term, {}]
+                self._size += 1
+                return
+            node = child
+    
+    def search(self, term: str, max_distance: int) -> List[Tuple[int, str]]:
+        """max_distance içindeki terimleri (mesafe, terim) olarak döndür"""
+        if self._root is None:
+            return []
+        
+        results = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(term, node[0])
+            if distance <= max_distance:
+                results.append((distance, node[0]))
+            # Üçgen eşitsizliği: sadece [d - max, d + max] aralığındaki çocuklar
+            for child_distance, child in node[1].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        
+        return sorted(results)
+
+
+def _max_distance_for(word: str) -> int:
+    """Kelime uzunluğuna göre kabul edilen yazım farkı"""
+    if len(word) <= 4:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+class WordIndex:
+    """
+    Onaylı ve bekleyen kelimelerin bellek içi benzerlik index'i
+    
+    İlk sorguda Firestore'dan doldurulur; sonrasında add_word /
+    reject_word ile artımlı güncellenir ve sorgular Firestore'a gitmez.
+    Diğer sunucu süreçlerindeki değişiklikler için refresh_interval'den
+    eski index arka planda yeniden yüklenir; bu sırada eski index
+    kullanılmaya devam eder.
+    """
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built = False
+        self._loaded_at = 0.0
+        self._reloading = False
+        self._tree = BKTree()
+        # yazım (kelime veya yazım varyantı) -> kelime ID'leri
+        self._terms: Dict[str, Set[str]] = {}
+        # olası kök -> kelime ID'leri (sadece sorgunun yazımıyla aranır)
+        self._forms: Dict[str, Set[str]] = {}
+        self._words: Dict[str, Dict[str, Any]] = {}
+    
+    def ensure_built(self):
+        """Index henüz doldurulmadıysa Firestore'dan yükle (hata olursa sonra tekrar denenir)"""
+        if self._built:
+            if time.time() - self._loaded_at > WORD_INDEX["refresh_interval"]:
+                self._schedule_reload()
+            return
+        
+        from services.firebase_service import get_words_for_index
+        
+        words = get_words_for_index(["approved", "pending"])
+        if words is None:
+            return
+        with self._lock:
+            if self._built:
+                return
+            for word in words:
+                self._add_locked(word)
+            self._loaded_at = time.time()
+            self._built = True
+    
+    def _schedule_reload(self):
+        from services.task_service import submit_task
+        
+        with self._lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        try:
+            submit_task(self._reload)
+        except Exception:
+            with self._lock:
+                self._reloading = False
+    
+    def _reload(self):
+        """Index'i baştan kur ve mevcut index ile değiştir (arka plan görevi)"""
+        from services.firebase_service import get_words_for_index
+        
+        try:
+            words = get_words_for_index(["approved", "pending"])
+            if words is None:
+                return
+            
+            # Yeni index kilit dışında kurulur, sorgular eskisini kullanır
+            fresh = WordIndex()
+            for word in words:
+                fresh._add_locked(word)
+            with self._lock:
+                self._tree = fresh._tree
+                self._terms = fresh._terms
+                self._forms = fresh._forms
+                self._words = fresh._words
+                self._loaded_at = time.time()
+        finally:
+            with self._lock:
+                self._reloading = False
+    
+    def _add_locked(self, word: Dict[str, Any]):
+        word_id = word.get("id")
+        english = (word.get("english") or "").lower().strip()
+        if not word_id or not english:
+            return
+        
+        self._words[word_id] = {
+            "id": word_id,
+            "english": english,
+            "turkish": word.get("turkish", ""),
+            "status": word.get("status", "pending")
+        }
+        for term in surface_forms(english):
+            if term not in self._terms:
+                self._terms[term] = set()
+                self._tree.add(term)
+            self._terms[term].add(word_id)
+        for form in lemma_candidates(english):
+            self._forms.setdefault(form, set()).add(word_id)
+    
+    def add(self, word: Dict[str, Any]):
+        """Yeni kelimeyi index'e ekle (index henüz kurulmadıysa atlanır)"""
+        with self._lock:
+            if self._built:
+                self._add_locked(word)
+    
+    def set_status(self, word_id: str, status: str):
+        """Kelimenin durumunu güncelle; reddedilenler index'ten çıkar"""
+        with self._lock:
+            word = self._words.get(word_id)
+            if not word:
+                return
+            if status in ("approved", "pending"):
+                word["status"] = status
+                return
+            
+            del self._words[word_id]
+            for index, terms in (
+                (self._terms, surface_forms(word["english"])),
+                (self._forms, lemma_candidates(word["english"]))
+            ):
+                for term in terms:
+                    ids = index.get(term)
+                    if ids:
+                        ids.discard(word_id)
+            # BK-tree'deki boş terimler kalır; sorgu sonucunda elenir
+    
+    def find_similar(self, english: str, limit: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Kelimenin aynısını ve benzerlerini bul
+        
+        Returns:
+            {"exact": [...], "similar": [...]} - her eleman kelime özeti ve
+            "distance" (0 = aynı kök/yazım varyantı)
+        """
+        self.ensure_built()
+        english = english.lower().strip()
+        if not english:
+            return {"exact": [], "similar": []}
+        
+        max_distance = _max_distance_for(english)
+        
+        with self._lock:
+            exact_ids = {
+                i for i in self._terms.get(english, ())
+                if self._words.get(i, {}).get("english") == english
+            }
+            matches: Dict[str, int] = {}
+            
+            # Aynı kök veya yazım varyantı (analyse/analyze, abandoned/abandon):
+            # kayıtlı kelime sorgunun köklerinden biri ya da sorgu kayıtlı
+            # kelimenin köklerinden biri olmalı
+            for term in lemma_candidates(english):
+                for word_id in self._terms.get(term, ()):
+                    matches[word_id] = 0
+            for term in surface_forms(english):
+                for word_id in self._forms.get(term, ()):
+                    matches[word_id] = 0
+            
+            # Yazım hataları / küçük farklar
+            if max_distance:
+                for distance, term in self._tree.search(english, max_distance):
+                    for word_id in self._terms.get(term, ()):
+                        matches[word_id] = min(matches.get(word_id, distance), distance)
+            
+            exact = [dict(self._words[i], distance=0) for i in exact_ids if i in self._words]
+            similar = [
+                dict(self._words[i], distance=d)
+                for i, d in sorted(matches.items(), key=lambda item: item[1])
+                if i not in exact_ids and i in self._words
+            ]
+        
+        return {"exact": exact, "similar": similar[:limit]}
+
+
+@st.cache_resource
+def get_word_index() -> WordIndex:
+    """Süreç genelinde paylaşılan kelime index'i"""
+    return WordIndex()
+
+
+def find_similar_words(english: str, limit: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+    """Kelime eklerken aynı/benzer kelimeleri bul (Firestore sorgusu yok)"""
+    return get_word_index().find_similar(english, limit=limit)
@@ -116,6 +116,22 @@ BADGES = {
     }
 }
 
+# Rozet türü -> değeri karşılaştırılan kullanıcı istatistiği
+BADGE_STAT_FIELDS = {
+    "contribution": "wordsContributed",
+    "learning": "wordsLearned",
+    "streak": "currentStreak",
+    "quiz": "highScoreQuizzes"
+}
+
+# Olay -> kontrol edilecek rozet türleri (listede olmayan olaylar tüm türleri kontrol eder)
+BADGE_EVENT_TYPES = {
+    "word_approved": ["contribution"],
+    "word_learned": ["learning"],
+    "daily_login": ["streak"],
+    "quiz_complete": ["quiz"]
+}
+
 # Puan Sistemi
 POINTS = {
     "word_approved": 10,      # Kelime onaylandığında
@@ -128,6 +144,20 @@ POINTS = {
     "word_learned": 1         # Yeni kelime öğrenme
 }
 
+# Seviyeler (puan aralıkları)
+LEVELS = [
+    {"level": 1, "name": "Başlangıç", "min": 0, "max": 50, "icon": "🌱"},
+    {"level": 2, "name": "Acemi", "min": 50, "max": 150, "icon": "🌿"},
+    {"level": 3, "name": "Öğrenci", "min": 150, "max": 300, "icon": "📖"},
+    {"level": 4, "name": "Çalışkan", "min": 300, "max": 500, "icon": "📚"},
+    {"level": 5, "name": "Azimli", "min": 500, "max": 800, "icon": "🎯"},
+    {"level": 6, "name": "Bilgili", "min": 800, "max": 1200, "icon": "🧠"},
+    {"level": 7, "name": "Uzman", "min": 1200, "max": 2000, "icon": "🎓"},
+    {"level": 8, "name": "Usta", "min": 2000, "max": 3500, "icon": "👨‍🏫"},
+    {"level": 9, "name": "Efsane", "min": 3500, "max": 5000, "icon": "🏆"},
+    {"level": 10, "name": "Dahi", "min": 5000, "max": float('inf'), "icon": "💎"}
+]
+
 # Quiz Ayarları
 QUIZ_SETTINGS = {
     "default_question_count": 10,
@@ -200,5 +230,149 @@ JSON formatında döndür:
     "sentence": "The scientist had to ______ the experiment due to lack of funding.",
     "correct": "abandon",
     "options": ["abandon", "enhance", "pursue", "maintain"]
-}"""
+}""",
+
+    "word_enrichment": """Sen bir YDS/İngilizce sınav uzmanısın. Listedeki her kelime için öğrenme içeriği hazırla.
+
+Her kelime için:
+1. sentence: Kelimeyi kullanan 15-25 kelimelik akademik bir İngilizce cümle
+2. translation: Cümlenin akıcı Türkçe çevirisi
+3. explanation: Kelimenin kullanım bağlamını anlatan en fazla 2 cümlelik Türkçe açıklama
+4. hint: Kelimeyi hatırlatan kısa, eğlenceli Türkçe ipucu (ses benzerliği, görsel çağrışım)
+5. completion: Kelimenin boşluk (______) olarak bırakıldığı farklı bir cümle, doğru cevap ve
+   doğru cevap dahil 4 şık (diğer 3 şık aynı türde ama cümleye uymayan kelimeler)
+
+SADECE aşağıdaki JSON formatında yanıt ver:
+{"words": [{"english": "abandon", "sentence": "...", "translation": "...", "explanation": "...", "hint": "...",
+"completion": {"sentence": "The team had to ______ the project.", "correct": "abandon", "options": ["abandon", "enhance", "pursue", "maintain"]}}]}""",
+
+    "completion_pool": """Sen bir YDS/İngilizce sınav uzmanısın. Listedeki her kelime için istenen sayıda cümle tamamlama sorusu oluştur.
+
+Kurallar:
+- Her soru farklı bir akademik cümle olsun ve cümlede tek bir boşluk (______) bulunsun
+- Doğru cevap verilen kelime (gerekirse cümleye uygun çekimi) olsun
+- Doğru cevap dahil 4 farklı şık olsun; yanlış şıklar aynı türde ama cümleye uymayan kelimeler olsun
+
+SADECE aşağıdaki JSON formatında yanıt ver:
+{"words": [{"english": "abandon", "items": [{"sentence": "The scientist had to ______ the experiment.", "correct": "abandon", "options": ["abandon", "enhance", "pursue", "maintain"]}]}]}"""
+}
+
+# Kimlik Doğrulama Ayarları
+AUTH_SETTINGS = {
+    "legacy_email_lookup": False    # emails/ index'i olmayan eski kullanıcılar için where() sorgusu (göç bitene kadar)
+}
+
+# Şifre Hashleme Ayarları (scrypt)
+PASSWORD_SETTINGS = {
+    "target_verify_ms": 100,    # Kalibrasyonda hedeflenen doğrulama süresi
+    "min_n": 2 ** 14,           # scrypt CPU/bellek maliyeti alt sınırı
+    "max_n": 2 ** 17,           # scrypt CPU/bellek maliyeti üst sınırı
+    "r": 8,
+    "p": 1,
+    "salt_bytes": 16,
+    "key_bytes": 32,
+    "max_workers": 2,           # Aynı anda çalışabilecek KDF sayısı
+    "max_queue": 8,             # Havuzda bekleyebilecek KDF sayısı (fazlası reddedilir)
+    "verify_timeout": 5,        # saniye
+    "cache_size": 512,          # Doğrulama cache'indeki en fazla kayıt
+    "cache_ttl": 600            # saniye
+}
+
+# Arka Plan Görevleri
+BACKGROUND_SETTINGS = {
+    "max_workers": 4            # Sunucu başına arka plan thread sayısı
+}
+
+# Puan/İstatistik Yazma Tamponu (write-behind)
+STATS_BUFFER = {
+    "flush_interval": 10,       # saniye - periyodik toplu yazma aralığı
+    "max_pending_events": 25,   # Bu kadar olay biriken kullanıcı hemen yazılır
+    "snapshot_ttl": 300,        # saniye - okunan kullanıcı verisinin tazelik süresi
+    "max_snapshots": 2000       # Bellekte tutulan en fazla kullanıcı verisi (LRU ile silinir)
+}
+
+# Kelime Benzerlik Index'i (BK-tree, süreç başına)
+WORD_INDEX = {
+    "refresh_interval": 300     # saniye - diğer süreçlerdeki değişiklikler için yeniden yükleme aralığı
+}
+
+# Trick Benzerlik Index'i (MinHash + LSH)
+TRICK_SIMILARITY = {
+    "num_perm": 64,             # MinHash imza uzunluğu
+    "bands": 16,                # LSH bant sayısı (bant başına 4 satır)
+    "shingle_size": 2,          # Ardışık kelime grubu uzunluğu
+    "threshold": 0.5,           # Bu benzerliğin üstü olası kopya sayılır
+    "seed": 42                  # Permütasyonlar süreçler arasında aynı kalsın
+}
+
+# Trick Kataloğu
+TRICK_CATALOG = {
+    "load_timeout": 10,         # saniye - ilk snapshot için en fazla bekleme
+    "fallback_refresh": 300,    # saniye - listener yoksa yeniden yükleme aralığı
+    "fallback_limit": 500,      # Listener yoksa okunacak en fazla trick
+    "page_size": 10             # Trick listesinde sayfa başına başlık
+}
+
+# Trick Oylama (dağıtık sayaç)
+VOTE_SETTINGS = {
+    "num_shards": 10,           # Trick başına sayaç shard sayısı
+    "materialize_interval": 60  # saniye - skorların trick dokümanına yazılma aralığı
+}
+
+# Toplu Rozet Düzeltme İşi
+BACKFILL_SETTINGS = {
+    "page_size": 500,           # Sayfa başına okunan kullanıcı
+    "checkpoint_path": "backfill_checkpoint.json"
+}
+
+# Streak Ayarları
+STREAK_SETTINGS = {
+    "default_timezone": "Europe/Istanbul",  # Kullanıcıda saat dilimi yoksa
+    "timezones": [                          # Profilde seçilebilen saat dilimleri
+        "Europe/Istanbul", "Europe/London", "Europe/Berlin", "Europe/Moscow",
+        "Asia/Dubai", "Asia/Baku", "Asia/Tokyo", "Australia/Sydney",
+        "America/New_York", "America/Chicago", "America/Los_Angeles", "UTC"
+    ],
+    "reset_batch_size": 500                 # Gece işinde sorgu başına kullanıcı
+}
+
+# Kelime Kartı AI İçeriği (önbellek + ön yükleme)
+FLASHCARD_AI = {
+    "prefetch_count": 3,        # Okunan kartın ardından ön yüklenecek kart sayısı
+    "cache_size": 500,          # Süreç genelinde tutulan en fazla AI içeriği
+    "max_workers": 2,           # AI içeriği üreten thread sayısı (ortak arka plan havuzundan ayrı)
+    "prefetch_queue": 6,        # Bekleyebilecek en fazla ön yükleme (fazlası atlanır)
+    "wait_timeout": 30,         # Butona basıldığında sonucu bekleme süresi (saniye)
+    "shared_ttl": 86400         # Süreçler arası önbellekte saklama süresi (saniye)
+}
+
+# Onay Anında Kelime Zenginleştirme (tek LLM çağrısı)
+ENRICHMENT = {
+    "batch_size": 8,            # Tek istekte zenginleştirilen kelime sayısı
+    "tokens_per_word": 260,     # Kelime başına ayrılan yanıt token'ı
+    "blank": "______"           # Cümle tamamlama boşluğu
+}
+
+# Cümle Tamamlama Soru Havuzu (çevrimdışı üretilir)
+COMPLETION_POOL = {
+    "items_per_word": 3,        # Kelime başına hedeflenen soru sayısı
+    "batch_size": 5,            # Tek istekte soru üretilen kelime sayısı
+    "page_size": 100            # Havuz işinde sayfa başına okunan kelime
+}
+
+# Süreçler Arası Paylaşılan Önbellek (secrets.toml [cache] ile ezilebilir)
+SHARED_CACHE = {
+    "backend": "sqlite",                    # "sqlite" (dosya, süreçler arası) veya "memory" (tek süreç)
+    "path": ".cache/lingua_cache.sqlite3",  # SQLite önbellek dosyası
+    "max_entries": 5000,                    # Tutulan en fazla kayıt (LRU ile silinir)
+    "touch_interval": 60,                   # Okuma anının en sık güncellenme aralığı (saniye)
+    "busy_timeout": 5                       # Kilitli dosyada bekleme süresi (saniye)
+}
+
+# Kelime Snapshot'ı (mmap'lenen sütunlu dosya, tüm süreçlerde ortak)
+VOCABULARY_SNAPSHOT = {
+    "path": ".cache/vocabulary.snapshot",   # Dosya yoksa kelimeler Firestore'dan okunur
+    "page_size": 500,                       # Snapshot kurulurken sayfa başına okunan kelime
+    "max_age": 60 * 60,                     # Tam okumadan bu kadar sonra kullanılmaz, yeniden kurulur (saniye)
+    "retry_interval": 300                   # Başarısız yeniden kurmanın tekrar denenme aralığı (saniye)
 }
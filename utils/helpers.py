@@ -4,8 +4,10 @@ Tarih formatlama, streak hesaplama, session yönetimi
 """
 
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta, tzinfo
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 
 def format_date(date_value, format_type: str = "full") -> str:
@@ -64,31 +66,79 @@ def format_date(date_value, format_type: str = "full") -> str:
     return str(date_value)
 
 
-def calculate_streak(last_active_date: Optional[str], current_streak: int) -> tuple[int, bool]:
+@lru_cache(maxsize=64)
+def get_zone(timezone_name: Optional[str] = None) -> tzinfo:
+    """Saat dilimi adını tzinfo'ya çevir (geçersiz/boşsa varsayılan dilim)"""
+    from utils.constants import STREAK_SETTINGS
+    
+    for name in (timezone_name, STREAK_SETTINGS["default_timezone"]):
+        if not name:
+            continue
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            continue
+    return ZoneInfo("UTC")
+
+
+def to_local_date(value, tz: tzinfo) -> Optional[date]:
+    """
+    Kayıtlı aktiflik değerini verilen saat dilimindeki güne çevir
+    
+    "YYYY-MM-DD" gün string'i, ISO datetime string'i (saat dilimsizse
+    sunucu yerel saati kabul edilir), datetime veya Firestore timestamp
+    kabul edilir.
+    """
+    if value is None:
+        return None
+    
+    try:
+        if isinstance(value, str):
+            if len(value) == 10:
+                return date.fromisoformat(value)
+            value = datetime.fromisoformat(value)
+        elif hasattr(value, 'seconds'):
+            return datetime.fromtimestamp(value.seconds, tz).date()
+        
+        if isinstance(value, datetime):
+            return value.astimezone(tz).date()
+        if isinstance(value, date):
+            return value
+    except (ValueError, OverflowError, OSError):
+        return None
+    return None
+
+
+def calculate_streak(
+    last_active_date,
+    current_streak: int,
+    timezone_name: Optional[str] = None
+) -> tuple[int, bool]:
     """
     Streak hesapla ve güncelle
     
+    Gün sınırları kullanıcının saat diliminde (varsayılan Europe/Istanbul)
+    belirlenir; sunucunun saat dilimi sonucu etkilemez.
+    
+    Args:
+        last_active_date: Son aktif gün ("lastActiveDay") veya eski
+            "lastActiveDate" değeri
+        current_streak: Mevcut streak
+        timezone_name: Kullanıcının saat dilimi (IANA adı)
+    
     Returns:
         (new_streak, is_new_day): Yeni streak değeri ve bugün ilk giriş mi
     """
-    today = datetime.now().date()
+    tz = get_zone(timezone_name)
+    today = datetime.now(tz).date()
     
-    if last_active_date is None:
-        return 1, True
-    
-    try:
-        if isinstance(last_active_date, str):
-            last_date = datetime.fromisoformat(last_active_date).date()
-        elif hasattr(last_active_date, 'seconds'):
-            last_date = datetime.fromtimestamp(last_active_date.seconds).date()
-        else:
-            last_date = last_active_date
-    except:
+    last_date = to_local_date(last_active_date, tz)
+    if last_date is None:
         return 1, True
     
     diff = (today - last_date).days
     
-    if diff == 0:
+    if diff <= 0:
         # Bugün zaten giriş yapmış
         return current_streak, False
     elif diff == 1:
@@ -142,8 +192,7 @@ def init_session_state():
         "is_authenticated": False,
         "is_admin": False,
         "current_word_index": 0,
-        "quiz_questions": [],
-        "quiz_answers": [],
+        "quiz": None,
         "quiz_current": 0,
         "quiz_score": 0,
         "filter_exam_type": "all",
@@ -235,6 +284,25 @@ def sanitize_input(text: str) -> str:
     return text
 
 
+_SEARCH_TRANSLATION = str.maketrans({
+    "ç": "c", "ğ": "g", "ı": "i", "İ": "i", "ö": "o", "ş": "s", "ü": "u",
+    "Ç": "c", "Ğ": "g", "I": "i", "Ö": "o", "Ş": "s", "Ü": "u"
+})
+
+
+def normalize_search_text(text: str) -> str:
+    """
+    Metni prefix aramaları için normalize et
+    
+    Türkçe karakterler ASCII karşılıklarına çevrilir, fazla boşluklar
+    tekilleştirilir ve küçük harfe dönüştürülür.
+    """
+    if not text:
+        return ""
+    text = text.translate(_SEARCH_TRANSLATION).lower()
+    return " ".join(text.split())
+
+
 def validate_word_input(english: str, turkish: str) -> tuple[bool, str]:
     """
     Kelime girdisini doğrula
@@ -271,20 +339,9 @@ def format_number(num: int) -> str:
 
 def get_level_from_points(points: int) -> Dict[str, Any]:
     """Puana göre seviye hesapla"""
-    levels = [
-        {"level": 1, "name": "Başlangıç", "min": 0, "max": 50, "icon": "🌱"},
-        {"level": 2, "name": "Acemi", "min": 50, "max": 150, "icon": "🌿"},
-        {"level": 3, "name": "Öğrenci", "min": 150, "max": 300, "icon": "📖"},
-        {"level": 4, "name": "Çalışkan", "min": 300, "max": 500, "icon": "📚"},
-        {"level": 5, "name": "Azimli", "min": 500, "max": 800, "icon": "🎯"},
-        {"level": 6, "name": "Bilgili", "min": 800, "max": 1200, "icon": "🧠"},
-        {"level": 7, "name": "Uzman", "min": 1200, "max": 2000, "icon": "🎓"},
-        {"level": 8, "name": "Usta", "min": 2000, "max": 3500, "icon": "👨‍🏫"},
-        {"level": 9, "name": "Efsane", "min": 3500, "max": 5000, "icon": "🏆"},
-        {"level": 10, "name": "Dahi", "min": 5000, "max": float('inf'), "icon": "💎"}
-    ]
+    from utils.constants import LEVELS
     
-    for level in levels:
+    for level in LEVELS:
         if level["min"] <= points < level["max"]:
             progress = (points - level["min"]) / (level["max"] - level["min"]) * 100
             return {
@@ -293,85 +350,4 @@ def get_level_from_points(points: int) -> Dict[str, Any]:
                 "points_to_next": level["max"] - points
             }
     
-    return levels[-1]
-
-
-def create_word_card_css():
-    """Kelime kartı için CSS stilleri"""
-    return """
-    <style>
-    .word-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 16px;
-        padding: 24px;
-        color: white;
-        margin: 10px 0;
-        box-shadow: 0 10px 40px rgba(102, 126, 234, 0.3);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    .word-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 15px 50px rgba(102, 126, 234, 0.4);
-    }
-    .word-english {
-        font-size: 28px;
-        font-weight: bold;
-        margin-bottom: 8px;
-    }
-    .word-turkish {
-        font-size: 18px;
-        opacity: 0.9;
-        margin-bottom: 16px;
-    }
-    .word-meta {
-        display: flex;
-        gap: 12px;
-        flex-wrap: wrap;
-        font-size: 14px;
-        opacity: 0.8;
-    }
-    .badge {
-        background: rgba(255,255,255,0.2);
-        padding: 4px 12px;
-        border-radius: 20px;
-        display: inline-block;
-    }
-    .quiz-option {
-        background: #1a1f2e;
-        border: 2px solid #667eea;
-        border-radius: 12px;
-        padding: 16px;
-        margin: 8px 0;
-        cursor: pointer;
-        transition: all 0.3s ease;
-    }
-    .quiz-option:hover {
-        background: #667eea;
-        transform: scale(1.02);
-    }
-    .quiz-option.correct {
-        background: #27ae60;
-        border-color: #27ae60;
-    }
-    .quiz-option.wrong {
-        background: #e74c3c;
-        border-color: #e74c3c;
-    }
-    .stats-card {
-        background: linear-gradient(135deg, #1a1f2e 0%, #2d3748 100%);
-        border-radius: 12px;
-        padding: 20px;
-        text-align: center;
-    }
-    .stats-number {
-        font-size: 32px;
-        font-weight: bold;
-        color: #667eea;
-    }
-    .stats-label {
-        font-size: 14px;
-        color: #a0aec0;
-        margin-top: 4px;
-    }
-    </style>
-    """
+    return LEVELS[-1]
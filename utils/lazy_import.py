@@ -0,0 +1,64 @@
+"""
+Lingua-AI Lazy Imports
+Ağır SDK'ları (firebase_admin, groq, openai) ilk kullanımda yükle
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule:
+    """
+    İlk attribute erişiminde gerçek modülü import eden vekil nesne
+    
+    Modül seviyesinde `firestore = lazy_module("firebase_admin.firestore")`
+    şeklinde tanımlanır; `firestore.SERVER_TIMESTAMP` gibi ilk erişimde
+    import yapılır ve süresi başlangıç raporuna yazılır.
+    """
+    
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+    
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is not None:
+            return module
+        
+        with self.__dict__["_lock"]:
+            if self.__dict__["_module"] is None:
+                from utils.startup_timing import record_import
+                
+                start = time.perf_counter()
+                module = importlib.import_module(self._name)
+                record_import(self._name, time.perf_counter() - start)
+                self.__dict__["_module"] = module
+        
+        return self.__dict__["_module"]
+    
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Modülü import etmeden vekil nesne döndür"""
+    return LazyModule(name)
+
+
+def is_module_available(name: str) -> bool:
+    """Modülün kurulu olup olmadığını import etmeden kontrol et"""
+    top_level = name.split(".")[0]
+    try:
+        spec: Optional[object] = importlib.util.find_spec(top_level)
+    except (ImportError, ValueError):
+        return False
+    return spec is not None
@@ -0,0 +1,54 @@
+"""
+Lingua-AI Startup Timing
+Import süreleri ve ilk çizim (first paint) ölçümleri
+"""
+
+import threading
+import time
+from typing import Dict, Any
+
+# Süreç içinde bu modülün ilk yüklendiği an (soğuk başlangıç referansı)
+PROCESS_START = time.perf_counter()
+
+_lock = threading.Lock()
+_imports: Dict[str, float] = {}
+_first_paint: Dict[str, Dict[str, float]] = {}
+
+
+def record_import(module_name: str, seconds: float):
+    """Lazy yüklenen bir modülün import süresini kaydet"""
+    with _lock:
+        _imports[module_name] = round(seconds * 1000, 1)
+
+
+def mark_first_paint(label: str, run_started_at: float):
+    """
+    Bir ekranın süreçteki ilk çizimini kaydet
+    
+    Args:
+        label: Ekran adı (örn: "login_form")
+        run_started_at: Script çalışmasının başladığı an (perf_counter)
+    """
+    now = time.perf_counter()
+    with _lock:
+        if label in _first_paint:
+            return
+        _first_paint[label] = {
+            "since_process_start_ms": round((now - PROCESS_START) * 1000, 1),
+            "render_ms": round((now - run_started_at) * 1000, 1)
+        }
+
+
+def get_timing_report() -> Dict[str, Any]:
+    """
+    Başlangıç zamanlama raporunu döndür
+    
+    Returns:
+        Dict with uptime, imports (ms) ve first_paint ölçümleri
+    """
+    with _lock:
+        return {
+            "uptime_s": round(time.perf_counter() - PROCESS_START, 1),
+            "imports": dict(_imports),
+            "first_paint": {k: dict(v) for k, v in _first_paint.items()}
+        }
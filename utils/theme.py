@@ -0,0 +1,80 @@
+"""
+Theme Utilities
+Minified stylesheets injected at most once per script run
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import Set, Tuple
+
+import streamlit as st
+
+CSS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "css")
+
+
+def minify_css(css: str) -> str:
+    """Yorumları ve gereksiz boşlukları at"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(name: str) -> Tuple[str, str]:
+    """
+    assets/css/<name>.css dosyasını süreç başına bir kez oku
+    
+    Returns:
+        (içerik hash'i, minify edilmiş CSS)
+    """
+    with open(os.path.join(CSS_DIR, f"{name}.css"), "r", encoding="utf-8") as f:
+        css = minify_css(f.read())
+    return hashlib.sha1(css.encode("utf-8")).hexdigest()[:10], css
+
+
+def style_tag(*names: str) -> str:
+    """Stil dosyalarını tek <style> etiketinde birleştir"""
+    sheets = [(name, *load_stylesheet(name)) for name in names]
+    asset_ids = " ".join(f"{name}-{digest}" for name, digest, _ in sheets)
+    return f'<style data-assets="{asset_ids}">{"".join(css for _, _, css in sheets)}</style>'
+
+
+def start_style_run():
+    """
+    Yeni çalışmayı işaretle; önceki çalışmada gönderilen stiller tekrar gönderilir
+    
+    Her sayfanın başında check_auth tarafından çağrılır. Kendi stilini
+    gönderen fragment'lar da başta çağırmalıdır; fragment tek başına
+    yeniden çalıştığında içindeki stil elemanları da yeniden kurulur.
+    """
+    st.session_state._theme_run = st.session_state.get("_theme_run", 0) + 1
+
+
+def _injected_this_run() -> Set[str]:
+    """Bu script çalışmasında gönderilmiş stiller"""
+    run = st.session_state.get("_theme_run", 0)
+    run_marker, injected = st.session_state.get("_theme_injected", (None, None))
+    if run_marker != run:
+        injected = set()
+        st.session_state._theme_injected = (run, injected)
+    return injected
+
+
+def inject_styles(*names: str):
+    """
+    Stilleri sayfaya ekle (aynı çalışmada tekrar gönderilmez)
+    
+    Streamlit her çalışmada sayfayı yeniden kurduğundan stil her çalışmada
+    bir kez gönderilmelidir; aynı çalışmada (start_style_run çağrıları
+    arasında) sayfa ve bileşenlerin tekrar eden çağrıları yok sayılır.
+    """
+    injected = _injected_this_run()
+    pending = [name for name in names if name not in injected]
+    if not pending:
+        return
+    
+    injected.update(pending)
+    st.markdown(style_tag(*pending), unsafe_allow_html=True)